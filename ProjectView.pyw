@@ -1,9 +1,10 @@
-from ProjectView import app
+import sys
+
+from ProjectView.main import main
 
 
 if __name__ == '__main__':
-    app.mainloop()
+    sys.exit(main())
 
 # TODO: Fix app placement different after auto py to exe
 # TODO: Clean up button info settings
-# TODO: Apply settings real-time
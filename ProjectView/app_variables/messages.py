@@ -43,3 +43,31 @@ RENAME_ERROR_TEXT = "Unexpected error occurred!\n" \
 UNEXPECTED_RENAME_ERROR_TEXT = "Unexpected error occurred!\n\n" \
                         "Try again or save profile folder and " \
                         "reinstall if problem persists"
+
+IMPORT_DONE_TEXT = "Import finished!\n\n" \
+                   "Imported: {imported}\n" \
+                   "Renamed: {renamed}\n" \
+                   "Skipped: {skipped}"
+IMPORT_ERROR_TEXT = "Import failed!\n\n" \
+                    "Check:\n" \
+                    "Do you have access rights?\n" \
+                    "Is the file a .csv, .json or bookmarks .html file?"
+
+AUTOSAVE_ERROR_TEXT = "Changes could not be saved!\n\n" \
+                      "Check:\n" \
+                      "Do you have access rights?\n\n" \
+                      "Press Save to store the project"
+
+LAUNCH_ALL_DONE_TEXT = "Launch finished!\n\n" \
+                       "Opened: {opened} of {total}\n" \
+                       "Time: {seconds:.1f} s\n\n"
+LAUNCH_ALL_BUSY_TEXT = "Targets are still being opened!\n" \
+                       "Wait for the current launch to finish"
+
+CLI_PROJECT_NOT_FOUND_TEXT = "Project not found: '{project_name}'"
+CLI_ACTION_NOT_FOUND_TEXT = "Action '{action_name}' not found in project '{project_name}'"
+CLI_INVALID_ACTION_PATH_TEXT = "Invalid action: '{action_path}', use 'Project/Action'"
+CLI_OPEN_ERROR_TEXT = "Cannot open '{action_name}': {reason}"
+CLI_LAUNCH_STATS_HEADER_TEXT = "Launches  Last used         Action"
+CLI_LAUNCH_STATS_LINE_TEXT = "{count:>8}  {last_used:<16}  {action_name}"
+CLI_UNUSED_ACTIONS_TEXT = "{unused} of {total} actions not launched in the last {days} days"
@@ -1,7 +1,9 @@
 """
 Contains variables associated with application settings.
+Read them as module attributes so colors changed by
+    refresh_color_settings() are picked up by new widgets.
 """
-from ProjectView.utilities.general_utils import get_color_settings
+from ProjectView.utilities.general_utils import get_color_settings, get_user_setting
 
 
 user_setting_dict = get_color_settings()
@@ -12,3 +14,24 @@ BUTTON_COLOR_MUTED = user_setting_dict["button_color_muted"]
 BUTTON_COLOR = user_setting_dict["button_color"]
 BUTTON_COLOR_HIGHLIGHTED = user_setting_dict["button_color_highlighted"]
 TEXT_COLOR = user_setting_dict["text_color"]
+
+# Number of action rows displayed per frame, further actions are scrolled to
+VISIBLE_ACTION_ROWS = int(get_user_setting("visible_action_rows", 10))
+
+
+def refresh_color_settings():
+    """
+    Reads the color settings again and updates the color variables.
+    Called before the theme is applied to the live widgets.
+    """
+    global WINDOW_COLOR, FRAME_COLOR, BUTTON_COLOR_MUTED, BUTTON_COLOR, \
+        BUTTON_COLOR_HIGHLIGHTED, TEXT_COLOR
+
+    user_setting_dict.update(get_color_settings())
+
+    WINDOW_COLOR = user_setting_dict["window_color"]
+    FRAME_COLOR = user_setting_dict["frame_color"]
+    BUTTON_COLOR_MUTED = user_setting_dict["button_color_muted"]
+    BUTTON_COLOR = user_setting_dict["button_color"]
+    BUTTON_COLOR_HIGHLIGHTED = user_setting_dict["button_color_highlighted"]
+    TEXT_COLOR = user_setting_dict["text_color"]
@@ -1,25 +1,46 @@
 """
 Application main window.
 """
-from math import ceil
-import os
-import webbrowser
-
+import time
 from functools import partial
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
 
-from ProjectView.extra_settings_window import SettingsView
 # Utilities
-from ProjectView.utilities.app_window_utils import is_name_accepted, get_fresh_project_settings, \
-    save_current_project_settings, backup_current_project_settings, get_project_widgets_info, \
-    get_current_project_settings, rename_project_settings
+from ProjectView.utilities.app_window_utils import get_fresh_project_settings, \
+    save_current_project_settings, backup_current_project_settings, \
+    rename_project_settings, remove_project_settings, get_action_operation, \
+    store_project_operations, update_stored_project
+from ProjectView.utilities.autosave_utils import Autosaver
+from ProjectView.utilities.cli_utils import parse_command_line, ACTION_PATH_SEPARATOR
+from ProjectView.utilities.general_utils import get_user_setting
+from ProjectView.utilities.manifest_utils import set_last_active_project, \
+    flush_last_active_project
+from ProjectView.utilities.prefetch_utils import ProjectPrefetcher
+from ProjectView.utilities.project_model_utils import Project, ProjectCollection
+from ProjectView.utilities.quick_launch_utils import ActionSearchIndex
+from ProjectView.utilities.font_utils import get_font
+from ProjectView.utilities.import_utils import iter_import_entries, prepare_import
+from ProjectView.utilities.instance_utils import INSTANCE_SERVER, INSTANCE_POLL_INTERVAL
+from ProjectView.utilities.journal_utils import ChangeHistory
+from ProjectView.utilities.health_utils import TargetHealthScanner, HEALTH_BADGES, \
+    HEALTH_POLL_INTERVAL
+from ProjectView.utilities.launch_utils import submit_launch, submit_launch_all, \
+    get_launch_summary_lines, LAUNCH_POLL_INTERVAL
+from ProjectView.utilities.layout_utils import LayoutBatch, LayoutCounter
+from ProjectView.utilities.theme_utils import apply_color_settings
+from ProjectView.utilities.usage_utils import LaunchStats, ORDER_MODE_LABELS, \
+    LAUNCH_STATS_SAVE_INTERVAL, get_order_mode, set_order_mode, get_next_order_mode
+from ProjectView.utilities.watch_utils import ProjectWatcher, PROJECT_WATCH_INTERVAL
+from ProjectView.utilities.widget_pool_utils import ActionButtonPool
 # Variables
 from ProjectView.app_variables.messages import NEW_NAME_TEXT, NEW_NAME_NOT_ACCEPTED_TEXT, \
     REMOVE_PROJECT_TEXT, NEW_WEBSITE_ADDRESS_TEXT, OPEN_TARGET_ERROR_TEXT, INVALID_TARGET_TEXT, \
-    RENAME_ERROR_TEXT, UNEXPECTED_RENAME_ERROR_TEXT
-from ProjectView.app_variables.settings import FRAME_COLOR, TEXT_COLOR, BUTTON_COLOR_MUTED, \
-    BUTTON_COLOR_HIGHLIGHTED, WINDOW_COLOR, BUTTON_COLOR
+    RENAME_ERROR_TEXT, UNEXPECTED_RENAME_ERROR_TEXT, IMPORT_DONE_TEXT, IMPORT_ERROR_TEXT, \
+    LAUNCH_ALL_DONE_TEXT, LAUNCH_ALL_BUSY_TEXT, AUTOSAVE_ERROR_TEXT, CLI_PROJECT_NOT_FOUND_TEXT, \
+    CLI_ACTION_NOT_FOUND_TEXT, CLI_INVALID_ACTION_PATH_TEXT
+from ProjectView.app_variables import settings as app_settings
+from ProjectView.app_variables.settings import refresh_color_settings, VISIBLE_ACTION_ROWS
 
 # Title bar color setting
 ctk.set_appearance_mode("Dark")
@@ -31,6 +52,8 @@ class AppWindow(ctk.CTk):
     Only initial gui setup is stored here.
     All projects and their information are stored as json and
      are loaded in after each project switch.
+    Project state is kept in a ProjectCollection,
+     the window observes it and displays the current project.
     """
 
     def __init__(self):
@@ -42,11 +65,29 @@ class AppWindow(ctk.CTk):
         self.resizable(width=False,
                        height=False)
         self.toplevel_window = None
+        self.quick_launch_window = None
         self.always_on_top_text = ""
+        # Store pending changes before the window is closed
+        self.protocol("WM_DELETE_WINDOW", self.close_app)
 
         # Stores projects information
-        self.project_names = []
-        self.current_project_name = None
+        self.project_prefetcher = ProjectPrefetcher()
+        # Stores launch counts and the order mode per frame index
+        self.launch_stats = LaunchStats()
+        self.order_modes = {frame_index: get_order_mode(frame_index) for frame_index in (1, 2, 3)}
+        self.projects = ProjectCollection(
+            load_project=self.project_prefetcher.get_project_widgets_info,
+            get_order_key=self.get_order_key)
+        self.projects.add_observer(self.on_project_event)
+        self.search_index = ActionSearchIndex()
+        self.project_watcher = ProjectWatcher()
+        # Stores the action changes that can be undone per project
+        self.change_history = ChangeHistory()
+        # Writes action changes in the background once a burst of changes is over
+        self.autosaver = Autosaver(window=self,
+                                   store_operations=store_project_operations,
+                                   on_stored=self.on_changes_stored,
+                                   on_failed=self.on_changes_failed)
 
         # Stores frames information
         self.frames = []
@@ -54,12 +95,27 @@ class AppWindow(ctk.CTk):
 
         # Stores basic widgets information
         self.basic_widgets = []
+        self.frame_name_labels = {}
+
+        # Stores recycled user widgets per frame index
+        self.widget_pools = {}
+
+        # Stores visible rows ([remove_button, action_button, action]),
+        # scroll offsets and scrollbars per frame index
+        self.action_rows = {1: [], 2: [], 3: []}
+        self.scroll_offsets = {1: 0, 2: 0, 3: 0}
+        self.scrollbars = {}
+
+        # Counts row placements and finished batches of batched renders
+        self.layout_counter = LayoutCounter()
+
+        # Stores (project_name, frame_index, button_name) of targets being opened
+        self.pending_launches = set()
+        # Stores the future of the running launch all or None
+        self.launch_all_future = None
 
-        # Stores user widgets information
-        self.user_widget_names = []
-        self.application_widgets = []
-        self.directory_widgets = []
-        self.website_widgets = []
+        # Stores target health information
+        self.health_scanner = TargetHealthScanner()
 
         # Stores settings frame information
         self.settings_widgets = []
@@ -71,6 +127,20 @@ class AppWindow(ctk.CTk):
             ["Rename", 90, self.rename_project, 3, 1, 1, (3, 30), (3, 15)]
         ]
 
+    @property
+    def project_names(self):
+        """
+        :return: Project names in menu order (list str).
+        """
+        return self.projects.project_names
+
+    @property
+    def current_project_name(self):
+        """
+        :return: Name of the displayed project (str) or None.
+        """
+        return self.projects.get_current_project_name()
+
     # ------------------------------------------------------------------------ #
     # ------------------------- DEFAULT WIDGETS ------------------------------ #
     def create_frames(self):
@@ -81,12 +151,15 @@ class AppWindow(ctk.CTk):
         """
         for i, v in enumerate(self.frame_names):
             self.frames.append(ctk.CTkFrame(self,
-                                            fg_color=FRAME_COLOR))
+                                            fg_color=app_settings.FRAME_COLOR))
             self.frames[-1].grid(row=i,
                                  column=0,
                                  padx=(15, 15),
                                  pady=(15, 15 if i == len(self.frame_names) - 1 else 0),
                                  sticky="nsew")
+            # Create a widget pool for each user frame
+            if i > 0:
+                self.widget_pools[i] = ActionButtonPool(self.frames[-1])
 
     def create_settings_widgets(self):
         """
@@ -100,10 +173,10 @@ class AppWindow(ctk.CTk):
                 ctk.CTkButton(
                     self.frames[0],
                     text=widget[0],
-                    font=ctk.CTkFont(size=12),
-                    text_color=TEXT_COLOR,
-                    fg_color=BUTTON_COLOR_MUTED,
-                    hover_color=BUTTON_COLOR_HIGHLIGHTED,
+                    font=get_font(size=12),
+                    text_color=app_settings.TEXT_COLOR,
+                    fg_color=app_settings.BUTTON_COLOR_MUTED,
+                    hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
                     width=widget[1],
                     height=12,
                     command=widget[2]
@@ -123,14 +196,14 @@ class AppWindow(ctk.CTk):
             ctk.CTkOptionMenu(
                 self.frames[0],
                 values=self.project_names,
-                font=ctk.CTkFont(size=14),
-                text_color=TEXT_COLOR,
-                dropdown_text_color=TEXT_COLOR,
-                fg_color=BUTTON_COLOR_MUTED,
-                button_color=BUTTON_COLOR_MUTED,
-                button_hover_color=BUTTON_COLOR_HIGHLIGHTED,
-                dropdown_fg_color=BUTTON_COLOR_MUTED,
-                dropdown_hover_color=BUTTON_COLOR_HIGHLIGHTED,
+                font=get_font(size=14),
+                text_color=app_settings.TEXT_COLOR,
+                dropdown_text_color=app_settings.TEXT_COLOR,
+                fg_color=app_settings.BUTTON_COLOR_MUTED,
+                button_color=app_settings.BUTTON_COLOR_MUTED,
+                button_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                dropdown_fg_color=app_settings.BUTTON_COLOR_MUTED,
+                dropdown_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
                 width=190,
                 height=30,
                 command=self.change_project
@@ -156,12 +229,9 @@ class AppWindow(ctk.CTk):
                 ctk.CTkButton(
                     frame,
                     text="+",
-                    font=ctk.CTkFont(
-                        size=12,
-                        weight="bold"
-                    ),
-                    text_color=TEXT_COLOR,
-                    fg_color=BUTTON_COLOR_MUTED,
+                    font=get_font(size=12, weight="bold"),
+                    text_color=app_settings.TEXT_COLOR,
+                    fg_color=app_settings.BUTTON_COLOR_MUTED,
                     width=30,
                     height=25,
                     command=partial(self.place_new_action_button, i + 1)
@@ -179,9 +249,9 @@ class AppWindow(ctk.CTk):
             self.basic_widgets.append(
                 ctk.CTkLabel(
                     frame,
-                    text=frame_name,
-                    font=ctk.CTkFont(size=16),
-                    text_color=TEXT_COLOR,
+                    text=frame_name + ORDER_MODE_LABELS[self.order_modes[i + 1]],
+                    font=get_font(size=16),
+                    text_color=app_settings.TEXT_COLOR,
                     height=25,
                 )
             )
@@ -193,6 +263,39 @@ class AppWindow(ctk.CTk):
                 pady=(15, 10),
                 sticky="w"
             )
+            # Double click on the frame name opens every target of the frame
+            self.basic_widgets[-1].bind("<Double-Button-1>",
+                                        partial(self.launch_all, i + 1),
+                                        add="+")
+            # Right click on the frame name switches the order of its actions
+            self.basic_widgets[-1].bind("<Button-3>",
+                                        partial(self.change_order_mode, i + 1),
+                                        add="+")
+            self.frame_name_labels[i + 1] = self.basic_widgets[-1]
+
+            # Add scrollbar, placed once the frame has more actions than visible rows
+            self.scrollbars[i + 1] = ctk.CTkScrollbar(
+                frame,
+                orientation="vertical",
+                button_color=app_settings.BUTTON_COLOR_MUTED,
+                button_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                command=partial(self.on_scrollbar, i + 1)
+            )
+
+        # Scroll the user frame under the mouse
+        self.bind_all("<MouseWheel>", self.on_mouse_wheel)
+        self.bind_all("<Button-4>", self.on_mouse_wheel)
+        self.bind_all("<Button-5>", self.on_mouse_wheel)
+
+        # Open the quick launch palette
+        self.bind("<Control-p>", self.open_quick_launch_window)
+        # Open every target of the project
+        self.bind("<Control-l>", partial(self.launch_all, None))
+
+        # Undo and redo action changes
+        self.bind("<Control-z>", self.undo_change)
+        self.bind("<Control-y>", self.redo_change)
+        self.bind("<Control-Z>", self.redo_change)
 
     # ------------------------------------------------------------------------- #
     # ------------------------- SETTINGS WIDGETS ------------------------------ #
@@ -203,19 +306,54 @@ class AppWindow(ctk.CTk):
         :return: SettingsView()
         """
         if self.toplevel_window is None or not self.toplevel_window.winfo_exists():
+            # Imported on first use to keep startup light
+            from ProjectView.extra_settings_window import SettingsView
+
             # Create window if its None or destroyed
             self.toplevel_window = SettingsView(self)
-            self.toplevel_window.configure(fg_color=WINDOW_COLOR)
+            self.toplevel_window.configure(fg_color=app_settings.WINDOW_COLOR)
 
         # Focus window
         self.toplevel_window.focus()
 
+    def open_quick_launch_window(self, event=None):
+        """
+        Opens the quick launch palette, searching actions of all projects.
+        Called when the user presses Ctrl+P.
+
+        :param event: Key event (obj).
+        """
+        if self.quick_launch_window is None or not self.quick_launch_window.winfo_exists():
+            # Imported on first use
+            from ProjectView.quick_launch_window import QuickLaunchView
+
+            # Create window if its None or destroyed
+            self.quick_launch_window = QuickLaunchView(self)
+
+        # Focus search entry
+        self.quick_launch_window.focus_search_entry()
+
+    def build_search_index(self):
+        """
+        Indexes the actions of all projects on the index worker.
+        Called when the app is idle after startup.
+        """
+        self.search_index.submit_build(list(self.project_names))
+
+    def apply_theme(self):
+        """
+        Reloads the color settings and applies them to all live widgets,
+            the current project and window state are kept.
+        Called after colors are changed in the extra settings window.
+        """
+        refresh_color_settings()
+        apply_color_settings(app=self)
+
     def add_new_project(self):
         """
         Prompts user for new project name,
             adds it to the menu,
-            loads fresh project,
-            sets current project name and
+            loads fresh project and
             calls change_project().
         """
         while True:
@@ -223,7 +361,7 @@ class AppWindow(ctk.CTk):
             new_project_name = ctk.CTkInputDialog(title="New action",
                                                   text=NEW_NAME_TEXT,
                                                   ).get_input()
-            if is_name_accepted(new_name=new_project_name, name_list=self.project_names):
+            if self.projects.is_project_name_accepted(new_project_name):
                 # Name accepted
                 break
 
@@ -231,17 +369,14 @@ class AppWindow(ctk.CTk):
             messagebox.showwarning(title="Warning",
                                    message=NEW_NAME_NOT_ACCEPTED_TEXT)
 
-        # Add new name to menu
-        self.project_names.append(new_project_name)
-        self.settings_widgets[-1].configure(values=self.project_names)
-
         # Get fresh settings file and save it
         fresh_project_settings = get_fresh_project_settings()
         save_current_project_settings(project_settings=fresh_project_settings,
                                       project_name=new_project_name)
+        self.project_prefetcher.invalidate(new_project_name)
 
-        # Set new project as current project and load it
-        self.current_project_name = new_project_name
+        # Add new name to menu and load the new project
+        self.projects.add_project_name(new_project_name)
         self.change_project(new_project_name=new_project_name)
 
     def remove_project(self):
@@ -260,99 +395,222 @@ class AppWindow(ctk.CTk):
         if answer.lower() == "stop":
             return
 
-        # Make a backup of the project
-        backup_current_project_settings(project_name=self.current_project_name)
-
-        # Update project names list
-        self.project_names.remove(self.current_project_name)
+        # Make a backup of the project and remove it
+        removed_project_name = self.current_project_name
+        self.autosaver.flush(removed_project_name)
+        remove_project_settings(project_name=removed_project_name)
+        self.project_prefetcher.invalidate(removed_project_name)
+        self.change_history.clear_project(removed_project_name)
+        self.launch_stats.remove_project(removed_project_name)
+        self.search_index.remove_project(removed_project_name)
 
         # Create fresh profile if no profiles exist.
-        if len(self.project_names) == 0:
+        if len(self.project_names) == 1:
             fresh_project_settings = get_fresh_project_settings()
             save_current_project_settings(project_settings=fresh_project_settings,
                                           project_name="New Project")
-            self.project_names.append("New Project")
+            self.project_prefetcher.invalidate("New Project")
+            self.projects.add_project_name("New Project")
 
         # Update project menu
-        self.settings_widgets[-1].configure(values=self.project_names)
+        self.projects.remove_project_name(removed_project_name)
 
         # Switch project
         self.change_project(new_project_name=self.project_names[0])
 
     def change_project(self, new_project_name):
         """
-        Destroys non default widgets,
-            creates and places new project widgets,
-            sets new projects name in select menu.
+        Loads the new project into the project model,
+            the view is updated by on_project_event().
+        Sets new projects name in select menu.
 
         :param new_project_name: Current profile name in the select menu (str).
         """
-        # Destroy non default widgets
-        for button in reversed(self.application_widgets):
-            button[2].destroy()
-        for button in reversed(self.directory_widgets):
-            button[2].destroy()
-        for button in reversed(self.website_widgets):
-            button[2].destroy()
-
-        # Clear trackers
-        self.user_widget_names = []
-        self.website_widgets = []
-        self.directory_widgets = []
-        self.application_widgets = []
-
         # Set new project name
         self.settings_widgets[-1].set(new_project_name)
-        self.current_project_name = new_project_name
-
-        # Get project information
-        app_names_, app_targets_, \
-            directory_names_, directory_targets_, \
-            website_names_, website_targets_ = \
-            get_project_widgets_info(project_name=new_project_name)
-
-        # Create application buttons
-        for app_name_, app_target_ in zip(app_names_, app_targets_):
-            self.place_new_action_button(frame_index=1,
-                                         new_button_name=app_name_,
-                                         new_target=app_target_,
-                                         frame=self.frames[1],
-                                         widget_list=self.application_widgets)
-
-        # Create directory buttons
-        for dir_name_, dir_target_ in zip(directory_names_, directory_targets_):
-            self.place_new_action_button(frame_index=2,
-                                         new_button_name=dir_name_,
-                                         new_target=dir_target_,
-                                         frame=self.frames[2],
-                                         widget_list=self.directory_widgets)
-
-        # Create website buttons
-        for web_name_, web_target_ in zip(website_names_, website_targets_):
-            self.place_new_action_button(frame_index=3,
-                                         new_button_name=web_name_,
-                                         new_target=web_target_,
-                                         frame=self.frames[3],
-                                         widget_list=self.website_widgets)
+        set_last_active_project(project_name=new_project_name)
+
+        # Changes still being written would be missing from the loaded project
+        self.autosaver.flush(new_project_name)
+
+        # Load the project, prefetched if possible
+        project = self.projects.switch_project(new_project_name)
+        self.search_index.set_project(project_name=new_project_name,
+                                      widgets_info=project.get_widgets_info())
+
+        # Check targets of the new project in the background
+        self.scan_target_health()
+
+        # Load the likely next projects while the app is idle
+        self.project_prefetcher.record_use(new_project_name)
+        self.after_idle(self.prefetch_projects)
+
+    def poll_project_files(self):
+        """
+        Applies changes made to the stored projects outside the app.
+        Skipped while changes made in the app are being written.
+        Reschedules itself while the app is running.
+        """
+        if not self.autosaver.is_busy():
+            changes = self.project_watcher.check()
+            if changes is not None:
+                self.apply_project_changes(changes)
+
+        self.after(PROJECT_WATCH_INTERVAL, self.poll_project_files)
+
+    def apply_project_changes(self, changes):
+        """
+        Updates the project menu, caches and search index for projects
+            changed outside the app.
+        Only the displayed project is reloaded if it changed,
+            other projects are reindexed on the index worker.
+
+        :param changes: Result of ProjectWatcher.check() (dict).
+        """
+        for old_project_name, new_project_name in changes["renamed"]:
+            self.project_prefetcher.invalidate(old_project_name)
+            self.change_history.rename_project(old_project_name, new_project_name)
+            self.launch_stats.rename_project(old_project_name, new_project_name)
+            self.search_index.rename_project(old_project_name, new_project_name)
+            self.projects.rename_project_name(old_project_name, new_project_name)
+            if self.current_project_name == new_project_name:
+                self.settings_widgets[-1].set(new_project_name)
+                set_last_active_project(project_name=new_project_name)
+
+        for project_name in changes["added"]:
+            if project_name not in self.project_names:
+                self.projects.add_project_name(project_name)
+
+        for project_name in changes["changed"] + changes["added"]:
+            # Reindexed by the next build, changes made in the app may no longer apply
+            self.project_prefetcher.invalidate(project_name)
+            self.change_history.clear_project(project_name)
+            if project_name != self.current_project_name:
+                self.search_index.remove_project(project_name)
+
+        removed_current_project = self.current_project_name in changes["removed"]
+        for project_name in changes["removed"]:
+            self.project_prefetcher.invalidate(project_name)
+            self.change_history.clear_project(project_name)
+            self.launch_stats.remove_project(project_name)
+            self.search_index.remove_project(project_name)
+            if len(self.project_names) == 1:
+                # Create fresh profile if no profiles are left
+                save_current_project_settings(project_settings=get_fresh_project_settings(),
+                                              project_name="New Project")
+                self.projects.add_project_name("New Project")
+            self.projects.remove_project_name(project_name)
+
+        # Reload the displayed project, only changed rows are redrawn
+        if removed_current_project:
+            self.change_project(new_project_name=self.project_names[0])
+        elif self.current_project_name in changes["changed"]:
+            self.change_project(new_project_name=self.current_project_name)
+
+        self.build_search_index()
+
+    def on_project_event(self, event, frame_index=None, position=None, previous_project=None,
+                         first_positions=None):
+        """
+        Updates the view after the project model changed.
+        Only rows displaying a changed action are rebound.
+
+        :param event: 'project_switched', 'action_added', 'action_removed',
+            'actions_added', 'actions_reordered' or 'project_names_changed' (str).
+        :param frame_index: Index of the frame an action changed in (int).
+        :param position: First changed display position in the frame (int).
+        :param previous_project: Project displayed before a switch (Project) or None.
+        :param first_positions: Frame index as key and display position of
+            its first new action as value (dict int).
+        """
+        if event == "project_switched":
+            # All frames are populated before geometry is updated
+            with self.batch_layout(frame_indexes=self.action_rows, name=event):
+                for frame_index_ in self.action_rows:
+                    # Rows showing the same actions as before the switch are kept
+                    first_slot = 0
+                    if previous_project is not None and self.scroll_offsets[frame_index_] == 0:
+                        first_slot = previous_project.get_first_changed_position(
+                            self.projects.current_project, frame_index_)
+                    self.scroll_offsets[frame_index_] = 0
+                    self.render_user_widgets(frame_index=frame_index_,
+                                             first_slot=first_slot)
+
+        elif event in ("action_added", "action_removed", "actions_added", "actions_reordered"):
+            first_positions = first_positions or {frame_index: position}
+            with self.batch_layout(frame_indexes=first_positions, name=event):
+                # Frames are rendered once, from their first changed action down
+                for frame_index_, position_ in first_positions.items():
+                    slot = position_ - self.scroll_offsets[frame_index_]
+                    if slot < VISIBLE_ACTION_ROWS:
+                        self.render_user_widgets(frame_index=frame_index_,
+                                                 first_slot=max(0, slot))
+                    else:
+                        self.update_scrollbar(frame_index=frame_index_)
+
+        elif event == "project_names_changed":
+            self.settings_widgets[-1].configure(values=self.project_names)
+
+    def batch_layout(self, frame_indexes, name):
+        """
+        Returns a context manager freezing the given frames while their rows are placed,
+            geometry is updated when it exits.
+        Counts of the last batch per name are in self.layout_counter.last_batches.
+
+        :param frame_indexes: Indexes of the frames that are populated (iter int).
+        :param name: Name the counts of the batch are stored under (str).
+
+        :return: LayoutBatch()
+        """
+        return LayoutBatch(window=self,
+                           frames=[self.frames[frame_index] for frame_index in frame_indexes],
+                           counter=self.layout_counter,
+                           name=name)
+
+    def prefetch_projects(self):
+        """
+        Prefetches the projects next to the current one in the project menu and
+            the recently used projects on a worker thread.
+        Called when the app is idle after a project is loaded.
+        """
+        self.project_prefetcher.prefetch(
+            self.project_prefetcher.get_likely_projects(
+                current_project_name=self.current_project_name,
+                project_names=self.project_names
+            )
+        )
 
     def save_project(self):
         """
         Gets current profile name,
-            deletes old backup,
-            makes a new backup,
-            saves current project settings.
+            makes a new backup in the background,
+            saves current project settings atomically.
         """
+        # Pending changes would be applied again on top of the saved project
+        self.autosaver.flush(self.current_project_name)
+
         # Get current project settings
-        current_project_settings = get_current_project_settings(
-            application_buttons=self.application_widgets,
-            directory_buttons=self.directory_widgets,
-            website_buttons=self.website_widgets
-        )
+        current_project_settings = self.projects.current_project.get_settings()
 
         # Backup and save
         backup_current_project_settings(project_name=self.current_project_name)
         save_current_project_settings(project_settings=current_project_settings,
                                       project_name=self.current_project_name)
+        self.project_prefetcher.invalidate(self.current_project_name)
+        self.search_index.set_project(
+            project_name=self.current_project_name,
+            widgets_info=list(current_project_settings.values())
+        )
+
+    def close_app(self):
+        """
+        Writes pending action changes, launch statistics and
+            the last active project and closes the window.
+        """
+        self.autosaver.flush()
+        self.launch_stats.flush()
+        flush_last_active_project()
+        self.destroy()
 
     def rename_project(self):
         """
@@ -370,7 +628,7 @@ class AppWindow(ctk.CTk):
             new_project_name = ctk.CTkInputDialog(title="New action",
                                                   text=NEW_NAME_TEXT,
                                                   ).get_input()
-            if is_name_accepted(new_name=new_project_name, name_list=self.project_names):
+            if self.projects.is_project_name_accepted(new_project_name):
                 # Name accepted
                 break
 
@@ -378,9 +636,14 @@ class AppWindow(ctk.CTk):
             messagebox.showwarning(title="Warning",
                                    message=NEW_NAME_NOT_ACCEPTED_TEXT)
 
+        # Pending changes are stored under the old name and renamed with the project
+        self.autosaver.flush(current_project_name)
+
         # Rename settings file
         try_rename = rename_project_settings(old_project_name=current_project_name,
                                              new_project_name=new_project_name)
+        self.project_prefetcher.invalidate(current_project_name)
+        self.project_prefetcher.invalidate(new_project_name)
         if try_rename == "access":
             # User has no access
             messagebox.showwarning(title="Warning",
@@ -392,21 +655,82 @@ class AppWindow(ctk.CTk):
                                    message=UNEXPECTED_RENAME_ERROR_TEXT)
             return
 
-        # Find project to rename and rename it
-        for i, project in enumerate(self.project_names):
-            if project == current_project_name:
-                # noinspection PyUnboundLocalVariable
-                self.project_names[i] = new_project_name
+        self.search_index.rename_project(old_project_name=current_project_name,
+                                         new_project_name=new_project_name)
+        self.change_history.rename_project(current_project_name, new_project_name)
+        self.launch_stats.rename_project(current_project_name, new_project_name)
 
-        # Update options menu
-        self.settings_widgets[-1].configure(values=self.project_names)
-
-        # Set new project to current project
-        self.current_project_name = new_project_name
+        # Rename project in the model, this updates the options menu
+        self.projects.rename_project_name(old_project_name=current_project_name,
+                                          new_project_name=new_project_name)
 
         # Change project to reload settings
         self.change_project(new_project_name=new_project_name)
 
+    def import_actions_from_folder(self):
+        """
+        Prompts user for a folder and imports its files and sub folders.
+        Called from the extra settings window.
+        """
+        folder = filedialog.askdirectory(initialdir="/",
+                                         title="Select a Folder to import")
+        if folder:
+            self.import_actions(source=folder)
+
+    def import_actions_from_file(self):
+        """
+        Prompts user for a csv, json or exported bookmarks file and imports its entries.
+        Called from the extra settings window.
+        """
+        file_path = filedialog.askopenfilename(
+            title="Select a File to import",
+            initialdir="/",
+            filetypes=(("Import files", "*.csv *.json *.html *.htm"),
+                       ("all files", "*.*"))
+        )
+        if file_path:
+            self.import_actions(source=file_path)
+
+    def import_actions(self, source):
+        """
+        Imports all entries of a folder or file into the current project.
+        Names are validated and made unique in one batch,
+            the project is saved once and every frame is rendered once.
+
+        :param source: Folder or path to a .csv, .json or bookmarks .html file (str).
+        """
+        try:
+            accepted, renamed, skipped = prepare_import(
+                entries=iter_import_entries(source),
+                project=self.projects.current_project
+            )
+        except (OSError, ValueError):
+            messagebox.showwarning(title="Warning",
+                                   message=IMPORT_ERROR_TEXT)
+            return
+
+        if accepted:
+            # Add to the model, the view is updated once per frame
+            self.projects.add_actions(accepted)
+
+            # Backup and save once
+            self.autosaver.flush(self.current_project_name)
+            current_project_settings = self.projects.current_project.get_settings()
+            backup_current_project_settings(project_name=self.current_project_name)
+            save_current_project_settings(project_settings=current_project_settings,
+                                          project_name=self.current_project_name)
+            self.project_prefetcher.invalidate(self.current_project_name)
+            self.search_index.set_project(
+                project_name=self.current_project_name,
+                widgets_info=list(current_project_settings.values())
+            )
+            self.scan_target_health()
+
+        messagebox.showinfo(title="Import",
+                            message=IMPORT_DONE_TEXT.format(imported=len(accepted),
+                                                            renamed=renamed,
+                                                            skipped=skipped))
+
     # --------------------------------------------------------------------- #
     # ------------------------- USER WIDGETS ------------------------------ #
     def get_new_action_button_info(self, frame_index):
@@ -417,14 +741,14 @@ class AppWindow(ctk.CTk):
         :param frame_index: Number to identify the correct frame (int),
             received from basic widget button.
 
-        :returns: List containing the name, target, frame and widget list it belongs to.
+        :returns: List containing the name and target or None if the user cancelled.
         """
         while True:
             # Prompt user for a name
             new_button_name = ctk.CTkInputDialog(title="New action",
                                                  text=NEW_NAME_TEXT,
                                                  ).get_input()
-            if is_name_accepted(new_name=new_button_name, name_list=self.user_widget_names):
+            if self.projects.current_project.is_action_name_accepted(new_button_name):
                 # Name accepted
                 break
 
@@ -439,172 +763,720 @@ class AppWindow(ctk.CTk):
                                                     initialdir="/",
                                                     filetypes=(("all files", "*.*"),
                                                                ("Text files", "*.txt*")))
-            if new_target == "":
-                return None
-            frame = self.frames[1]
-            widget_list = self.application_widgets
 
         elif frame_index == 2:
             # Prompt user for a folder location
             new_target = filedialog.askdirectory(initialdir="/",
                                                  title="Select a Folder")
-            if new_target == "":
-                return None
-            frame = self.frames[2]
-            widget_list = self.directory_widgets
 
         else:
             # Prompt user for a website address
             new_target = ctk.CTkInputDialog(title="Website address",
                                             text=NEW_WEBSITE_ADDRESS_TEXT,
                                             ).get_input()
-            if new_target == "":
-                return None
-            frame = self.frames[3]
-            widget_list = self.website_widgets
 
-        return [new_button_name, new_target, frame, widget_list]
+        if not new_target:
+            return None
+
+        return [new_button_name, new_target]
 
-    def place_new_action_button(self, frame_index, new_button_name=False, new_target=False,
-                                frame=False, widget_list=False):
+    def place_new_action_button(self, frame_index, new_button_name=False, new_target=False):
         """
-        This method is used to place buttons by the app (loading) as well
+        This method is used to place buttons by the app as well
             by the user (adding new).
         If the user calls this method, self.get_new_action_button_info() is called
             to get the parameters.
         If the app calls this method, parameters are added.
-        Appends the new information to the correct widget list.
+        Adds the action to the current project, the view is updated by on_project_event().
 
         :param frame_index: Index of the requested frame (int).
 
         :param new_button_name: User provided named (str).
         :param new_target: Action bound to the button (open file, path or website)(int).
-        :param frame: Frame the button must be placed on (obj).
-        :param widget_list: List containing all the frame's buttons (list obj).
         """
-        if not any((new_button_name, new_target, frame, widget_list)):
+        if not any((new_button_name, new_target)):
             # No parameters added, prompt user
-            new_button_name, new_target, frame, widget_list = self.get_new_action_button_info(
-                frame_index)
+            new_action_info = self.get_new_action_button_info(frame_index)
 
-            if not new_target:
+            if new_action_info is None:
                 # User clicked cancel
                 messagebox.showerror(title="Invalid target!",
                                      message=INVALID_TARGET_TEXT)
-                del self.project_names[-1]
                 return
-
-        # Create remove action button
-        widget_list.append([
-            new_button_name,
-            new_target,
-            ctk.CTkButton(
-                frame,
-                text="-",
-                width=30,
-                height=25,
-                fg_color=BUTTON_COLOR_MUTED,
-                hover_color=BUTTON_COLOR_HIGHLIGHTED,
-                font=ctk.CTkFont(size=12,
-                                 weight="bold"),
-                text_color=TEXT_COLOR,
-                command=partial(self.destroy_user_widgets,
-                                new_button_name,
-                                widget_list),
-            )
-        ])
-        # Place remove action button
-        widget_list[-1][-1].grid(
-            row=ceil(len(widget_list) / 2),
-            column=0,
-            padx=(17, 10),
-            pady=(5, 10)
+            new_button_name, new_target = new_action_info
+
+        # Store the action, its buttons are bound once it is scrolled into view
+        position = self.projects.add_action(frame_index=frame_index,
+                                            name=new_button_name,
+                                            target=new_target)
+
+        # Store only this action once the burst of changes is over
+        self.autosaver.add_operation(
+            project_name=self.current_project_name,
+            operation=get_action_operation(operation="add",
+                                           frame_index=frame_index,
+                                           action_name=new_button_name,
+                                           target=new_target)
         )
+        self.search_index.add_action(project_name=self.current_project_name,
+                                     frame_index=frame_index,
+                                     name=new_button_name,
+                                     target=new_target)
+        self.change_history.record(self.current_project_name,
+                                   ("add", frame_index, position, new_button_name, new_target))
+
+    def render_user_widgets(self, frame_index, first_slot=0):
+        """
+        Binds the visible rows of a frame to the actions at its scroll offset.
+        Only rows from first_slot down are rebound,
+            rows are taken from and returned to the frame's pool when
+            the number of visible actions changes.
+
+        :param frame_index: Index of the requested frame (int).
+        :param first_slot: First visible row that must be rebound (int).
+        """
+        actions = self.projects.current_project.get_display_actions(frame_index)
+        action_rows = self.action_rows[frame_index]
+
+        # Keep the scroll offset inside the list of actions
+        offset = max(0, min(self.scroll_offsets[frame_index],
+                            len(actions) - VISIBLE_ACTION_ROWS))
+        if offset != self.scroll_offsets[frame_index]:
+            self.scroll_offsets[frame_index] = offset
+            first_slot = 0
+        visible_count = min(VISIBLE_ACTION_ROWS, len(actions) - offset)
+
+        # Return rows that are no longer needed
+        while len(action_rows) > visible_count:
+            action_row = action_rows.pop()
+            self.detach_action_row(action_row)
+            self.widget_pools[frame_index].release(remove_button=action_row[0],
+                                                   action_button=action_row[1])
+
+        for slot in range(visible_count):
+            action = actions[offset + slot]
+            if slot < min(first_slot, len(action_rows)):
+                # Row already displays this action, only the buttons are handed over
+                if action_rows[slot][2] is not action:
+                    self.attach_action_row(action_row=action_rows[slot],
+                                           action=action)
+                continue
+
+            if slot == len(action_rows):
+                # Get a row, recycled from the frame's pool if available
+                remove_button, action_button = self.widget_pools[frame_index].acquire()
+                remove_button.grid(
+                    row=slot + 1,
+                    column=0,
+                    padx=(17, 10),
+                    pady=(5, 10)
+                )
+                action_button.grid(
+                    row=slot + 1,
+                    column=1,
+                    columnspan=2,
+                    padx=(10, 15),
+                    pady=(5, 10)
+                )
+                action_rows.append([remove_button, action_button, None])
+                self.layout_counter.placements += 1
+
+            self.bind_action_row(frame_index=frame_index,
+                                 action_row=action_rows[slot],
+                                 action=action)
 
-        # Create new action button
-        widget_list.append([
-            new_button_name,
-            new_target,
-            ctk.CTkButton(frame,
-                          text=new_button_name,
-                          width=175,
-                          height=25,
-                          fg_color=BUTTON_COLOR,
-                          hover_color=BUTTON_COLOR_HIGHLIGHTED,
-                          font=ctk.CTkFont(size=14),
-                          text_color=TEXT_COLOR,
-                          command=partial(self.open_target,
-                                          frame_index,
-                                          new_button_name,
-                                          new_target))
-        ])
-        # Place remove action button
-        widget_list[-1][-1].grid(
-            row=ceil(len(widget_list) / 2),
-            column=1,
-            columnspan=2,
-            padx=(10, 15),
-            pady=(5, 10)
+        self.update_scrollbar(frame_index=frame_index)
+
+    def bind_action_row(self, frame_index, action_row, action):
+        """
+        Reconfigures a row's buttons to display an action.
+
+        :param frame_index: Index of the requested frame (int).
+        :param action_row: List containing the remove button, action button and
+            the action they display (list).
+        :param action: Action of the current project (Action).
+        """
+        remove_button, action_button = action_row[0], action_row[1]
+        is_pending = (self.current_project_name, frame_index, action.name) in \
+            self.pending_launches
+
+        # Configure remove action button
+        remove_button.configure(command=partial(self.destroy_user_widgets,
+                                                frame_index,
+                                                action.name))
+
+        # Configure action button
+        action_button.configure(text=self.get_action_button_text(frame_index,
+                                                                 action.name,
+                                                                 action.target),
+                                state="disabled" if is_pending else "normal",
+                                fg_color=app_settings.BUTTON_COLOR_MUTED if is_pending
+                                else app_settings.BUTTON_COLOR,
+                                command=partial(self.open_target,
+                                                frame_index,
+                                                action.name,
+                                                action.target))
+        self.attach_action_row(action_row=action_row,
+                               action=action)
+
+    def attach_action_row(self, action_row, action):
+        """
+        Hands a row's buttons to the action it displays.
+
+        :param action_row: List containing the remove button, action button and
+            the action they display (list).
+        :param action: Action of the current project (Action).
+        """
+        self.detach_action_row(action_row)
+        action.remove_button, action.action_button = action_row[0], action_row[1]
+        action_row[2] = action
+
+    @staticmethod
+    def detach_action_row(action_row):
+        """
+        Takes a row's buttons away from the action it displays.
+
+        :param action_row: List containing the remove button, action button and
+            the action they display (list).
+        """
+        action = action_row[2]
+        # Action could be displayed by another row already
+        if action is not None and action.action_button is action_row[1]:
+            action.remove_button, action.action_button = None, None
+        action_row[2] = None
+
+    def update_scrollbar(self, frame_index):
+        """
+        Shows and positions a frame's scrollbar if it has more actions than
+            visible rows, hides it otherwise.
+
+        :param frame_index: Index of the requested frame (int).
+        """
+        scrollbar = self.scrollbars[frame_index]
+        action_count = len(self.projects.current_project.actions[frame_index])
+        if action_count <= VISIBLE_ACTION_ROWS:
+            scrollbar.grid_remove()
+            return
+
+        offset = self.scroll_offsets[frame_index]
+        scrollbar.set(offset / action_count, (offset + VISIBLE_ACTION_ROWS) / action_count)
+        scrollbar.grid(
+            row=1,
+            column=3,
+            rowspan=VISIBLE_ACTION_ROWS,
+            padx=(0, 5),
+            pady=(5, 10),
+            sticky="ns"
         )
 
-        # Update user widget name list
-        self.user_widget_names.append(new_button_name)
+    def scroll_user_widgets(self, frame_index, offset):
+        """
+        Scrolls a frame to show the actions from offset down.
+
+        :param frame_index: Index of the requested frame (int).
+        :param offset: Index of the first visible action (int).
+        """
+        action_count = len(self.projects.current_project.actions[frame_index])
+        offset = max(0, min(offset, action_count - VISIBLE_ACTION_ROWS))
+        if offset == self.scroll_offsets[frame_index]:
+            return
+
+        self.scroll_offsets[frame_index] = offset
+        self.render_user_widgets(frame_index=frame_index)
+
+    def on_scrollbar(self, frame_index, *args):
+        """
+        Handles scrollbar dragging and arrow clicks.
 
-    def destroy_user_widgets(self, button_name, widget_list):
+        :param frame_index: Index of the requested frame (int).
+        :param args: ('moveto', fraction) or ('scroll', steps, 'units' or 'pages').
+        """
+        action_count = len(self.projects.current_project.actions[frame_index])
+        if args[0] == "moveto":
+            offset = round(float(args[1]) * action_count)
+        else:
+            step = int(args[1]) * (VISIBLE_ACTION_ROWS if args[2] == "pages" else 1)
+            offset = self.scroll_offsets[frame_index] + step
+
+        self.scroll_user_widgets(frame_index=frame_index,
+                                 offset=offset)
+
+    def on_mouse_wheel(self, event):
+        """
+        Scrolls the user frame under the mouse one row per wheel step.
+
+        :param event: Tk mouse wheel event (obj).
         """
-        Destroys user button that is passed on.
+        try:
+            widget = self.winfo_containing(event.x_root, event.y_root)
+        except KeyError:
+            return
 
+        # Walk up to the user frame the widget is in
+        while widget is not None:
+            for frame_index, frame in enumerate(self.frames[1:], start=1):
+                if widget is frame:
+                    step = -1 if event.num == 4 or event.delta > 0 else 1
+                    self.scroll_user_widgets(frame_index=frame_index,
+                                             offset=self.scroll_offsets[frame_index] + step)
+                    return
+            widget = widget.master
+
+    def destroy_user_widgets(self, frame_index, button_name):
+        """
+        Removes the user action that is passed on from the current project and
+            from the stored project.
+        The view rebinds the visible rows from the removed one down.
+
+        :param frame_index: Index of the frame the buttons are in (int).
         :param button_name: Name of the button (str).
-        :param widget_list: List of widgets the widget is in.
         """
-        self.user_widget_names.remove(button_name)
-        for widget in reversed(widget_list):
-            if widget[0] == button_name:
-                widget[2].destroy()
-                widget_list.remove(widget)
+        # Keep position and target, the removal can be undone
+        position = self.projects.current_project.get_action_position(frame_index, button_name)
+        if position is None:
+            return
+        target = self.projects.current_project.actions[frame_index][position].target
+        self.projects.remove_action(frame_index=frame_index,
+                                    name=button_name)
+
+        # Remove only this action once the burst of changes is over
+        self.autosaver.add_operation(
+            project_name=self.current_project_name,
+            operation=get_action_operation(operation="remove",
+                                           frame_index=frame_index,
+                                           action_name=button_name)
+        )
+        self.search_index.remove_action(project_name=self.current_project_name,
+                                        frame_index=frame_index,
+                                        name=button_name)
+        self.change_history.record(self.current_project_name,
+                                   ("remove", frame_index, position, button_name, target))
+        self.launch_stats.forget_action(self.current_project_name, button_name)
+
+    def undo_change(self, event=None):
+        """
+        Reverts the last action change of the current project.
 
-        self.save_project()
-        self.change_project(self.current_project_name)
+        :param event: Event if called from a binding (obj).
+        """
+        change = self.change_history.undo(self.current_project_name)
+        if change is not None:
+            self.apply_change(change)
 
-    @staticmethod
-    def open_target(frame_index, button_name, location):
+    def redo_change(self, event=None):
+        """
+        Applies the last undone action change of the current project again.
+
+        :param event: Event if called from a binding (obj).
+        """
+        change = self.change_history.redo(self.current_project_name)
+        if change is not None:
+            self.apply_change(change)
+
+    def apply_change(self, change):
+        """
+        Applies an undone or redone change to the current and the stored project.
+        Skipped if the project no longer allows it.
+
+        :param change: ('add' or 'remove', frame_index, position, name, target) (tuple).
+        """
+        operation, frame_index, position, name, target = change
+        project = self.projects.current_project
+
+        if operation == "add":
+            if name in project.action_names:
+                return
+            self.projects.add_action(frame_index=frame_index,
+                                     name=name,
+                                     target=target,
+                                     position=position)
+            self.autosaver.add_operation(
+                project_name=project.name,
+                operation=get_action_operation(operation="add",
+                                               frame_index=frame_index,
+                                               action_name=name,
+                                               target=target,
+                                               position=position)
+            )
+            self.search_index.add_action(project_name=project.name,
+                                         frame_index=frame_index,
+                                         name=name,
+                                         target=target)
+
+        else:
+            if not self.projects.remove_action(frame_index=frame_index,
+                                               name=name):
+                return
+            self.autosaver.add_operation(
+                project_name=project.name,
+                operation=get_action_operation(operation="remove",
+                                               frame_index=frame_index,
+                                               action_name=name)
+            )
+            self.search_index.remove_action(project_name=project.name,
+                                            frame_index=frame_index,
+                                            name=name)
+
+    def on_changes_stored(self, project_name, operations):
+        """
+        Updates the manifest and the prefetched projects after
+            the autosaver wrote a batch of changes.
+
+        :param project_name: Name of the project (str).
+        :param operations: Operations that were written (list dict).
+        """
+        action_delta = sum(1 if operation["op"] == "add" else -1 for operation in operations)
+        update_stored_project(project_name=project_name,
+                              action_delta=action_delta)
+        self.project_prefetcher.invalidate(project_name)
+
+    def on_changes_failed(self, project_name, operations):
+        """
+        Warns the user that a batch of changes was not written,
+            the changes are still in the project model and stored by Save.
+
+        :param project_name: Name of the project (str).
+        :param operations: Operations that were not written (list dict).
+        """
+        messagebox.showwarning(title="Warning",
+                               message=AUTOSAVE_ERROR_TEXT)
+
+    def get_project(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: The current project if it has that name, else the stored project (Project) or
+            None if there is no such project.
+        """
+        if project_name == self.current_project_name:
+            return self.projects.current_project
+        if project_name not in self.project_names:
+            return None
+
+        # Changes still being written would be missing from the loaded project
+        self.autosaver.flush(project_name)
+
+        return Project.from_widgets_info(
+            project_name, self.project_prefetcher.get_project_widgets_info(project_name))
+
+    def get_action_button(self, frame_index, button_name):
+        """
+        Returns the action button of an action of the current project or
+            None if the action is not displayed.
+
+        :param frame_index: Index of the requested frame (int).
+        :param button_name: Name of the action (str).
+
+        :return: Action button (obj) or None.
+        """
+        action = self.projects.current_project.get_action(frame_index, button_name)
+
+        return action.action_button if action is not None else None
+
+    def get_action_button_text(self, frame_index, button_name, location):
+        """
+        Returns the action button text,
+            the name followed by a badge if the target was found unhealthy.
+
+        :param frame_index: Index of the requested frame (int).
+        :param button_name: Name of the action (str).
+        :param location: Target of the file, directory or website (str).
+
+        :return: Text for the action button (str).
+        """
+        status = self.health_scanner.get_status(frame_index, location)
+
+        return button_name + HEALTH_BADGES.get(status, "")
+
+    def scan_target_health(self):
+        """
+        Sends the file and directory targets of the current project to
+            the health scanner and waits for the result.
+        Other projects are scanned as well if the 'scan_all_projects' setting is 'True'.
+        Rate limited scans only refresh the badges from the cache.
+        Called after a project is loaded.
+        """
+        targets = [(frame_index, action.target) for frame_index in (1, 2)
+                   for action in self.projects.current_project.actions[frame_index]]
+        other_project_names = [project_name for project_name in self.project_names
+                               if project_name != self.current_project_name] \
+            if get_user_setting(setting="scan_all_projects") == "True" else []
+
+        future = self.health_scanner.submit_scan(project_name=self.current_project_name,
+                                                 targets=targets,
+                                                 other_project_names=other_project_names)
+        if future is None:
+            self.apply_target_health()
+            return
+
+        self.after(HEALTH_POLL_INTERVAL, self.finish_target_health_scan, future)
+
+    def finish_target_health_scan(self, future):
+        """
+        Checks if a health scan is finished and applies the badges.
+        Reschedules itself until the scan is finished.
+
+        :param future: Future returned by submit_scan() (obj).
+        """
+        if not future.done():
+            self.after(HEALTH_POLL_INTERVAL, self.finish_target_health_scan, future)
+            return
+
+        self.apply_target_health()
+
+    def apply_target_health(self):
+        """
+        Updates the visible action button texts of the current project with
+            the cached target health badges.
+        """
+        for frame_index in (1, 2):
+            self.render_user_widgets(frame_index=frame_index)
+
+    def open_target(self, frame_index, button_name, location, project_name=None):
         """
-        Opens target of the user widget connected to it.
+        Opens target of the user widget connected to it on a launch worker.
         This can be opening a file, path or website.
-        In case of an error, appropriate message is displayed.
+        The button shows a pending state until the launch is finished.
 
         :param frame_index: Index of the requested frame (int).
         :param button_name: Name of the pressed button (str).
         :param location: Target of the file, directory or website (str).
+        :param project_name: Project the action belongs to, the current one if None (str).
+        """
+        project_name = project_name or self.current_project_name
+
+        # Show pending state, only the current project has buttons
+        self.pending_launches.add((project_name, frame_index, button_name))
+        action_button = self.get_action_button(frame_index, button_name)
+        if action_button is not None and project_name == self.current_project_name:
+            action_button.configure(state="disabled",
+                                    fg_color=app_settings.BUTTON_COLOR_MUTED)
+
+        # Open target off the main thread and wait for the result
+        future = submit_launch(frame_index=frame_index,
+                               location=location)
+        self.after(LAUNCH_POLL_INTERVAL, self.finish_open_target,
+                   future, frame_index, button_name, location, project_name)
+
+    def finish_open_target(self, future, frame_index, button_name, location, project_name):
+        """
+        Checks if a launch is finished,
+            restores the button,
+            counts the launch if the target was opened and
+            displays an error message if it could not be opened.
+        Reschedules itself until the launch is finished.
 
-        :return: Error message or the target.
+        :param future: Future returned by submit_launch() (obj).
+        :param frame_index: Index of the requested frame (int).
+        :param button_name: Name of the pressed button (str).
+        :param location: Target of the file, directory or website (str).
+        :param project_name: Project the action belongs to (str).
         """
-        # Check if user wants to open a file
-        if frame_index == 1:
-            # Check if it's an actual file and user has access
-            if not os.path.isfile(location) or not os.access(location, os.R_OK):
-                # Cannot open file
-                messagebox.showerror(title="Error",
-                                     message=f"{OPEN_TARGET_ERROR_TEXT} '{button_name}'")
-            # Open file
-            os.startfile(location)
-
-        # Check if user wants to open a directory
-        elif frame_index == 2:
-            # Check if it's an actual directory
-            if not os.path.exists(location):
-                # directory not found
-                messagebox.showerror(title="Error",
-                                     message=f"{OPEN_TARGET_ERROR_TEXT} '{location}'")
-            # Open directory
-            os.startfile(location)
-
-        # User wants to open a website
+        if not future.done():
+            self.after(LAUNCH_POLL_INTERVAL, self.finish_open_target,
+                       future, frame_index, button_name, location, project_name)
+            return
+
+        # Restore button unless another launch of it is still running,
+        # project could have been switched or renamed in the meantime
+        self.pending_launches.discard((project_name, frame_index, button_name))
+        action_button = self.get_action_button(frame_index, button_name)
+        if action_button is not None and \
+                (self.current_project_name, frame_index, button_name) not in self.pending_launches:
+            action_button.configure(state="normal",
+                                    fg_color=app_settings.BUTTON_COLOR)
+
+        # Display error, failed launches are not counted
+        if future.result() is not True:
+            messagebox.showerror(title="Error",
+                                 message=f"{OPEN_TARGET_ERROR_TEXT} "
+                                         f"'{button_name if frame_index == 1 else location}'")
+            return
+
+        # Count the launch, an ordered frame only moves this action
+        self.launch_stats.record_launch(project_name, button_name)
+        if project_name == self.current_project_name:
+            self.projects.move_display_action(frame_index=frame_index,
+                                              name=button_name)
+
+    def get_order_key(self, project_name, frame_index):
+        """
+        :param project_name: Name of a project (str).
+        :param frame_index: Index of a user frame (int).
+
+        :return: Sort key of the frame's order mode (func) or
+            None if actions are shown in the order they were added.
+        """
+        return self.launch_stats.get_order_key(project_name, self.order_modes[frame_index])
+
+    def change_order_mode(self, frame_index, event=None):
+        """
+        Switches a frame to the next order mode and saves it.
+
+        :param frame_index: Index of the frame (int).
+        :param event: Event if called from a binding (obj).
+        """
+        order_mode = get_next_order_mode(self.order_modes[frame_index])
+        set_order_mode(frame_index=frame_index,
+                       order_mode=order_mode)
+        self.apply_order_mode(frame_index=frame_index,
+                              order_mode=order_mode)
+
+    def apply_order_mode(self, frame_index, order_mode):
+        """
+        Sorts a frame of the current project by an order mode,
+            the order mode is shown behind the frame name.
+
+        :param frame_index: Index of the frame (int).
+        :param order_mode: One of ORDER_MODES (str).
+        """
+        self.order_modes[frame_index] = order_mode
+        self.frame_name_labels[frame_index].configure(
+            text=self.frame_names[frame_index] + ORDER_MODE_LABELS[order_mode])
+        self.projects.set_display_order(frame_index=frame_index)
+
+    def save_launch_stats(self):
+        """
+        Writes the launch statistics if they changed.
+        Reschedules itself while the app is running.
+        """
+        self.launch_stats.write()
+
+        self.after(LAUNCH_STATS_SAVE_INTERVAL, self.save_launch_stats)
+
+    def launch_all(self, frame_index=None, event=None, project_name=None):
+        """
+        Opens every target of the project, or of a single frame,
+            on the launch workers.
+        Applications are opened first, then paths and then websites.
+        A single summary is displayed once all targets are opened.
+
+        :param frame_index: Index of the frame to open or None for all frames (int).
+        :param event: Event if called from a binding (obj).
+        :param project_name: Project to open, the current one if None (str).
+        """
+        if self.launch_all_future is not None and not self.launch_all_future.done():
+            messagebox.showinfo(title="Launch",
+                                message=LAUNCH_ALL_BUSY_TEXT)
+            return
+
+        project = self.get_project(project_name or self.current_project_name)
+        if project is None:
+            messagebox.showerror(title="Error",
+                                 message=CLI_PROJECT_NOT_FOUND_TEXT.format(
+                                     project_name=project_name))
+            return
+
+        # Collect targets of the requested frames
+        actions = project.actions
+        targets = [(frame_index_, action.name, action.target)
+                   for frame_index_ in ((frame_index,) if frame_index else actions)
+                   for action in actions[frame_index_]]
+        if not targets:
+            return
+
+        # Open targets off the main thread and wait for the results
+        self.launch_all_future = submit_launch_all(targets=targets)
+        self.after(LAUNCH_POLL_INTERVAL, self.finish_launch_all,
+                   self.launch_all_future, time.perf_counter())
+
+    def finish_launch_all(self, future, start):
+        """
+        Checks if a launch all is finished and
+            displays the latency of the targets and the ones that failed.
+        Reschedules itself until the launch all is finished.
+
+        :param future: Future returned by submit_launch_all() (obj).
+        :param start: time.perf_counter() when the launch all started (float).
+        """
+        if not future.done():
+            self.after(LAUNCH_POLL_INTERVAL, self.finish_launch_all, future, start)
+            return
+
+        results = future.result()
+        opened = sum(1 for result in results if result[3] is True)
+        message = LAUNCH_ALL_DONE_TEXT.format(opened=opened,
+                                              total=len(results),
+                                              seconds=time.perf_counter() - start)
+        message += "\n".join(get_launch_summary_lines(results))
+
+        # Display summary
+        if opened == len(results):
+            messagebox.showinfo(title="Launch",
+                                message=message)
         else:
-            # Try to open the website
-            try:
-                webbrowser.open(location)
-            # website cannot be opened, show error
-            except webbrowser.Error:
-                messagebox.showerror(title="Error",
-                                     message=f"{OPEN_TARGET_ERROR_TEXT} '{location}'")
+            messagebox.showwarning(title="Launch",
+                                   message=message)
+
+    # ------------------------------------------------------------------------ #
+    # ------------------------- SINGLE INSTANCE ------------------------------ #
+    def poll_instance_server(self):
+        """
+        Handles the arguments later instances of the app handed over.
+        Reschedules itself while the app is running.
+        """
+        for args in INSTANCE_SERVER.get_forwarded_args():
+            self.handle_forwarded_args(args)
+
+        self.after(INSTANCE_POLL_INTERVAL, self.poll_instance_server)
+
+    def handle_forwarded_args(self, args):
+        """
+        Runs the launch command of a later instance of the app in this window,
+            so the pending state and launch statistics apply to it.
+        Brings the window to the front if no command was given.
+
+        :param args: Command line arguments of the later instance (list str).
+        """
+        try:
+            arguments = parse_command_line(args)
+        except SystemExit:
+            # Invalid arguments, the later instance checks them before forwarding
+            return
+
+        if arguments is None:
+            self.bring_to_front()
+        elif arguments.open is not None:
+            self.open_action_path(arguments.open)
+        elif arguments.launch_project is not None:
+            self.launch_all(project_name=arguments.launch_project)
+
+    def open_action_path(self, action_path):
+        """
+        Opens the target of an action of any project.
+
+        :param action_path: Project and action name, e.g. 'Project/Action' (str).
+        """
+        project_name, separator, action_name = action_path.partition(ACTION_PATH_SEPARATOR)
+        if not separator or not project_name or not action_name:
+            messagebox.showerror(title="Error",
+                                 message=CLI_INVALID_ACTION_PATH_TEXT.format(
+                                     action_path=action_path))
+            return
+
+        project = self.get_project(project_name)
+        found = project.find_action(action_name) if project is not None else None
+        if found is None:
+            messagebox.showerror(title="Error",
+                                 message=CLI_ACTION_NOT_FOUND_TEXT.format(
+                                     action_name=action_name,
+                                     project_name=project_name))
+            return
+
+        frame_index, action = found
+        self.open_target(frame_index=frame_index,
+                         button_name=action.name,
+                         location=action.target,
+                         project_name=project_name)
+
+    def bring_to_front(self):
+        """
+        Restores the window if minimized and raises it above other windows.
+        """
+        self.deiconify()
+        self.lift()
+        # Windows only raises a window of a background process while it is topmost
+        self.attributes("-topmost", True)
+        self.after_idle(self.attributes, "-topmost",
+                        get_user_setting(setting="always_on_top") == "True")
+        self.focus_force()
@@ -9,11 +9,12 @@ import customtkinter as ctk
 # Utilities
 from ProjectView.utilities.extra_settings_window_utils import get_color_palette, is_valid_hex_color,\
     restore_settings_file
-from ProjectView.utilities.general_utils import set_user_settings, restart_program, get_user_setting
+from ProjectView.utilities.font_utils import get_font
+from ProjectView.utilities.general_utils import set_user_settings, get_user_setting
+from ProjectView.utilities.usage_utils import get_order_mode
 # Variables
 from ProjectView.app_variables.messages import CHANGE_COLOR_TEXT, RESET_SETTINGS_TEXT
-from ProjectView.app_variables.settings import WINDOW_COLOR, BUTTON_COLOR_MUTED, \
-    BUTTON_COLOR_HIGHLIGHTED, TEXT_COLOR
+from ProjectView.app_variables import settings as app_settings
 
 APPLICATION_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 APP_SETTINGS_FOLDER = os.path.join(APPLICATION_DIR, "ProjectView\\app_settings")
@@ -23,7 +24,7 @@ APP_SETTINGS_BACKUP_FOLDER = os.path.join(APPLICATION_DIR, "ProjectView\\app_set
 class SettingsView(ctk.CTkToplevel):
     """
     Class used for displaying the extra settings window.
-    After user input the app restarts to load the new settings.
+    After user input the new settings are applied to the live app.
     """
 
     def __init__(self, app, *args, **kwargs):
@@ -33,8 +34,9 @@ class SettingsView(ctk.CTkToplevel):
         self.attributes('-topmost', True)
         self.resizable(width=False,
                        height=False)
-        self.configure(fg_color=WINDOW_COLOR)
+        self.configure(fg_color=app_settings.WINDOW_COLOR)
 
+        self.app = app
         self.frame_names = app.frame_names
 
         # Stores general settings information
@@ -44,6 +46,9 @@ class SettingsView(ctk.CTkToplevel):
             ["Change backgrounds colors", self.change_background_colors],
             ["Change widgets colors", self.change_widget_colors],
             ["Change text color", self.change_text_color],
+            ["Import actions from folder", app.import_actions_from_folder],
+            ["Import actions from file", app.import_actions_from_file],
+            ["Launch all actions", app.launch_all],
             ["Reset to default", self.reset_settings],
         ]
 
@@ -74,10 +79,10 @@ class SettingsView(ctk.CTkToplevel):
                     text=setting[0],
                     width=200,
                     height=12,
-                    font=ctk.CTkFont(size=12),
-                    fg_color=BUTTON_COLOR_MUTED,
-                    hover_color=BUTTON_COLOR_HIGHLIGHTED,
-                    text_color=TEXT_COLOR,
+                    font=get_font(size=12),
+                    fg_color=app_settings.BUTTON_COLOR_MUTED,
+                    hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                    text_color=app_settings.TEXT_COLOR,
                     command=setting[1],
                 )
             )
@@ -105,8 +110,8 @@ class SettingsView(ctk.CTkToplevel):
             ctk.CTkLabel(
                 self,
                 text="Organize app frames",
-                font=ctk.CTkFont(size=12),
-                text_color=TEXT_COLOR,
+                font=get_font(size=12),
+                text_color=app_settings.TEXT_COLOR,
             )
         )
         # Place label
@@ -124,14 +129,14 @@ class SettingsView(ctk.CTkToplevel):
             ctk.CTkOptionMenu(
                 self,
                 values=self.frame_names[1:],
-                font=ctk.CTkFont(size=14),
-                text_color=TEXT_COLOR,
-                dropdown_text_color=TEXT_COLOR,
-                fg_color=BUTTON_COLOR_MUTED,
-                button_color=BUTTON_COLOR_MUTED,
-                button_hover_color=BUTTON_COLOR_HIGHLIGHTED,
-                dropdown_fg_color=BUTTON_COLOR_MUTED,
-                dropdown_hover_color=BUTTON_COLOR_HIGHLIGHTED,
+                font=get_font(size=14),
+                text_color=app_settings.TEXT_COLOR,
+                dropdown_text_color=app_settings.TEXT_COLOR,
+                fg_color=app_settings.BUTTON_COLOR_MUTED,
+                button_color=app_settings.BUTTON_COLOR_MUTED,
+                button_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                dropdown_fg_color=app_settings.BUTTON_COLOR_MUTED,
+                dropdown_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
                 width=200,
                 height=30,
                 state="disabled",
@@ -155,10 +160,10 @@ class SettingsView(ctk.CTkToplevel):
                     text=text,
                     width=55,
                     height=12,
-                    font=ctk.CTkFont(size=12),
-                    fg_color=BUTTON_COLOR_MUTED,
-                    hover_color=BUTTON_COLOR_HIGHLIGHTED,
-                    text_color=TEXT_COLOR,
+                    font=get_font(size=12),
+                    fg_color=app_settings.BUTTON_COLOR_MUTED,
+                    hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                    text_color=app_settings.TEXT_COLOR,
                     command=command,
                     state="disabled",
                 )
@@ -196,14 +201,13 @@ class SettingsView(ctk.CTkToplevel):
 
     # ------------------------------------------------------------------------- #
     # ------------------------- COLOR WIDGETS ------------------------------ #
-    @staticmethod
-    def change_background_colors():
+    def change_background_colors(self):
         """
         Prompts the user for a hex color code,
             calls get_color_palette() to get a lighter tint of the same color,
             sets the window color to the prompted color and
             sets the frame color to the lighter tint.
-        Calls self.restart_program() to restart and apply settings.
+        Calls app.apply_theme() to apply settings.
         """
         while True:
             # Prompt user for a hex color
@@ -220,18 +224,17 @@ class SettingsView(ctk.CTkToplevel):
         set_user_settings(settings=["window_color", "frame_color"],
                           values=[new_window_color, lighter_frame_color])
 
-        # Start a new instance of the app to load new colors
-        restart_program()
+        # Apply new colors to the live app
+        self.app.apply_theme()
 
-    @staticmethod
-    def change_widget_colors():
+    def change_widget_colors(self):
         """
         Prompts the user for a hex color code,
             calls get_color_palette() to get a lighter and darker tint of the same color,
             sets button color muted color to the darker tint,
             sets button color to the prompted color and
             sets the button color highlighted color to the lighter tint.
-        Calls self.restart_program() to restart and apply settings.
+        Calls app.apply_theme() to apply settings.
         """
         while True:
             # Prompt user for a hex color
@@ -248,17 +251,16 @@ class SettingsView(ctk.CTkToplevel):
 
         # Sve settings
         set_user_settings(settings=["button_color_muted", "button_color", "button_color_highlighted"],
-                          values=[darker_widget_color, new_widget_color, lighter_widget_color])
+                          values=[darker_widget_color, widget_color, lighter_widget_color])
 
-        # Start a new instance of the app to load new colors
-        restart_program()
+        # Apply new colors to the live app
+        self.app.apply_theme()
 
-    @staticmethod
-    def change_text_color():
+    def change_text_color(self):
         """
         Prompts the user for a hex color code and
             sets it as the text color.
-        Calls self.restart_program() to restart and apply settings.
+        Calls app.apply_theme() to apply settings.
         """
         while True:
             # Prompt user for a hex color
@@ -272,15 +274,14 @@ class SettingsView(ctk.CTkToplevel):
         set_user_settings(settings=["text_color"],
                           values=[new_text_color])
 
-        # Start a new instance of the app to load new color
-        restart_program()
+        # Apply new color to the live app
+        self.app.apply_theme()
 
-    @staticmethod
-    def reset_settings():
+    def reset_settings(self):
         """
         Prompts the user if tey are sure.
         All settings in the extra settings window will be reset to
-            their defaults.
+            their defaults and applied to the live app.
         """
         # Ask if user is sure
         answer = ctk.CTkInputDialog(text=RESET_SETTINGS_TEXT,
@@ -293,6 +294,20 @@ class SettingsView(ctk.CTkToplevel):
         restore_settings_file(file_path=APP_SETTINGS_FOLDER,
                               backup_path=APP_SETTINGS_BACKUP_FOLDER)
 
+        # Apply restored always on top setting
+        self.app.always_on_top_text = get_user_setting("always_on_top_text")
+        self.app.attributes('-topmost', get_user_setting("always_on_top") == "True")
+        self.general_settings_widgets[0].configure(text=self.app.always_on_top_text)
+
+        # Apply restored order modes
+        for frame_index, order_mode in self.app.order_modes.items():
+            if get_order_mode(frame_index) != order_mode:
+                self.app.apply_order_mode(frame_index=frame_index,
+                                          order_mode=get_order_mode(frame_index))
+
+        # Apply restored colors to the live app
+        self.app.apply_theme()
+
     # ----------------------------------------------------------------------- #
     # ------------------------- FRAME SETTINGS ------------------------------ #
     def rename_frame(self):
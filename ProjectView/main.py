@@ -0,0 +1,113 @@
+"""
+Entry point of the app.
+Runs a command line command, hands over to a running instance or
+    initializes the Application Window by loading the default widgets.
+If a profile is found, settings will be applied.
+"""
+import sys
+
+# Utilities
+from ProjectView.utilities.cli_utils import parse_command_line, run_command, \
+    is_forwarded_command
+
+
+def create_app():
+    """
+    Builds the app window and loads the last active project.
+
+    :return: AppWindow()
+    """
+    # Imported here, commands and later instances never build a window
+    from ProjectView.utilities.app_window_utils import get_project_manifest, \
+        get_fresh_project_settings, save_current_project_settings
+    from ProjectView.utilities.general_utils import get_user_setting
+    from ProjectView.utilities.instance_utils import INSTANCE_POLL_INTERVAL
+    from ProjectView.utilities.usage_utils import LAUNCH_STATS_SAVE_INTERVAL
+    from ProjectView.utilities.watch_utils import PROJECT_WATCH_INTERVAL
+    from ProjectView.app_variables import settings as app_settings
+    from ProjectView.app_window import AppWindow
+
+    app = AppWindow()
+
+    # Set project names and the project to open from the manifest
+    project_manifest = get_project_manifest()
+    if project_manifest["projects"]:
+        # Projects found, open the last active one
+        app.projects.project_names = list(project_manifest["projects"])
+        first_project_name = project_manifest["last_active"] or app.project_names[0]
+    else:
+        # No projects present, create new one
+        app.projects.project_names = ["New Project"]
+        first_project_name = "New Project"
+        # Create and save new profile
+        new_project_settings = get_fresh_project_settings()
+        save_current_project_settings(project_settings=new_project_settings,
+                                      project_name=first_project_name)
+
+    # Create default frames
+    app.create_frames()
+
+    # Create default settings widgets
+    app.create_settings_widgets()
+
+    # Create default basic widgets
+    app.create_basic_widgets()
+
+    # Load the project and display its widgets,
+    # checks its targets and prefetches the likely next projects
+    app.change_project(new_project_name=first_project_name)
+
+    # Index the actions of all projects for the quick launch palette
+    app.after_idle(app.build_search_index)
+
+    # Check for arguments of later instances
+    app.after(INSTANCE_POLL_INTERVAL, app.poll_instance_server)
+
+    # Check for projects changed outside the app
+    app.after(PROJECT_WATCH_INTERVAL, app.poll_project_files)
+
+    # Write launch statistics in batches
+    app.after(LAUNCH_STATS_SAVE_INTERVAL, app.save_launch_stats)
+
+    # Get and apply window on top setting
+    always_on_top = get_user_setting(setting="always_on_top")
+    if always_on_top == "True":
+        app.attributes('-topmost', True)
+
+    # Load always on top text
+    app.always_on_top_text = get_user_setting("always_on_top_text")
+
+    # Apply window background color
+    app.configure(fg_color=app_settings.WINDOW_COLOR)
+
+    return app
+
+
+def main(args=None):
+    """
+    :param args: Command line arguments without the program name (list str) or
+        None to use sys.argv.
+
+    :return: Exit code (int).
+    """
+    args = sys.argv[1:] if args is None else args
+
+    # Commands open their targets and exit without a window,
+    # launches are handed to the user's open window if there is one
+    arguments = parse_command_line(args)
+    if arguments is not None:
+        if is_forwarded_command(arguments):
+            from ProjectView.utilities.instance_utils import forward_to_running_instance
+            if forward_to_running_instance(args):
+                return 0
+        return run_command(arguments)
+
+    # Hand over to the running instance of the user
+    from ProjectView.utilities.instance_utils import INSTANCE_SERVER, forward_to_running_instance
+    if not INSTANCE_SERVER.start() and forward_to_running_instance(args, wait_for_start=True):
+        return 0
+
+    app = create_app()
+    app.mainloop()
+
+    return 0
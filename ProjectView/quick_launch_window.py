@@ -0,0 +1,153 @@
+"""
+Application quick launch window.
+"""
+from functools import partial
+import tkinter as tk
+
+import customtkinter as ctk
+# Utilities
+from ProjectView.utilities.font_utils import get_font
+from ProjectView.utilities.quick_launch_utils import SEARCH_RESULT_LIMIT
+# Variables
+from ProjectView.app_variables import settings as app_settings
+
+
+class QuickLaunchView(ctk.CTkToplevel):
+    """
+    Class used for displaying the quick launch palette.
+    Searches the actions of all projects while the user types,
+        the result buttons are created once and reconfigured per search.
+    """
+
+    def __init__(self, app, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.title("Quick launch")
+        self.geometry("+279+0")
+        self.attributes('-topmost', True)
+        self.resizable(width=False,
+                       height=False)
+        self.configure(fg_color=app_settings.WINDOW_COLOR)
+
+        self.app = app
+
+        # Stores search results and the selected result
+        self.results = []
+        self.selected = 0
+
+        # Create search entry, every keystroke triggers a search
+        self.search_text = tk.StringVar(self)
+        self.search_text.trace_add("write", self.update_results)
+        self.search_entry = ctk.CTkEntry(
+            self,
+            textvariable=self.search_text,
+            width=300,
+            height=28,
+            font=get_font(size=14),
+            text_color=app_settings.TEXT_COLOR,
+            fg_color=app_settings.FRAME_COLOR,
+            border_color=app_settings.BUTTON_COLOR_MUTED,
+        )
+        self.search_entry.grid(row=0,
+                               column=0,
+                               padx=15,
+                               pady=(15, 5))
+
+        # Create result buttons, hidden until there are results
+        self.result_buttons = []
+        for i in range(SEARCH_RESULT_LIMIT):
+            result_button = ctk.CTkButton(
+                self,
+                text="",
+                width=300,
+                height=25,
+                anchor="w",
+                font=get_font(size=12),
+                fg_color=app_settings.BUTTON_COLOR_MUTED,
+                hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                text_color=app_settings.TEXT_COLOR,
+                command=partial(self.launch_result, i)
+            )
+            result_button.grid(row=i + 1,
+                               column=0,
+                               padx=15,
+                               pady=(0, 5))
+            result_button.grid_remove()
+            self.result_buttons.append(result_button)
+
+        # Keyboard navigation
+        self.bind("<Down>", partial(self.move_selection, 1))
+        self.bind("<Up>", partial(self.move_selection, -1))
+        self.bind("<Return>", self.launch_selected_result)
+        self.bind("<Escape>", lambda event: self.destroy())
+
+    def focus_search_entry(self):
+        """
+        Selects the previous search and focuses the search entry.
+        """
+        self.deiconify()
+        self.focus()
+        self.search_entry.select_range(0, "end")
+        self.search_entry.focus_set()
+
+    def update_results(self, *args):
+        """
+        Searches all projects for the text in the search entry and
+            shows the results on the result buttons.
+        Called on every change of the search entry.
+
+        :param args: Arguments passed on by the variable trace.
+        """
+        self.results = self.app.search_index.search(self.search_text.get())
+        self.selected = 0
+
+        for i, result_button in enumerate(self.result_buttons):
+            if i >= len(self.results):
+                result_button.grid_remove()
+                continue
+            project_name, frame_index, name, target = self.results[i]
+            result_button.configure(text=f"{name}  ({project_name} / "
+                                         f"{self.app.frame_names[frame_index]})")
+            result_button.grid()
+
+        self.highlight_selected_result()
+
+    def highlight_selected_result(self):
+        """
+        Colors the selected result button, the other result buttons are muted.
+        """
+        for i, result_button in enumerate(self.result_buttons[:len(self.results)]):
+            result_button.configure(fg_color=app_settings.BUTTON_COLOR if i == self.selected
+                                    else app_settings.BUTTON_COLOR_MUTED)
+
+    def move_selection(self, step, event=None):
+        """
+        Selects the next or previous result.
+
+        :param step: 1 for the next result, -1 for the previous result (int).
+        :param event: Key event (obj).
+        """
+        if self.results:
+            self.selected = (self.selected + step) % len(self.results)
+            self.highlight_selected_result()
+
+    def launch_selected_result(self, event=None):
+        """
+        Opens the target of the selected result.
+
+        :param event: Key event (obj).
+        """
+        if self.results:
+            self.launch_result(self.selected)
+
+    def launch_result(self, i):
+        """
+        Opens the target of a result through the app and closes the palette.
+
+        :param i: Index of the result (int).
+        """
+        project_name, frame_index, name, target = self.results[i]
+        self.app.open_target(frame_index=frame_index,
+                             button_name=name,
+                             location=target,
+                             project_name=project_name)
+        self.destroy()
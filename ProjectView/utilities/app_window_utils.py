@@ -6,28 +6,77 @@ import os
 import re
 import sys
 
+from ProjectView.utilities.general_utils import get_user_setting, write_file_atomically, \
+    LazyExecutor
+from ProjectView.utilities.manifest_utils import load_project_manifest, update_project_manifest, \
+    rename_in_project_manifest, remove_from_project_manifest
+from ProjectView.utilities.storage_utils import CATEGORIES, JsonProjectStorage, \
+    SqliteProjectStorage, migrate_json_projects, count_project_actions
+
 APPLICATION_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 PROJECTS_FOLDER = os.path.join(APPLICATION_DIR, "ProjectView\\projects")
 PROJECTS_BACKUP_FOLDER = os.path.join(APPLICATION_DIR, "ProjectView\\projects\\backups")
+PROJECTS_DATABASE = os.path.join(APPLICATION_DIR, "ProjectView\\projects\\projects.db")
+
+# Number of backups kept per project if not set in the settings file
+DEFAULT_BACKUP_GENERATIONS = 5
+
+# Writes backups one at a time, in the order they were made
+BACKUP_EXECUTOR = LazyExecutor(max_workers=1,
+                               thread_name_prefix="ProjectView-backup")
+
+# Stores the storage engine once it is created
+PROJECT_STORAGE = []
+
+
+def get_project_storage():
+    """
+    Returns the storage engine chosen by the 'project_storage' setting,
+        'json' (default) or 'sqlite'.
+    The engine is created on first use, a new SQLite database is filled
+        with the existing json projects.
+
+    :return: JsonProjectStorage or SqliteProjectStorage.
+    """
+    if not PROJECT_STORAGE:
+        json_storage = JsonProjectStorage(projects_folder=PROJECTS_FOLDER)
+        if get_user_setting("project_storage", "json") == "sqlite":
+            is_new_database = not os.path.isfile(PROJECTS_DATABASE)
+            sqlite_storage = SqliteProjectStorage(database_path=PROJECTS_DATABASE)
+            if is_new_database:
+                migrate_json_projects(json_storage=json_storage,
+                                      sqlite_storage=sqlite_storage)
+            PROJECT_STORAGE.append(sqlite_storage)
+        else:
+            PROJECT_STORAGE.append(json_storage)
+
+    return PROJECT_STORAGE[0]
 
 
 def get_project_names():
     """
-    Reads the items in the projects folder and returns a list
-        of settings file names with extension or
-        None if no settings files found.
+    Returns a list of project names from the storage engine or
+        None if no projects found.
     Called right after app is created.
 
-    :return: List of settings name and extension (list str) or None.
+    :return: List of project names (list str) or None.
     """
-    # Get list of items in project folder
-    files = os.listdir(PROJECTS_FOLDER)
-    # Filter for json files
-    project_names = [file for file in files if file.endswith(".json")]
+    project_names = get_project_storage().get_project_names()
 
     return project_names if len(project_names) >= 1 else None
 
 
+def get_project_manifest():
+    """
+    Returns the projects manifest, validated against the storage engine.
+    Only projects changed since the last run are parsed.
+    Called right after app is created.
+
+    :return: Dictionary containing 'storage', 'last_active' and 'projects' (dict).
+    """
+    return load_project_manifest(project_storage=get_project_storage())
+
+
 def get_fresh_project_settings():
     """
     Returns a nested dictionary containing the name as outer key and
@@ -46,30 +95,6 @@ def get_fresh_project_settings():
     }
 
 
-def get_current_project_settings(application_buttons, directory_buttons,
-                                 website_buttons):
-    """
-    Gets project user widget information from buttons lists and returns it as a dictionary.
-    Called by save_project() or rename_project().
-
-    :param application_buttons: List of user application buttons info (list str class).
-    :param directory_buttons: List of user directory buttons info (list str class).
-    :param website_buttons: List of user website buttons info (list str class).
-
-    :return: Dictionary with settings names as keys and
-        a list of settings as values (dict list).
-    """
-    # Buttons are added in pairs for easy delete, so must alternate here
-    return {
-        "application_names": [x[0] for i, x in enumerate(application_buttons) if i % 2 == 0],
-        "application_targets": [x[1] for i, x in enumerate(application_buttons) if i % 2 == 0],
-        "directory_names": [x[0] for i, x in enumerate(directory_buttons) if i % 2 == 0],
-        "directory_targets": [x[1] for i, x in enumerate(directory_buttons) if i % 2 == 0],
-        "website_names": [x[0] for i, x in enumerate(website_buttons) if i % 2 == 0],
-        "website_targets": [x[1] for i, x in enumerate(website_buttons) if i % 2 == 0]
-    }
-
-
 def get_project_widgets_info(project_name):
     """
     Gets a profiles user widgets information.
@@ -80,61 +105,199 @@ def get_project_widgets_info(project_name):
 
     :return: Names and targets of the users project widgets (str).
     """
-    with open(f"{PROJECTS_FOLDER}\\{project_name}.json", "r",
-              encoding="utf-8") as active_project_setting:
-        project_data = json.load(active_project_setting)
-        app_names = project_data["application_names"]
-        app_targets = project_data["application_targets"]
-        directory_names = project_data["directory_names"]
-        directory_targets = project_data["directory_targets"]
-        website_names = project_data["website_names"]
-        website_targets = project_data["website_targets"]
+    project_data = get_project_storage().load_project(project_name)
+    app_names = project_data["application_names"]
+    app_targets = project_data["application_targets"]
+    directory_names = project_data["directory_names"]
+    directory_targets = project_data["directory_targets"]
+    website_names = project_data["website_names"]
+    website_targets = project_data["website_targets"]
 
     return app_names, app_targets, \
         directory_names, directory_targets, \
         website_names, website_targets
 
 
+def get_backup_generations():
+    """
+    Returns the number of backups kept per project.
+
+    :return: Number of backups (int).
+    """
+    try:
+        return max(1, int(get_user_setting("project_backup_generations",
+                                           DEFAULT_BACKUP_GENERATIONS)))
+    except ValueError:
+        return DEFAULT_BACKUP_GENERATIONS
+
+
+def get_project_backups(project_name):
+    """
+    Returns the backup file names of a project, newest first.
+
+    :param project_name: Name of a project (str).
+
+    :return: List of backup file names (list str).
+    """
+    regex = re.compile(rf'^{re.escape(project_name)}_backup_\d{{8}}-\d{{6}}-\d{{6}}\.json$')
+    backups = [file for file in os.listdir(PROJECTS_BACKUP_FOLDER) if regex.match(file)]
+
+    return sorted(backups, reverse=True)
+
+
+def write_project_backup(project_name, project_data, backup_name):
+    """
+    Writes a backup and removes the oldest backups of the project
+        if there are more than get_backup_generations().
+    Runs on the backup writer.
+
+    :param project_name: Name of a project (str).
+    :param project_data: Content of the project file (str).
+    :param backup_name: File name of the new backup (str).
+    """
+    write_file_atomically(f"{PROJECTS_BACKUP_FOLDER}\\{backup_name}", project_data)
+
+    for old_backup in get_project_backups(project_name)[get_backup_generations():]:
+        try:
+            os.remove(f"{PROJECTS_BACKUP_FOLDER}\\{old_backup}")
+        except OSError:
+            pass
+
+
 def backup_current_project_settings(project_name):
     """
     Gets a project name,
-        removes the backup and
-        makes a new backup in the project_backup folder.
+        reads the project from the storage engine and
+        writes it as a new timestamped json backup in the project_backup folder
+        on the backup writer.
+    The stored project itself is left in place.
     Called when remove_project() or save_project() is called.
 
     :param project_name: Name of a project (str).
+
+    :return: Future of the backup write (obj) or None if the project does not exist.
     """
-    # Check if backup exists and if so removes it
-    if os.path.isfile(f"{PROJECTS_BACKUP_FOLDER}\\{project_name}_backup.json"):
-        os.remove(f"{PROJECTS_BACKUP_FOLDER}\\{project_name}_backup.json")
+    project_storage = get_project_storage()
+    if not project_storage.has_project(project_name):
+        return None
+
+    # Read now, the project can be overwritten before the backup is written
+    project_data = json.dumps(project_storage.load_project(project_name), indent=4)
 
-    # Save current settings into backup
-    if os.path.isfile(f"{PROJECTS_FOLDER}\\{project_name}.json"):
-        os.rename(f"{PROJECTS_FOLDER}\\{project_name}.json",
-                  f"{PROJECTS_BACKUP_FOLDER}\\{project_name}_backup.json")
+    # Slow to import, only needed for backups
+    from datetime import datetime
+    backup_name = f"{project_name}_backup_{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.json"
+
+    return BACKUP_EXECUTOR.submit(write_project_backup, project_name, project_data, backup_name)
+
+
+def restore_project_backup(project_name, generation=0):
+    """
+    Replaces a stored project with one of its backups.
+    The current project is backed up first, so a restore can be undone.
+
+    :param project_name: Name of a project (str).
+    :param generation: Backup to restore, 0 is the newest (int).
+
+    :return: True if restored else False
+    """
+    backups = get_project_backups(project_name)
+    if generation >= len(backups):
+        return False
+
+    with open(f"{PROJECTS_BACKUP_FOLDER}\\{backups[generation]}", "r",
+              encoding="utf-8") as backup_file:
+        project_settings = json.load(backup_file)
+
+    backup_current_project_settings(project_name=project_name)
+    save_current_project_settings(project_settings=project_settings,
+                                  project_name=project_name)
+
+    return True
 
 
 def save_current_project_settings(project_settings, project_name):
     """
-    Saves the projects current settings
+    Saves the projects current settings atomically through the storage engine.
     Called right after app is created or
         add_new_project() or
         save_project() or
         rename_project is called.
 
     :param project_settings: Dictionary received from get_fresh_profile_settings() or
-        get_current_project_settings() (dict).
+        Project.get_settings() (dict).
+    :param project_name: Name of a project (str).
+    """
+    project_storage = get_project_storage()
+    project_storage.save_project(project_name, project_settings)
+    update_project_manifest(project_storage=project_storage,
+                            project_name=project_name,
+                            action_count=count_project_actions(project_settings))
+
+
+def get_action_operation(operation, frame_index, action_name, target=None, position=None):
+    """
+    :param operation: 'add' or 'remove' (str).
+    :param frame_index: Index of the frame the action belongs to (int).
+    :param action_name: Name of the action (str).
+    :param target: Target of an added action (str).
+    :param position: Position of an added action in its frame, last if None (int).
+
+    :return: Operation for the storage engines, see apply_operation() (dict).
+    """
+    if operation == "add":
+        return {"op": "add",
+                "category": CATEGORIES[frame_index - 1],
+                "name": action_name,
+                "target": target,
+                "position": position}
+
+    return {"op": "remove",
+            "category": CATEGORIES[frame_index - 1],
+            "name": action_name}
+
+
+def store_project_operations(project_name, operations):
+    """
+    Stores action changes of a project with a single write,
+        the json engine appends them to the project journal and
+        the SQLite engine applies them in one transaction.
+    Runs on the autosave worker, update_stored_project() is called afterwards.
+
+    :param project_name: Name of a project (str).
+    :param operations: Operations from get_action_operation() (list dict).
+    """
+    get_project_storage().apply_operations(project_name, operations)
+
+
+def update_stored_project(project_name, action_delta):
+    """
+    Updates the manifest after store_project_operations() finished.
+
+    :param project_name: Name of a project (str).
+    :param action_delta: Change in number of actions (int).
+    """
+    update_project_manifest(project_storage=get_project_storage(),
+                            project_name=project_name,
+                            action_delta=action_delta)
+
+
+def remove_project_settings(project_name):
+    """
+    Backs up a project and removes it from the storage engine.
+    Called when remove_project() is called.
+
     :param project_name: Name of a project (str).
     """
-    json_settings = json.dumps(project_settings, indent=4)
-    with open(f"{PROJECTS_FOLDER}\\{project_name}.json", "w", encoding="utf-8") as save_file:
-        save_file.write(json_settings)
+    backup_current_project_settings(project_name=project_name)
+    get_project_storage().remove_project(project_name)
+    remove_from_project_manifest(project_name=project_name)
 
 
 def rename_project_settings(old_project_name, new_project_name):
     """
     Gets an old project name and a new project name and
-        tries to rename the project settings file.
+        tries to rename the project in the storage engine.
     If file already exists or user has no rights,
         an error is displayed thrown and displayed.
     Called when rename_project() is called.
@@ -143,8 +306,11 @@ def rename_project_settings(old_project_name, new_project_name):
     :param new_project_name: New name of the project (str).
     """
     try:
-        os.rename(f"{PROJECTS_FOLDER}\\{old_project_name}.json",
-                  f"{PROJECTS_FOLDER}\\{new_project_name}.json")
+        project_storage = get_project_storage()
+        project_storage.rename_project(old_project_name, new_project_name)
+        rename_in_project_manifest(project_storage=project_storage,
+                                   old_project_name=old_project_name,
+                                   new_project_name=new_project_name)
         return True
     except PermissionError:
         # User has no rights or
@@ -162,8 +328,8 @@ def is_name_accepted(new_name, name_list):
         get_new_action_button_info() is called.
 
     :param new_name: User prompted new name (str).
-    :param name_list: List of active buttons in the current frame or
-        list of project names (list).
+    :param name_list: Set of action names of the current project or
+        list of project names (set or list).
 
     :return: True if name is accepted else False
     """
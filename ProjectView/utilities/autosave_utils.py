@@ -0,0 +1,137 @@
+"""
+Utilities for saving action changes in the background.
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from ProjectView.utilities.general_utils import get_user_setting
+
+# Milliseconds without a new change before queued changes are written,
+# used if 'autosave_delay' is not set in the settings file
+AUTOSAVE_DELAY = 500
+# Milliseconds between checks for a finished write
+AUTOSAVE_POLL_INTERVAL = 50
+
+# Writes changes one batch at a time, in the order they were made
+AUTOSAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1,
+                                       thread_name_prefix="ProjectView-autosave")
+
+
+def get_autosave_delay():
+    """
+    :return: Milliseconds from the 'autosave_delay' setting or AUTOSAVE_DELAY (int).
+    """
+    try:
+        return max(0, int(get_user_setting("autosave_delay", AUTOSAVE_DELAY)))
+    except (TypeError, ValueError):
+        return AUTOSAVE_DELAY
+
+
+class Autosaver:
+    """
+    Class used for writing action changes behind the user.
+    Changes are queued per project and the delay restarts with every change,
+        so a burst of changes is written as a single batch once it is over.
+    Batches are written on the autosave worker,
+        the window is only used for scheduling and never touched by the worker.
+    """
+
+    def __init__(self, window, store_operations, on_stored, on_failed, delay=None):
+        """
+        :param window: Window providing after() and after_cancel() (obj).
+        :param store_operations: Function writing a batch, called on the worker with
+            the project name and the operations (func).
+        :param on_stored: Function called with the project name and the operations
+            after a batch is written (func).
+        :param on_failed: Function called with the project name and the operations
+            if a batch could not be written (func).
+        :param delay: Milliseconds without a new change before writing,
+            get_autosave_delay() if None (int).
+        """
+        self.window = window
+        self.store_operations = store_operations
+        self.on_stored = on_stored
+        self.on_failed = on_failed
+        self.delay = get_autosave_delay() if delay is None else delay
+
+        # Stores project name as key and queued operations as value
+        self.pending = {}
+        # Stores (project_name, operations, future) of batches being written
+        self.writes = []
+        self.timer = None
+
+        # Number of batches written, a burst of changes counts once
+        self.write_count = 0
+
+    def add_operation(self, project_name, operation):
+        """
+        Queues a change and restarts the delay.
+
+        :param project_name: Name of a project (str).
+        :param operation: Operation for the storage engines (dict).
+        """
+        self.pending.setdefault(project_name, []).append(operation)
+
+        if self.timer is not None:
+            self.window.after_cancel(self.timer)
+        self.timer = self.window.after(self.delay, self.write_pending)
+
+    def write_pending(self):
+        """
+        Sends every queued batch to the autosave worker.
+        """
+        if self.timer is not None:
+            self.window.after_cancel(self.timer)
+            self.timer = None
+
+        pending, self.pending = self.pending, {}
+        for project_name, operations in pending.items():
+            future = AUTOSAVE_EXECUTOR.submit(self.store_operations, project_name, operations)
+            self.writes.append((project_name, operations, future))
+            self.write_count += 1
+
+        if pending:
+            self.window.after(AUTOSAVE_POLL_INTERVAL, self.finish_writes)
+
+    def finish_writes(self, wait_for_writes=False):
+        """
+        Reports finished batches.
+        Reschedules itself until all batches are written.
+
+        :param wait_for_writes: Blocks until all batches are written if True (bool).
+        """
+        if wait_for_writes:
+            wait([future for _, _, future in self.writes])
+
+        running = []
+        for project_name, operations, future in self.writes:
+            if not future.done():
+                running.append((project_name, operations, future))
+            elif future.exception() is None:
+                self.on_stored(project_name, operations)
+            else:
+                self.on_failed(project_name, operations)
+        self.writes = running
+
+        if self.writes and not wait_for_writes:
+            self.window.after(AUTOSAVE_POLL_INTERVAL, self.finish_writes)
+
+    def is_busy(self):
+        """
+        :return: True if changes are queued or being written else False
+        """
+        return bool(self.pending or self.writes)
+
+    def flush(self, project_name=None):
+        """
+        Writes the queued changes now and waits until they are written.
+        Called before a project is read or written as a whole and on exit.
+
+        :param project_name: Only flush if this project has queued or
+            running changes, always flush if None (str).
+        """
+        if project_name is not None and project_name not in self.pending and \
+                all(name != project_name for name, _, _ in self.writes):
+            return
+
+        self.write_pending()
+        self.finish_writes(wait_for_writes=True)
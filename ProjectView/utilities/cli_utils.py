@@ -0,0 +1,193 @@
+"""
+Utilities for the command line.
+Commands read only the project they need and open targets without
+    importing tkinter or customtkinter, the window is not built.
+"""
+import sys
+import time
+from types import SimpleNamespace
+
+from ProjectView.utilities.app_window_utils import get_project_storage, get_project_widgets_info
+from ProjectView.utilities.launch_utils import open_target_location, launch_targets, \
+    get_launch_summary_lines
+from ProjectView.utilities.project_model_utils import Project
+from ProjectView.utilities.usage_utils import LaunchStats, UNUSED_ACTION_AGE
+from ProjectView.app_variables.messages import CLI_PROJECT_NOT_FOUND_TEXT, \
+    CLI_ACTION_NOT_FOUND_TEXT, CLI_INVALID_ACTION_PATH_TEXT, CLI_OPEN_ERROR_TEXT, \
+    CLI_LAUNCH_STATS_HEADER_TEXT, CLI_LAUNCH_STATS_LINE_TEXT, CLI_UNUSED_ACTIONS_TEXT
+
+# Separates the project name from the action name in --open,
+# names cannot contain it, see is_name_accepted()
+ACTION_PATH_SEPARATOR = "/"
+# Commands handed to the open window if there is one,
+# so its pending state and launch statistics apply
+FORWARDED_COMMANDS = ("open", "launch_project")
+# Stores option as key and attribute of the parsed arguments as value
+COMMAND_OPTIONS = {"--open": "open",
+                   "--launch-project": "launch_project",
+                   "--launch-stats": "launch_stats"}
+
+
+def parse_command_line(args):
+    """
+    Parses the command line arguments.
+    Exits with a usage message if they are invalid.
+
+    :param args: Command line arguments without the program name (list str).
+
+    :return: Parsed arguments (obj) or None if no command is given.
+    """
+    # Plain commands are read without argparse, it is slow to import
+    if not args:
+        return None
+    if len(args) == 2 and args[0] in COMMAND_OPTIONS and not args[1].startswith("-"):
+        arguments = SimpleNamespace(**{name: None for name in COMMAND_OPTIONS.values()})
+        setattr(arguments, COMMAND_OPTIONS[args[0]], args[1])
+        return arguments
+
+    # Help, abbreviations and invalid arguments
+    import argparse
+    parser = argparse.ArgumentParser(prog="ProjectView",
+                                     description="Opens the targets of projects.")
+    commands = parser.add_mutually_exclusive_group()
+    commands.add_argument("--open",
+                          metavar="PROJECT/ACTION",
+                          help="open the target of an action and exit")
+    commands.add_argument("--launch-project",
+                          metavar="PROJECT",
+                          help="open every target of a project and exit")
+    commands.add_argument("--launch-stats",
+                          metavar="PROJECT",
+                          help="list the launches of every action of a project, "
+                               "least used first, and exit")
+    arguments = parser.parse_args(args)
+
+    if arguments.open is None and arguments.launch_project is None and \
+            arguments.launch_stats is None:
+        return None
+
+    return arguments
+
+
+def is_forwarded_command(arguments):
+    """
+    :param arguments: Result of parse_command_line() (obj).
+
+    :return: True if the command launches targets, see FORWARDED_COMMANDS else False
+    """
+    return any(getattr(arguments, command) is not None for command in FORWARDED_COMMANDS)
+
+
+def load_project(project_name):
+    """
+    :param project_name: Name of a project (str).
+
+    :return: Project() or None if it does not exist.
+    """
+    if not get_project_storage().has_project(project_name):
+        print(CLI_PROJECT_NOT_FOUND_TEXT.format(project_name=project_name), file=sys.stderr)
+        return None
+
+    return Project.from_widgets_info(project_name, get_project_widgets_info(project_name))
+
+
+def open_action(action_path):
+    """
+    Opens the target of a single action.
+
+    :param action_path: Project and action name, e.g. 'Project/Action' (str).
+
+    :return: Exit code, 0 if the target was opened else 1 (int).
+    """
+    project_name, separator, action_name = action_path.partition(ACTION_PATH_SEPARATOR)
+    if not separator or not project_name or not action_name:
+        print(CLI_INVALID_ACTION_PATH_TEXT.format(action_path=action_path), file=sys.stderr)
+        return 1
+
+    project = load_project(project_name)
+    if project is None:
+        return 1
+
+    found = project.find_action(action_name)
+    if found is None:
+        print(CLI_ACTION_NOT_FOUND_TEXT.format(action_name=action_name,
+                                               project_name=project_name), file=sys.stderr)
+        return 1
+
+    frame_index, action = found
+    result = open_target_location(frame_index, action.target)
+    if result is not True:
+        print(CLI_OPEN_ERROR_TEXT.format(action_name=action_name, reason=result),
+              file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def launch_project(project_name):
+    """
+    Opens every target of a project, applications first.
+
+    :param project_name: Name of a project (str).
+
+    :return: Exit code, 0 if all targets were opened else 1 (int).
+    """
+    project = load_project(project_name)
+    if project is None:
+        return 1
+
+    targets = [(frame_index, action.name, action.target)
+               for frame_index, actions in project.actions.items()
+               for action in actions]
+    results = launch_targets(targets)
+
+    # Report every target that failed
+    if any(result[3] is not True for result in results):
+        print("\n".join(get_launch_summary_lines(
+            [result for result in results if result[3] is not True])), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+def print_launch_stats(project_name):
+    """
+    Prints how often and when every action of a project was launched,
+        unused actions first so they can be removed.
+
+    :param project_name: Name of a project (str).
+
+    :return: Exit code, 0 if the project exists else 1 (int).
+    """
+    project = load_project(project_name)
+    if project is None:
+        return 1
+
+    launch_stats = LaunchStats()
+    print(CLI_LAUNCH_STATS_HEADER_TEXT)
+    for _, action_name, count, last_used in launch_stats.get_launch_report(project):
+        print(CLI_LAUNCH_STATS_LINE_TEXT.format(
+            count=count,
+            last_used=time.strftime("%Y-%m-%d %H:%M", time.localtime(last_used))
+            if last_used is not None else "never",
+            action_name=action_name))
+
+    print(CLI_UNUSED_ACTIONS_TEXT.format(unused=len(launch_stats.get_unused_actions(project)),
+                                         total=project.get_action_count(),
+                                         days=UNUSED_ACTION_AGE // (24 * 60 * 60)))
+
+    return 0
+
+
+def run_command(arguments):
+    """
+    :param arguments: Result of parse_command_line() (obj).
+
+    :return: Exit code (int).
+    """
+    if arguments.open is not None:
+        return open_action(arguments.open)
+    if arguments.launch_stats is not None:
+        return print_launch_stats(arguments.launch_stats)
+
+    return launch_project(arguments.launch_project)
@@ -4,7 +4,11 @@ Utilities for the extra settings window.
 import json
 import re
 
-from ProjectView.utilities.general_utils import restart_program
+from ProjectView.utilities.general_utils import reload_user_settings, get_user_setting
+
+# Settings describing how projects are stored, a reset keeps their current value,
+# switching the storage engine would hide every project stored by the other one
+KEPT_SETTINGS = ["project_storage", "project_backup_generations"]
 
 
 def get_color_palette(hex_color):
@@ -53,11 +57,16 @@ def restore_settings_file(file_path, backup_path):
     First checks is backup file is available,
         if it is this will be used else
         a new one will be created.
-    Restarts app afterwards to load settings.
+    Settings in KEPT_SETTINGS keep their current value.
+    Reloads the settings store afterwards, caller applies the settings.
 
     :param file_path: Path to the settings file.
     :param backup_path: Path to the backup file.
     """
+    # Get the settings that are not reset
+    kept_settings = {setting: get_user_setting(setting) for setting in KEPT_SETTINGS
+                     if get_user_setting(setting) is not None}
+
     try:
         with open(f"{backup_path}\\settings_backup.json",
                   "r", encoding="utf-8") as settings_backup:
@@ -71,13 +80,24 @@ def restore_settings_file(file_path, backup_path):
             "button_color_highlighted": "#2f6ec7",
             "text_color": "#FFFFFF",
             "always_on_top": "False",
-            "always_on_top_text": "Always on top is: OFF"
+            "always_on_top_text": "Always on top is: OFF",
+            "project_backup_generations": "5",
+            "project_storage": "json",
+            "visible_action_rows": "10",
+            "autosave_delay": "500",
+            "application_order": "added",
+            "directory_order": "added",
+            "website_order": "added",
+            "scan_all_projects": "False"
         }
         json_settings = json.dumps(settings, indent=4)
     finally:
+        # noinspection PyUnboundLocalVariable
+        settings.update(kept_settings)
+
         # Overwrite settings file
         with open(f"{file_path}\\settings.json", "w", encoding="utf-8") as settings_file:
             # noinspection PyUnboundLocalVariable
             json.dump(settings, settings_file, indent=4)
 
-    restart_program()
+    reload_user_settings()
@@ -0,0 +1,49 @@
+"""
+Utilities for sharing fonts between all ProjectView windows.
+"""
+import customtkinter as ctk
+
+# Stores one font per (size, weight)
+FONT_CACHE = {}
+
+# Stores font cache counters
+FONT_CACHE_INFO = {
+    "requests": 0,
+    "allocations": 0,
+}
+
+
+def get_font(size, weight="normal"):
+    """
+    Returns the shared font for a size and weight,
+        the font is only created the first time it is requested.
+    Needs a Tk root to exist before the first call.
+
+    :param size: Font size (int).
+    :param weight: Font weight, 'normal' or 'bold' (str).
+
+    :return: Shared CTkFont (obj).
+    """
+    FONT_CACHE_INFO["requests"] += 1
+
+    font = FONT_CACHE.get((size, weight))
+    if font is None:
+        font = ctk.CTkFont(size=size, weight=weight)
+        FONT_CACHE[(size, weight)] = font
+        FONT_CACHE_INFO["allocations"] += 1
+
+    return font
+
+
+def get_font_cache_info():
+    """
+    Returns the font cache counters.
+    Allocations should stay flat however many widgets are created.
+
+    :return: Dictionary containing requests, allocations and cached fonts (dict int).
+    """
+    return {
+        "requests": FONT_CACHE_INFO["requests"],
+        "allocations": FONT_CACHE_INFO["allocations"],
+        "cached": len(FONT_CACHE),
+    }
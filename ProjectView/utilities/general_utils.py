@@ -4,54 +4,176 @@ General use utilities.
 import json
 import os
 import sys
+import threading
 
 APPLICATION_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
 APP_SETTINGS_FOLDER = os.path.join(APPLICATION_DIR, "ProjectView\\app_settings")
 APP_SETTINGS_BACKUP_FOLDER = os.path.join(APPLICATION_DIR, "ProjectView\\app_settings\\backups")
 
 
-def get_user_setting(setting):
+def write_file_atomically(file_path, data, mtime_ns=None):
     """
-    Reads settings file and returns the settings value.
+    Writes data to a temporary file next to file_path,
+        flushes it to disk and replaces file_path with it.
+    file_path either keeps its old content or has the new content,
+        it never goes missing or half written.
+
+    :param file_path: Path of the file to write (str).
+    :param data: Content of the file (str).
+    :param mtime_ns: Modification time of the new file in nanoseconds,
+        set before it replaces file_path so no other time is ever seen, now if None (int).
+    """
+    temp_file_path = f"{file_path}.tmp"
+    with open(temp_file_path, "w", encoding="utf-8") as temp_file:
+        temp_file.write(data)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+
+    if mtime_ns is not None:
+        os.utime(temp_file_path, ns=(mtime_ns, mtime_ns))
+    os.replace(temp_file_path, file_path)
+
+
+class LazyExecutor:
+    """
+    Class used for module level workers that are only started when first needed.
+    concurrent.futures is imported by the first submit(),
+        so the command line only loads it for commands that use a worker.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        """
+        :param max_workers: Maximum number of worker threads (int).
+        :param thread_name_prefix: Name prefix of the worker threads (str).
+        """
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Runs a function on the workers, like ThreadPoolExecutor.submit().
+
+        :param function: Function to run (func).
+
+        :return: Future of the call (obj).
+        """
+        with self.lock:
+            if self.executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                   thread_name_prefix=self.thread_name_prefix)
+
+        return self.executor.submit(function, *args, **kwargs)
+
+
+class SettingsStore:
+    """
+    Class used for keeping the settings file in memory.
+    The file is read once and only read again when its modification time
+        changes or reload() is called.
+    """
+
+    def __init__(self, file_path):
+        """
+        :param file_path: Path to the settings file (str).
+        """
+        self.file_path = file_path
+        self.settings = None
+        self.mtime = None
+
+        # Stores counters
+        self.hits = 0
+        self.disk_reads = 0
+
+    def get_settings(self):
+        """
+        Returns the cached settings,
+            reads the settings file first if it changed on disk.
+
+        :return: Dictionary containing all settings (dict).
+        """
+        if self.settings is None or os.stat(self.file_path).st_mtime_ns != self.mtime:
+            self.reload()
+        else:
+            self.hits += 1
+
+        return self.settings
+
+    def reload(self):
+        """
+        Reads the settings file into the cache.
+        """
+        with open(self.file_path, "r", encoding="utf-8") as settings_file:
+            self.settings = json.load(settings_file)
+        self.mtime = os.stat(self.file_path).st_mtime_ns
+        self.disk_reads += 1
+
+    def set_settings(self, settings, values):
+        """
+        Overwrites the keys values passed in and
+            writes the settings to the settings file.
+
+        :param settings: List of names of settings to overwrite the value of (list).
+        :param values: List of names of values to be overwritten (list).
+        """
+        user_settings = dict(self.get_settings())
+        for setting, value in zip(settings, values):
+            user_settings[setting] = value
+
+        write_file_atomically(self.file_path, json.dumps(user_settings, indent=4))
+
+        self.settings = user_settings
+        self.mtime = os.stat(self.file_path).st_mtime_ns
+
+    def get_cache_info(self):
+        """
+        Returns the cache counters.
+
+        :return: Dictionary containing cache hits and disk reads (dict int).
+        """
+        return {
+            "hits": self.hits,
+            "disk_reads": self.disk_reads,
+        }
+
+
+SETTINGS_STORE = SettingsStore(f"{APP_SETTINGS_FOLDER}\\settings.json")
+
+
+def get_user_setting(setting, default=None):
+    """
+    Returns the settings value from the settings store.
 
     :param setting: Name of the setting to get value of (str).
+    :param default: Value returned if the setting is not in the settings file.
 
     :return: Value of the setting (str).
     """
-    with open(f"{APP_SETTINGS_FOLDER}\\settings.json", "r", encoding="utf-8") as settings_file:
-        settings_data = json.load(settings_file)
-        setting_value = settings_data[setting]
-
-    return setting_value
+    return SETTINGS_STORE.get_settings().get(setting, default)
 
 
 def set_user_settings(settings, values):
     """
-    Reads settings file and overwrites the keys values passed in.
+    Overwrites the keys values passed in and saves the settings file.
 
     :param settings: List of names of settings to overwrite the value of (list).
     :param values: List of names of values to be overwritten (list).
     """
-    with open(f"{APP_SETTINGS_FOLDER}\\settings.json", "r+", encoding="utf-8") as settings_file:
-        user_settings = json.load(settings_file)
-
-        for setting, value in zip(settings, values):
-            user_settings[setting] = value
-
-        settings_file.seek(0)
-        json.dump(user_settings, settings_file, indent=4)
+    SETTINGS_STORE.set_settings(settings=settings,
+                                values=values)
 
 
 def get_color_settings():
     """
-    Reads settings file and returns a dictionary
-        containing the color names and values in hex.
+    Returns a dictionary containing the color names and values in hex
+        from the settings store.
     Called before app is created and when extra settings window is opened.
 
     :return: Dictionary containing the color names and values in hex (dict).
     """
-    with open(f"{APP_SETTINGS_FOLDER}\\settings.json", "r", encoding="utf-8") as settings_file:
-        settings_data = json.load(settings_file)
+    settings_data = SETTINGS_STORE.get_settings()
 
     return {
         "window_color": settings_data["window_color"],
@@ -63,11 +185,17 @@ def get_color_settings():
     }
 
 
-def restart_program():
+def reload_user_settings():
+    """
+    Reads the settings file again, used after the file is replaced.
+    """
+    SETTINGS_STORE.reload()
+
+
+def get_settings_cache_info():
     """
-    Restarts the application to apply new settings.
+    Returns the settings store counters.
 
-    :return: New instance of the app.
+    :return: Dictionary containing cache hits and disk reads (dict int).
     """
-    os.startfile("ProjectView.pyw")
-    sys.exit()
+    return SETTINGS_STORE.get_cache_info()
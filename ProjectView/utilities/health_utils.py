@@ -0,0 +1,206 @@
+"""
+Utilities for checking user widget targets in the background.
+"""
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from ProjectView.utilities.app_window_utils import get_project_widgets_info
+
+# Seconds a checked status stays valid
+HEALTH_CACHE_TTL = 60
+# Seconds a single check may run before it counts as timed out
+HEALTH_CHECK_TIMEOUT = 2
+# Number of checks of a scan running at the same time
+HEALTH_CHECK_WORKERS = 4
+# Minimum seconds between two scans of the same project
+HEALTH_SCAN_INTERVAL = 15
+# Milliseconds between checks for a finished scan
+HEALTH_POLL_INTERVAL = 100
+
+# Text added to an action button for each status, healthy targets get none
+HEALTH_BADGES = {
+    "ok": "",
+    "missing": "  (!)",
+    "timeout": "  (?)",
+}
+
+
+def is_target_available(frame_index, location):
+    """
+    Checks if a file or directory target exists and can be read.
+
+    :param frame_index: Index of the frame the target belongs to (int).
+    :param location: Target of the file or directory (str).
+
+    :return: True if available else False
+    """
+    if frame_index == 1:
+        return os.path.isfile(location) and os.access(location, os.R_OK)
+
+    return os.path.isdir(location)
+
+
+class TargetHealthScanner:
+    """
+    Class used for checking file and directory targets on background threads.
+    Results are kept in a cache for HEALTH_CACHE_TTL seconds,
+        shared by all projects, so switching back to a project reuses them.
+    Website targets are never checked.
+    """
+
+    def __init__(self, cache_ttl=HEALTH_CACHE_TTL, check_timeout=HEALTH_CHECK_TIMEOUT,
+                 scan_interval=HEALTH_SCAN_INTERVAL, check_workers=HEALTH_CHECK_WORKERS):
+        """
+        :param cache_ttl: Seconds a checked status stays valid (int).
+        :param check_timeout: Seconds a single check may run (int).
+        :param scan_interval: Minimum seconds between scans of the same project (int).
+        :param check_workers: Number of checks running at the same time (int).
+        """
+        self.cache_ttl = cache_ttl
+        self.check_timeout = check_timeout
+        self.scan_interval = scan_interval
+        self.check_workers = check_workers
+
+        # Stores (frame_index, target) as key and (status, checked_at) as value
+        self.cache = {}
+        self.cache_lock = threading.Lock()
+
+        # Stores project name as key and last scan time as value
+        self.last_scans = {}
+
+        # Scans run one at a time, checks of a scan run in parallel on their own threads
+        self.scan_executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix="ProjectView-scan")
+
+    def get_status(self, frame_index, location):
+        """
+        Returns the cached status of a target or
+            None if it was never checked or the status expired.
+
+        :param frame_index: Index of the frame the target belongs to (int).
+        :param location: Target of the file or directory (str).
+
+        :return: 'ok', 'missing', 'timeout' or None.
+        """
+        with self.cache_lock:
+            cached = self.cache.get((frame_index, location))
+
+        if cached is None or time.monotonic() - cached[1] > self.cache_ttl:
+            return None
+
+        return cached[0]
+
+    def set_status(self, frame_index, location, status):
+        """
+        :param frame_index: Index of the frame the target belongs to (int).
+        :param location: Target of the file or directory (str).
+        :param status: 'ok', 'missing' or 'timeout' (str).
+        """
+        with self.cache_lock:
+            self.cache[(frame_index, location)] = (status, time.monotonic())
+
+    @staticmethod
+    def start_check(frame_index, location):
+        """
+        Checks a single target on a new daemon thread.
+        A check that hangs on an unreachable share only keeps its own thread busy.
+
+        :param frame_index: Index of the frame the target belongs to (int).
+        :param location: Target of the file or directory (str).
+
+        :return: Future with True if available else False (obj).
+        """
+        future = Future()
+
+        def run_check():
+            try:
+                future.set_result(is_target_available(frame_index, location))
+            except OSError as error:
+                future.set_exception(error)
+
+        threading.Thread(target=run_check, name="ProjectView-check", daemon=True).start()
+
+        return future
+
+    def check_targets(self, targets):
+        """
+        Checks targets with up to check_workers checks running at the same time.
+        A check running longer than check_timeout is cached as 'timeout' and
+            no longer waited on, its place is given to the next target.
+        Runs on the scan worker.
+
+        :param targets: List of (frame_index, target) tuples (list).
+        """
+        waiting = list(reversed(targets))
+        # Stores future as key and (frame_index, location, started_at) as value
+        running = {}
+
+        while waiting or running:
+            # Start checks until all places are taken
+            while waiting and len(running) < self.check_workers:
+                frame_index, location = waiting.pop()
+                running[self.start_check(frame_index, location)] = \
+                    (frame_index, location, time.monotonic())
+
+            # Wait for a check to finish or the oldest one to run out of time
+            oldest_start = min(started_at for _, _, started_at in running.values())
+            done, _ = wait(running,
+                           timeout=max(0, oldest_start + self.check_timeout - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+
+            for future in done:
+                frame_index, location, _ = running.pop(future)
+                self.set_status(frame_index, location,
+                                "ok" if future.exception() is None and future.result()
+                                else "missing")
+
+            now = time.monotonic()
+            for future, (frame_index, location, started_at) in list(running.items()):
+                if now - started_at >= self.check_timeout:
+                    del running[future]
+                    self.set_status(frame_index, location, "timeout")
+
+    def scan(self, targets, other_project_names=()):
+        """
+        Checks all targets that have no valid cached status.
+        Runs on the scan worker.
+
+        :param targets: List of (frame_index, target) tuples (list).
+        :param other_project_names: Names of other projects whose
+            targets are scanned as well (list str).
+        """
+        targets = list(targets)
+        for project_name in other_project_names:
+            try:
+                app_names, app_targets, directory_names, directory_targets, _, _ = \
+                    get_project_widgets_info(project_name=project_name)
+            except (OSError, ValueError, KeyError):
+                continue
+            targets += [(1, target) for target in app_targets]
+            targets += [(2, target) for target in directory_targets]
+
+        # Every target is checked once, even if several actions share it
+        unchecked = {(frame_index, location) for frame_index, location in targets
+                     if frame_index in (1, 2) and self.get_status(frame_index, location) is None}
+        self.check_targets(sorted(unchecked))
+
+    def submit_scan(self, project_name, targets, other_project_names=()):
+        """
+        Sends a scan to the scan worker unless the project was scanned
+            less than scan_interval seconds ago.
+
+        :param project_name: Name of the project the targets belong to (str).
+        :param targets: List of (frame_index, target) tuples (list).
+        :param other_project_names: Names of other projects whose
+            targets are scanned as well (list str).
+
+        :return: Future of the scan (obj) or None if rate limited.
+        """
+        now = time.monotonic()
+        if now - self.last_scans.get(project_name, -self.scan_interval) < self.scan_interval:
+            return None
+        self.last_scans[project_name] = now
+
+        return self.scan_executor.submit(self.scan, targets, other_project_names)
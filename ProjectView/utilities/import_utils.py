@@ -0,0 +1,269 @@
+"""
+Utilities for importing many actions at once.
+Entries are streamed from a folder scan, a csv or json list or
+    an exported bookmarks file as (frame_index, name, target) tuples.
+"""
+import csv
+import json
+import os
+import re
+from html.parser import HTMLParser
+from itertools import count
+from urllib.parse import urlparse
+
+from ProjectView.utilities.app_window_utils import is_name_accepted
+from ProjectView.utilities.storage_utils import CATEGORIES
+
+# Characters allowed in names, see is_name_accepted()
+NAME_CHARACTERS = re.compile(r'[^a-zA-Z0-9_ -]+')
+MIN_NAME_LENGTH = 3
+MAX_NAME_LENGTH = 20
+# Used if nothing of a name is left after removing characters that are not allowed
+DEFAULT_IMPORT_NAME = "Action"
+
+# First columns of an optional csv header row
+CSV_HEADER = ["name", "target"]
+# Bytes read per chunk from a bookmarks file
+BOOKMARKS_CHUNK_SIZE = 64 * 1024
+
+
+def is_website(target):
+    """
+    :param target: Target of an action (str).
+
+    :return: True if the target is a website address else False
+    """
+    return target.lower().startswith(("http://", "https://", "www."))
+
+
+def get_frame_index(category, target):
+    """
+    Returns the frame index for a category name,
+        or guesses it from the target if no category is given.
+
+    :param category: 'application', 'directory', 'website', '1', '2', '3' or empty (str).
+    :param target: Target of the action (str).
+
+    :return: Frame index (int) or None if the category is unknown.
+    """
+    category = (category or "").strip().lower()
+    if not category:
+        return 3 if is_website(target) else 1
+    if category in CATEGORIES:
+        return CATEGORIES.index(category) + 1
+    if category in ("1", "2", "3"):
+        return int(category)
+
+    return None
+
+
+def iter_folder_entries(folder):
+    """
+    Streams the files of a folder as applications and
+        its sub folders as directories.
+
+    :param folder: Folder to scan (str).
+
+    :return: Generator of (frame_index, name, target) tuples.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield 2, entry.name, entry.path
+            elif entry.is_file():
+                yield 1, os.path.splitext(entry.name)[0], entry.path
+
+
+def iter_csv_entries(file_path):
+    """
+    Streams the rows of a csv file with the columns name, target and
+        optionally category. A header row is skipped.
+
+    :param file_path: Path to the csv file (str).
+
+    :return: Generator of (frame_index, name, target) tuples.
+    """
+    with open(file_path, "r", encoding="utf-8-sig", newline="") as csv_file:
+        try:
+            for row in csv.reader(csv_file):
+                # Skip short rows and the header row
+                if len(row) < 2 or [cell.strip().lower() for cell in row[:2]] == CSV_HEADER:
+                    continue
+                name, target = row[0], row[1].strip()
+                frame_index = get_frame_index(row[2] if len(row) > 2 else "", target)
+                if frame_index is not None:
+                    yield frame_index, name, target
+        except csv.Error as error:
+            raise ValueError(f"Invalid csv file: {file_path}") from error
+
+
+def iter_json_entries(file_path):
+    """
+    Reads a json list of objects with the keys name, target and optionally category,
+        or of [name, target] lists.
+
+    :param file_path: Path to the json file (str).
+
+    :return: Generator of (frame_index, name, target) tuples.
+    """
+    with open(file_path, "r", encoding="utf-8") as json_file:
+        entries = json.load(json_file)
+    if not isinstance(entries, list):
+        raise ValueError(f"Invalid json file, expected a list: {file_path}")
+
+    for entry in entries:
+        if isinstance(entry, dict):
+            name, target, category = entry.get("name"), entry.get("target"), \
+                entry.get("category")
+        elif isinstance(entry, list) and len(entry) >= 2:
+            name, target, category = entry[0], entry[1], None
+        else:
+            continue
+        if not isinstance(target, str):
+            continue
+        # Missing and null values count as empty, an empty name falls back later
+        frame_index = get_frame_index("" if category is None else str(category), target)
+        if frame_index is not None:
+            yield frame_index, "" if name is None else str(name), target.strip()
+
+
+class BookmarksParser(HTMLParser):
+    """
+    Class used for reading links from an exported bookmarks file,
+        the Netscape bookmark format all major browsers export.
+    Links are collected while the file is fed in chunks.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # Stores finished (name, address) tuples until they are taken
+        self.links = []
+        self.address = None
+        self.title = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self.address = dict(attrs).get("href")
+            self.title = []
+
+    def handle_data(self, data):
+        if self.address is not None:
+            self.title.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self.address is not None:
+            self.links.append(("".join(self.title), self.address))
+            self.address = None
+
+
+def iter_bookmark_entries(file_path):
+    """
+    Streams the website links of an exported bookmarks file.
+
+    :param file_path: Path to the bookmarks html file (str).
+
+    :return: Generator of (frame_index, name, target) tuples.
+    """
+    parser = BookmarksParser()
+    with open(file_path, "r", encoding="utf-8", errors="replace") as bookmarks_file:
+        while True:
+            chunk = bookmarks_file.read(BOOKMARKS_CHUNK_SIZE)
+            if chunk:
+                parser.feed(chunk)
+            else:
+                parser.close()
+
+            for title, address in parser.links:
+                if is_website(address):
+                    yield 3, title or urlparse(address).netloc, address
+            parser.links = []
+
+            if not chunk:
+                break
+
+
+def iter_import_entries(source):
+    """
+    Streams the entries of a folder or file, the format is taken from the extension.
+
+    :param source: Folder or path to a .csv, .json, .html or .htm file (str).
+
+    :return: Generator of (frame_index, name, target) tuples.
+    """
+    if os.path.isdir(source):
+        return iter_folder_entries(source)
+
+    extension = os.path.splitext(source)[1].lower()
+    if extension == ".csv":
+        return iter_csv_entries(source)
+    if extension == ".json":
+        return iter_json_entries(source)
+    if extension in (".html", ".htm"):
+        return iter_bookmark_entries(source)
+
+    raise ValueError(f"Unsupported import source: {source}")
+
+
+def get_accepted_name(name, taken_names, next_numbers):
+    """
+    Turns a name into one that is_name_accepted() accepts.
+    Characters that are not allowed are replaced by spaces,
+        the name is shortened or padded and a number is added to
+        names that are already taken.
+
+    :param name: Name of an imported entry (str).
+    :param taken_names: Names that are in use (set str).
+    :param next_numbers: Stores name as key and the next number to try as value,
+        so many entries with the same name are numbered in one pass (dict).
+
+    :return: Accepted name (str).
+    """
+    name = " ".join(NAME_CHARACTERS.sub(" ", name).split())[:MAX_NAME_LENGTH].rstrip()
+    if len(name) < MIN_NAME_LENGTH:
+        name = (name or DEFAULT_IMPORT_NAME).ljust(MIN_NAME_LENGTH, "_")
+    if is_name_accepted(new_name=name, name_list=taken_names):
+        return name
+
+    for number in count(next_numbers.get(name, 2)):
+        suffix = f" {number}"
+        numbered_name = name[:MAX_NAME_LENGTH - len(suffix)].rstrip() + suffix
+        if is_name_accepted(new_name=numbered_name, name_list=taken_names):
+            next_numbers[name] = number + 1
+            return numbered_name
+
+
+def prepare_import(entries, project):
+    """
+    Validates streamed entries against a project in one batch.
+    Names are made acceptable and unique, entries without a target and
+        targets already in the same frame are skipped.
+    The project is not changed.
+
+    :param entries: Iterable of (frame_index, name, target) tuples (iter).
+    :param project: Project the entries are imported into (Project).
+
+    :return: Accepted (frame_index, name, target) tuples, number of renamed entries and
+        number of skipped entries (tuple).
+    """
+    taken_names = set(project.action_names)
+    taken_targets = {frame_index: {action.target for action in actions}
+                     for frame_index, actions in project.actions.items()}
+    next_numbers = {}
+    accepted = []
+    renamed = 0
+    skipped = 0
+
+    for frame_index, name, target in entries:
+        if not target or target in taken_targets[frame_index]:
+            skipped += 1
+            continue
+
+        accepted_name = get_accepted_name(name, taken_names, next_numbers)
+        if accepted_name != name:
+            renamed += 1
+
+        taken_names.add(accepted_name)
+        taken_targets[frame_index].add(target)
+        accepted.append((frame_index, accepted_name, target))
+
+    return accepted, renamed, skipped
@@ -0,0 +1,297 @@
+"""
+Utilities for running a single instance of the app per user.
+The first instance holds a lock file named after the user in the app settings folder and
+    listens on a local socket, its port and a secret token are written next to it.
+Later instances of the same user send it their arguments and
+    exit before building any window, other users never see them.
+The command line only imports socket once it found a running instance.
+"""
+import json
+import os
+import queue
+import threading
+import time
+
+from ProjectView.utilities.general_utils import APP_SETTINGS_FOLDER, write_file_atomically
+
+INSTANCE_HOST = "127.0.0.1"
+# Identifies messages of this app, the port could be used by another program
+INSTANCE_APP_NAME = "ProjectView"
+# Seconds a later instance waits for the running one to answer
+INSTANCE_TIMEOUT = 0.5
+# Milliseconds between checks for forwarded arguments
+INSTANCE_POLL_INTERVAL = 100
+# Maximum size of a single message in bytes
+MAX_MESSAGE_SIZE = 64 * 1024
+# Seconds between attempts to read the port of an instance that is starting
+INSTANCE_RETRY_INTERVAL = 0.05
+
+
+def get_instance_file_path(extension):
+    """
+    :param extension: '.lock' or '.port' (str).
+
+    :return: Path of an instance file in the app settings folder,
+        the user name keeps the users of the app apart (str).
+    """
+    user_name = os.environ.get("USERNAME") or os.environ.get("USER")
+    if not user_name:
+        # Slow to import, the variables are set for almost every user
+        import getpass
+        try:
+            user_name = getpass.getuser()
+        except (KeyError, OSError, ImportError):
+            user_name = "user"
+
+    return f"{APP_SETTINGS_FOLDER}\\instance-{user_name}{extension}"
+
+
+def lock_file(locked_file):
+    """
+    Takes an exclusive lock on an open file without waiting,
+        it is released by the system when the file is closed or the process ends.
+
+    :param locked_file: File opened for writing (obj).
+
+    :return: True if the lock was taken else False
+    """
+    try:
+        if os.name == "nt":
+            import msvcrt
+            locked_file.seek(0)
+            msvcrt.locking(locked_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(locked_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+
+def is_instance_running():
+    """
+    Checks the lock without keeping it, cheaper than connecting to the running instance.
+
+    :return: True if another process of the user holds the single instance lock else False
+    """
+    try:
+        with open(get_instance_file_path(".lock"), "a+b") as locked_file:
+            if not lock_file(locked_file):
+                return True
+            if os.name == "nt":
+                # Released right away, closing the file could release it later
+                import msvcrt
+                locked_file.seek(0)
+                msvcrt.locking(locked_file.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        return False
+
+    return False
+
+
+def read_instance_port():
+    """
+    :return: Port and token of the running instance (tuple) or None if not written.
+    """
+    try:
+        with open(get_instance_file_path(".port"), "r", encoding="utf-8") as port_file:
+            instance = json.load(port_file)
+        return int(instance["port"]), str(instance["token"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def read_message(connection):
+    """
+    Reads a single newline terminated json message.
+
+    :param connection: Connected socket (obj).
+
+    :return: Decoded message (dict) or None if it is invalid.
+    """
+    data = b""
+    while not data.endswith(b"\n") and len(data) < MAX_MESSAGE_SIZE:
+        chunk = connection.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+
+    try:
+        message = json.loads(data.decode("utf-8"))
+    except ValueError:
+        return None
+    if not isinstance(message, dict) or message.get("app") != INSTANCE_APP_NAME:
+        return None
+
+    return message
+
+
+def send_message(connection, message):
+    """
+    :param connection: Connected socket (obj).
+    :param message: Message to send (dict).
+    """
+    connection.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+class InstanceServer:
+    """
+    Class used for holding the single instance lock of the user.
+    The lock is an exclusive lock on the lock file, only one process of the user can take it.
+    Arguments of later instances are received on a daemon thread and
+        queued until the main thread takes them with get_forwarded_args().
+    Messages without the token of the port file are ignored.
+    """
+
+    def __init__(self):
+        self.lock_file = None
+        self.server_socket = None
+        self.thread = None
+        self.token = None
+
+        # Stores argument lists of later instances until they are taken
+        self.forwarded_args = queue.Queue()
+
+    def start(self):
+        """
+        Takes the lock of the user, listens on a free port and
+            writes the port and a new token to the port file.
+
+        :return: True if this is the only instance of the user else False
+        """
+        try:
+            locked_file = open(get_instance_file_path(".lock"), "a+b")
+        except OSError:
+            return False
+        if not lock_file(locked_file):
+            locked_file.close()
+            return False
+
+        # Any free port, later instances read it from the port file
+        import socket
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            server_socket.bind((INSTANCE_HOST, 0))
+            server_socket.listen()
+            # Only needed by the first instance, later instances exit before
+            import secrets
+            self.token = secrets.token_hex(16)
+            write_file_atomically(get_instance_file_path(".port"),
+                                  json.dumps({"port": server_socket.getsockname()[1],
+                                              "token": self.token}))
+        except OSError:
+            server_socket.close()
+            locked_file.close()
+            return False
+
+        self.lock_file = locked_file
+        self.server_socket = server_socket
+        self.thread = threading.Thread(target=self.serve,
+                                       args=(server_socket,),
+                                       name="ProjectView-instance",
+                                       daemon=True)
+        self.thread.start()
+
+        return True
+
+    def serve(self, server_socket):
+        """
+        Receives the arguments of later instances until the server is stopped.
+        Runs on the instance thread, must not touch any widget.
+
+        :param server_socket: Listening socket (obj).
+        """
+        while True:
+            try:
+                connection, _ = server_socket.accept()
+            except OSError:
+                # Server socket was closed
+                return
+
+            with connection:
+                try:
+                    connection.settimeout(INSTANCE_TIMEOUT)
+                    message = read_message(connection)
+                    if message is None or message.get("token") != self.token:
+                        continue
+                    self.forwarded_args.put([str(arg) for arg in message.get("args", [])])
+                    send_message(connection, {"app": INSTANCE_APP_NAME, "status": "ok"})
+                    # Let the later instance close first, so the port is not left waiting
+                    connection.recv(1)
+                except OSError:
+                    continue
+
+    def get_forwarded_args(self):
+        """
+        Takes the arguments received since the last call.
+
+        :return: List of argument lists, one per later instance (list list).
+        """
+        forwarded_args = []
+        while True:
+            try:
+                forwarded_args.append(self.forwarded_args.get_nowait())
+            except queue.Empty:
+                return forwarded_args
+
+    def stop(self):
+        """
+        Releases the single instance lock, a new instance can start afterwards.
+        """
+        if self.server_socket is None:
+            return
+
+        # Wake up the instance thread waiting for a connection
+        import socket
+        try:
+            self.server_socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.server_socket.close()
+        self.server_socket = None
+
+        # Closing the lock file releases the lock
+        self.lock_file.close()
+        self.lock_file = None
+
+
+def forward_to_running_instance(args, wait_for_start=False):
+    """
+    Sends arguments to the running instance of the user.
+
+    :param args: Command line arguments of this instance (list str).
+    :param wait_for_start: Waits up to INSTANCE_TIMEOUT seconds for the port file
+        if True, the lock holder could still be starting (bool).
+
+    :return: True if the running instance received them else False
+    """
+    if not is_instance_running():
+        return False
+
+    instance = read_instance_port()
+    deadline = time.monotonic() + INSTANCE_TIMEOUT
+    while instance is None and wait_for_start and time.monotonic() < deadline:
+        time.sleep(INSTANCE_RETRY_INTERVAL)
+        instance = read_instance_port()
+    if instance is None:
+        return False
+
+    # Slow to import, only needed once an instance is running
+    import socket
+    port, token = instance
+    try:
+        with socket.create_connection((INSTANCE_HOST, port),
+                                      timeout=INSTANCE_TIMEOUT) as connection:
+            send_message(connection, {"app": INSTANCE_APP_NAME,
+                                      "token": token,
+                                      "args": list(args)})
+            reply = read_message(connection)
+    except OSError:
+        return False
+
+    return reply is not None and reply.get("status") == "ok"
+
+
+# Single instance lock of this process
+INSTANCE_SERVER = InstanceServer()
@@ -0,0 +1,178 @@
+"""
+Utilities for the append-only change journal of json projects and
+    the undo/redo history of the app window.
+A journal holds one json operation per line and is replayed on top of
+    the project file, it is compacted into the project file in the background.
+"""
+import json
+import os
+from collections import deque
+
+from ProjectView.utilities.general_utils import LazyExecutor
+
+JOURNAL_EXTENSION = ".journal"
+# Journal size in bytes after which it is compacted into the project file
+JOURNAL_COMPACT_SIZE = 64 * 1024
+# Number of changes per project that can be undone
+UNDO_LIMIT = 100
+
+# Compacts journals one at a time
+COMPACT_EXECUTOR = LazyExecutor(max_workers=1,
+                                thread_name_prefix="ProjectView-compact")
+
+
+def apply_operation(project_settings, operation):
+    """
+    Applies a journal operation to project settings in place.
+
+    :param project_settings: Project settings (dict list).
+    :param operation: Dictionary with 'op' ('add' or 'remove'), 'category', 'name' and
+        for 'add' 'target' and optionally 'position' (dict).
+    """
+    names = project_settings[f"{operation['category']}_names"]
+    targets = project_settings[f"{operation['category']}_targets"]
+
+    if operation["op"] == "add":
+        position = operation.get("position")
+        position = len(names) if position is None else min(position, len(names))
+        names.insert(position, operation["name"])
+        targets.insert(position, operation["target"])
+
+    elif operation["op"] == "remove" and operation["name"] in names:
+        i = names.index(operation["name"])
+        del names[i]
+        del targets[i]
+
+
+def read_journal(journal_path, size=None):
+    """
+    Reads the operations of a journal.
+    A line cut off by a crash while appending is skipped.
+
+    :param journal_path: Path to the journal (str).
+    :param size: Number of bytes to read, all if None (int).
+
+    :return: List of operations (list dict), empty if there is no journal.
+    """
+    try:
+        with open(journal_path, "rb") as journal_file:
+            data = journal_file.read() if size is None else journal_file.read(size)
+    except FileNotFoundError:
+        return []
+
+    operations = []
+    for line in data.splitlines():
+        try:
+            operations.append(json.loads(line))
+        except ValueError:
+            continue
+
+    return operations
+
+
+def append_journal(journal_path, operations):
+    """
+    Appends operations to a journal and flushes them to disk.
+    A line cut off by a crash is ended first, so the new operations start on their own line
+        and only the cut off line is skipped by read_journal().
+
+    :param journal_path: Path to the journal (str).
+    :param operations: Operations to append (list dict).
+
+    :return: Size of the journal in bytes afterwards (int).
+    """
+    data = "".join(json.dumps(operation) + "\n" for operation in operations).encode("utf-8")
+    with open(journal_path, "a+b") as journal_file:
+        # End a torn last line
+        if journal_file.seek(0, os.SEEK_END) > 0:
+            journal_file.seek(-1, os.SEEK_END)
+            if journal_file.read(1) != b"\n":
+                data = b"\n" + data
+
+        journal_file.write(data)
+        journal_file.flush()
+        os.fsync(journal_file.fileno())
+        return journal_file.tell()
+
+
+class ChangeHistory:
+    """
+    Class used for storing the action changes of every project that can be undone.
+    A change is a tuple ('add' or 'remove', frame_index, position, name, target),
+        undoing it applies the opposite change at the same position.
+    """
+
+    def __init__(self, limit=UNDO_LIMIT):
+        """
+        :param limit: Number of changes kept per project (int).
+        """
+        self.limit = limit
+
+        # Stores project name as key and changes, newest last, as value
+        self.undo_changes = {}
+        self.redo_changes = {}
+
+    def record(self, project_name, change):
+        """
+        Stores a change made by the user, changes that were undone can no longer be redone.
+
+        :param project_name: Name of a project (str).
+        :param change: ('add' or 'remove', frame_index, position, name, target) (tuple).
+        """
+        self.undo_changes.setdefault(project_name, deque(maxlen=self.limit)).append(change)
+        self.redo_changes.pop(project_name, None)
+
+    @staticmethod
+    def get_opposite(change):
+        """
+        :param change: ('add' or 'remove', frame_index, position, name, target) (tuple).
+
+        :return: Change that reverts it (tuple).
+        """
+        return ("remove" if change[0] == "add" else "add",) + change[1:]
+
+    def undo(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Change that reverts the last change (tuple) or None.
+        """
+        if not self.undo_changes.get(project_name):
+            return None
+
+        change = self.undo_changes[project_name].pop()
+        self.redo_changes.setdefault(project_name, deque(maxlen=self.limit)).append(change)
+
+        return self.get_opposite(change)
+
+    def redo(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Last undone change (tuple) or None.
+        """
+        if not self.redo_changes.get(project_name):
+            return None
+
+        change = self.redo_changes[project_name].pop()
+        self.undo_changes[project_name].append(change)
+
+        return change
+
+    def rename_project(self, old_project_name, new_project_name):
+        """
+        :param old_project_name: Old name of the project (str).
+        :param new_project_name: New name of the project (str).
+        """
+        for changes in (self.undo_changes, self.redo_changes):
+            if old_project_name in changes:
+                changes[new_project_name] = changes.pop(old_project_name)
+
+    def clear_project(self, project_name):
+        """
+        Forgets the changes of a removed project or one changed outside the app.
+
+        :param project_name: Name of a project (str).
+        """
+        self.undo_changes.pop(project_name, None)
+        self.redo_changes.pop(project_name, None)
@@ -0,0 +1,168 @@
+"""
+Utilities for opening user widget targets off the main thread.
+"""
+import os
+import time
+
+from ProjectView.utilities.general_utils import LazyExecutor
+
+# Maximum number of targets being opened at the same time
+LAUNCH_WORKERS = 4
+# Milliseconds between checks for a finished launch
+LAUNCH_POLL_INTERVAL = 50
+
+# Frame indexes in the order a launch all opens them, applications first
+LAUNCH_ALL_ORDER = (1, 2, 3)
+# Seconds between starting two targets of the same frame in a launch all
+LAUNCH_ALL_STAGGER = 0.1
+# Maximum number of targets listed in a launch all summary
+LAUNCH_SUMMARY_LINES = 15
+
+LAUNCH_EXECUTOR = LazyExecutor(max_workers=LAUNCH_WORKERS,
+                               thread_name_prefix="ProjectView-launch")
+# Schedules the targets of a launch all, the targets are opened by LAUNCH_EXECUTOR
+LAUNCH_ALL_EXECUTOR = LazyExecutor(max_workers=1,
+                                   thread_name_prefix="ProjectView-launch-all")
+
+
+def open_target_location(frame_index, location):
+    """
+    Checks and opens the target of a user widget.
+    Runs on a launch worker, must not touch any widget.
+
+    :param frame_index: Index of the frame the target belongs to (int).
+    :param location: Target of the file, directory or website (str).
+
+    :return: True if opened,
+        'missing' if the file or directory cannot be accessed or
+        'unexpected' if opening failed.
+    """
+    try:
+        # Check if user wants to open a file
+        if frame_index == 1:
+            # Check if it's an actual file and user has access
+            if not os.path.isfile(location) or not os.access(location, os.R_OK):
+                return "missing"
+            os.startfile(location)
+
+        # Check if user wants to open a directory
+        elif frame_index == 2:
+            # Check if it's an actual directory
+            if not os.path.exists(location):
+                return "missing"
+            os.startfile(location)
+
+        # User wants to open a website
+        else:
+            # Slow to import, only needed for websites
+            import webbrowser
+            try:
+                webbrowser.open(location)
+            except webbrowser.Error:
+                return "unexpected"
+
+    except OSError:
+        return "unexpected"
+
+    return True
+
+
+def submit_launch(frame_index, location):
+    """
+    Sends a target to the launch workers.
+
+    :param frame_index: Index of the frame the target belongs to (int).
+    :param location: Target of the file, directory or website (str).
+
+    :return: Future resolving to the result of open_target_location() (obj).
+    """
+    return LAUNCH_EXECUTOR.submit(open_target_location, frame_index, location)
+
+
+def open_target_location_timed(frame_index, location):
+    """
+    Runs on a launch worker.
+
+    :param frame_index: Index of the frame the target belongs to (int).
+    :param location: Target of the file, directory or website (str).
+
+    :return: Result of open_target_location() and seconds it took (tuple).
+    """
+    start = time.perf_counter()
+    result = open_target_location(frame_index, location)
+
+    return result, time.perf_counter() - start
+
+
+def launch_targets(targets, order=LAUNCH_ALL_ORDER, stagger=LAUNCH_ALL_STAGGER):
+    """
+    Opens many targets, frame by frame in the given order.
+    A frame is started once every target of the previous frame is opened,
+        targets of the same frame are started stagger seconds apart and
+        at most LAUNCH_WORKERS targets are opened at the same time.
+    Runs on the launch all worker, must not touch any widget.
+
+    :param targets: List of (frame_index, name, location) tuples (list tuple).
+    :param order: Frame indexes in launch order,
+        targets of frames not in it are not opened (tuple int).
+    :param stagger: Seconds between starting two targets of a frame (float).
+
+    :return: List of (frame_index, name, location, result, seconds) tuples
+        in launch order (list tuple).
+    """
+    results = []
+    for frame_index in order:
+        # Start the targets of the frame
+        started = []
+        for target_frame_index, name, location in targets:
+            if target_frame_index != frame_index:
+                continue
+            if started and stagger:
+                time.sleep(stagger)
+            started.append((name, location,
+                            LAUNCH_EXECUTOR.submit(open_target_location_timed,
+                                                   frame_index, location)))
+
+        # Wait for the frame before starting the next one
+        for name, location, future in started:
+            result, seconds = future.result()
+            results.append((frame_index, name, location, result, seconds))
+
+    return results
+
+
+def submit_launch_all(targets, order=LAUNCH_ALL_ORDER, stagger=LAUNCH_ALL_STAGGER):
+    """
+    Sends many targets to the launch all worker.
+
+    :param targets: List of (frame_index, name, location) tuples (list tuple).
+    :param order: Frame indexes in launch order (tuple int).
+    :param stagger: Seconds between starting two targets of a frame (float).
+
+    :return: Future resolving to the result of launch_targets() (obj).
+    """
+    return LAUNCH_ALL_EXECUTOR.submit(launch_targets, targets, order, stagger)
+
+
+def get_launch_summary_lines(results, limit=LAUNCH_SUMMARY_LINES):
+    """
+    Lists the failed targets first and then the slowest opened ones.
+
+    :param results: Result of launch_targets() (list tuple).
+    :param limit: Maximum number of lines (int).
+
+    :return: One line per target with its name, latency and
+        the reason it failed (list str).
+    """
+    failed = [result for result in results if result[3] is not True]
+    opened = sorted((result for result in results if result[3] is True),
+                    key=lambda result: result[4], reverse=True)
+
+    lines = []
+    for _, name, _, result, seconds in (failed + opened)[:limit]:
+        status = "opened" if result is True else result
+        lines.append(f"{name}: {status} ({seconds * 1000:.0f} ms)")
+    if len(results) > limit:
+        lines.append(f"... and {len(results) - limit} more")
+
+    return lines
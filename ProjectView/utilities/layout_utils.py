@@ -0,0 +1,69 @@
+"""
+Utilities for batching widget placement, geometry is only updated when a batch ends.
+"""
+
+
+class LayoutCounter:
+    """
+    Class used for counting widget placements and finished batches.
+    A finished batch is a single update_idletasks() call,
+        the geometry passes Tk runs within it are not counted.
+    The counts of the last run of every batch are kept by batch name.
+    """
+
+    def __init__(self):
+        self.placements = 0
+        self.batches = 0
+
+        # Stores batch name as key and dictionary with
+        # 'placements' and 'batches' of its last run as value
+        self.last_batches = {}
+
+        # Number of batches currently open, only the outermost one updates geometry
+        self.depth = 0
+
+
+class LayoutBatch:
+    """
+    Context manager used while populating frames.
+    The frames stop resizing to their content while widgets are placed,
+        on exit they are released and geometry is updated for all of them together.
+    """
+
+    def __init__(self, window, frames, counter, name):
+        """
+        :param window: Window the frames are in (obj).
+        :param frames: Frames that are populated (list obj).
+        :param counter: Counter the placements and batches are added to (LayoutCounter).
+        :param name: Name the counts of this batch are stored under (str).
+        """
+        self.window = window
+        self.frames = frames
+        self.counter = counter
+        self.name = name
+        self.start_counts = (0, 0)
+
+    def __enter__(self):
+        self.counter.depth += 1
+        self.start_counts = (self.counter.placements, self.counter.batches)
+        if self.counter.depth == 1:
+            # Freeze frame sizes until all widgets are placed
+            for frame in self.frames:
+                frame.grid_propagate(False)
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.counter.depth -= 1
+        if self.counter.depth == 0:
+            for frame in self.frames:
+                frame.grid_propagate(True)
+
+            # Update geometry and redraw once for the whole batch
+            self.window.update_idletasks()
+            self.counter.batches += 1
+
+        self.counter.last_batches[self.name] = {
+            "placements": self.counter.placements - self.start_counts[0],
+            "batches": self.counter.batches - self.start_counts[1],
+        }
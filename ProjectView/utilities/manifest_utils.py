@@ -0,0 +1,164 @@
+"""
+Utilities for the projects manifest.
+The manifest stores project names, action counts, modification times and
+    the last active project, so startup does not have to parse every project.
+"""
+import json
+import os
+import sys
+
+from ProjectView.utilities.general_utils import write_file_atomically
+
+APPLICATION_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
+PROJECTS_MANIFEST_FILE = os.path.join(APPLICATION_DIR,
+                                      "ProjectView\\app_settings\\projects_manifest.json")
+
+# Stores the manifest once it is loaded
+PROJECT_MANIFEST = {
+    "storage": None,
+    "last_active": None,
+    "projects": {},
+}
+# Last active project as it is in the manifest file,
+# a project switch only changes it in memory
+WRITTEN_LAST_ACTIVE = {"project_name": None}
+
+
+def write_project_manifest():
+    """
+    Writes the manifest to the manifest file.
+    Nothing is written before load_project_manifest() is called.
+    """
+    if PROJECT_MANIFEST["storage"] is None:
+        return
+
+    try:
+        write_file_atomically(PROJECTS_MANIFEST_FILE, json.dumps(PROJECT_MANIFEST, indent=4))
+        WRITTEN_LAST_ACTIVE["project_name"] = PROJECT_MANIFEST["last_active"]
+    except OSError:
+        # Manifest is rebuilt on next startup
+        pass
+
+
+def load_project_manifest(project_storage):
+    """
+    Reads the manifest and validates it against the storage engine.
+    Only new or changed projects are parsed,
+        the manifest file is only written if something changed.
+    Called right after app is created.
+
+    :param project_storage: Storage engine the projects are in (obj).
+
+    :return: Dictionary containing 'storage', 'last_active' and 'projects' (dict).
+    """
+    try:
+        with open(PROJECTS_MANIFEST_FILE, "r", encoding="utf-8") as manifest_file:
+            manifest = json.load(manifest_file)
+        if manifest["storage"] != project_storage.name:
+            manifest = {"last_active": None, "projects": {}}
+    except (OSError, ValueError, KeyError):
+        manifest = {"last_active": None, "projects": {}}
+
+    projects = project_storage.get_project_index(known_projects=manifest["projects"])
+    last_active = manifest["last_active"] if manifest["last_active"] in projects else None
+    is_stale = projects != manifest["projects"] or last_active != manifest["last_active"]
+
+    PROJECT_MANIFEST["storage"] = project_storage.name
+    PROJECT_MANIFEST["last_active"] = last_active
+    PROJECT_MANIFEST["projects"] = projects
+    WRITTEN_LAST_ACTIVE["project_name"] = manifest["last_active"]
+
+    if is_stale:
+        write_project_manifest()
+
+    return PROJECT_MANIFEST
+
+
+def set_last_active_project(project_name):
+    """
+    Stores the project that is displayed in memory,
+        a switch does not wait for the disk.
+    It is written with the next manifest change or by flush_last_active_project().
+    Called when change_project() is called.
+
+    :param project_name: Name of a project (str).
+    """
+    PROJECT_MANIFEST["last_active"] = project_name
+
+
+def flush_last_active_project():
+    """
+    Writes the manifest if the last active project changed since it was written.
+    Called when the app is closed.
+    """
+    if PROJECT_MANIFEST["last_active"] != WRITTEN_LAST_ACTIVE["project_name"]:
+        write_project_manifest()
+
+
+def update_project_manifest(project_storage, project_name, action_count=None, action_delta=0):
+    """
+    Updates the modification time and action count of a stored project.
+    Called after a project is saved or one of its actions is added or removed.
+
+    :param project_storage: Storage engine the project is in (obj).
+    :param project_name: Name of a project (str).
+    :param action_count: New number of actions, if known (int).
+    :param action_delta: Change in number of actions, used if action_count is None (int).
+    """
+    if action_count is None:
+        known = PROJECT_MANIFEST["projects"].get(project_name, {"action_count": 0})
+        action_count = max(0, known["action_count"] + action_delta)
+
+    try:
+        mtime_ns = project_storage.get_project_mtime(project_name)
+    except OSError:
+        return
+
+    PROJECT_MANIFEST["projects"][project_name] = {"mtime_ns": mtime_ns,
+                                                  "action_count": action_count}
+    write_project_manifest()
+
+
+def replace_project_index(projects):
+    """
+    Replaces all manifest entries with the projects found on disk.
+    Called when projects were changed outside the app.
+
+    :param projects: Project name as key and dictionary with
+        'mtime_ns' and 'action_count' as value (dict).
+    """
+    PROJECT_MANIFEST["projects"] = projects
+    if PROJECT_MANIFEST["last_active"] not in projects:
+        PROJECT_MANIFEST["last_active"] = None
+    write_project_manifest()
+
+
+def rename_in_project_manifest(project_storage, old_project_name, new_project_name):
+    """
+    Moves a manifest entry to a new project name.
+    Called after a project is renamed.
+
+    :param project_storage: Storage engine the project is in (obj).
+    :param old_project_name: Old name of the project (str).
+    :param new_project_name: New name of the project (str).
+    """
+    known = PROJECT_MANIFEST["projects"].pop(old_project_name, {"action_count": 0})
+    if PROJECT_MANIFEST["last_active"] == old_project_name:
+        PROJECT_MANIFEST["last_active"] = new_project_name
+
+    update_project_manifest(project_storage=project_storage,
+                            project_name=new_project_name,
+                            action_count=known["action_count"])
+
+
+def remove_from_project_manifest(project_name):
+    """
+    Removes a manifest entry.
+    Called after a project is removed.
+
+    :param project_name: Name of a project (str).
+    """
+    PROJECT_MANIFEST["projects"].pop(project_name, None)
+    if PROJECT_MANIFEST["last_active"] == project_name:
+        PROJECT_MANIFEST["last_active"] = None
+    write_project_manifest()
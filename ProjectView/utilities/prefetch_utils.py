@@ -0,0 +1,177 @@
+"""
+Utilities for loading projects before the user switches to them.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from ProjectView.utilities.app_window_utils import get_project_widgets_info
+
+# Maximum number of parsed projects kept in memory
+PREFETCH_CACHE_SIZE = 8
+# Number of recently used projects that are prefetched
+PREFETCH_RECENT_COUNT = 3
+
+
+class ProjectPrefetcher:
+    """
+    Class used for loading and parsing projects on a worker thread and
+        keeping them in a bounded LRU cache.
+    The projects next to the current one in the project menu and
+        the recently used ones are prefetched.
+    A project must be invalidated whenever it is written,
+        the cache only holds what is stored.
+    """
+
+    def __init__(self, load_project=get_project_widgets_info, cache_size=PREFETCH_CACHE_SIZE):
+        """
+        :param load_project: Function returning the widgets information of
+            a project, like get_project_widgets_info() (func).
+        :param cache_size: Maximum number of cached projects (int).
+        """
+        self.load_project = load_project
+        self.cache_size = cache_size
+
+        # Stores project name as key and widgets information as value
+        self.cache = OrderedDict()
+        self.cache_lock = threading.Lock()
+
+        # Stores project name as key and number of invalidations as value,
+        # prefetches started before an invalidation are thrown away
+        self.versions = {}
+        self.pending = set()
+
+        # Stores recently used project names, most recent first
+        self.recent_projects = []
+
+        self.executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="ProjectView-prefetch")
+
+        # Stores counters
+        self.hits = 0
+        self.misses = 0
+
+    def store(self, project_name, widgets_info, version):
+        """
+        Adds a project to the cache unless it was invalidated in the meantime and
+            drops the least recently used project if the cache is full.
+
+        :param project_name: Name of a project (str).
+        :param widgets_info: Widgets information of the project (tuple list).
+        :param version: Version of the project when loading started (int).
+        """
+        with self.cache_lock:
+            if self.versions.get(project_name, 0) != version:
+                return
+            self.cache[project_name] = widgets_info
+            self.cache.move_to_end(project_name)
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+
+    def get_project_widgets_info(self, project_name):
+        """
+        Returns the widgets information of a project,
+            from the cache if possible, else from the storage engine.
+
+        :param project_name: Name of a project (str).
+
+        :return: Names and targets of the users project widgets (str).
+        """
+        with self.cache_lock:
+            widgets_info = self.cache.get(project_name)
+            if widgets_info is not None:
+                self.cache.move_to_end(project_name)
+                self.hits += 1
+                return widgets_info
+            self.misses += 1
+            version = self.versions.get(project_name, 0)
+
+        widgets_info = self.load_project(project_name)
+        self.store(project_name, widgets_info, version)
+
+        return widgets_info
+
+    def invalidate(self, project_name):
+        """
+        Removes a project from the cache.
+        Called after a project is saved, renamed, removed or edited.
+
+        :param project_name: Name of a project (str).
+        """
+        with self.cache_lock:
+            self.cache.pop(project_name, None)
+            self.versions[project_name] = self.versions.get(project_name, 0) + 1
+
+    def record_use(self, project_name):
+        """
+        Marks a project as the most recently used.
+
+        :param project_name: Name of a project (str).
+        """
+        if project_name in self.recent_projects:
+            self.recent_projects.remove(project_name)
+        self.recent_projects.insert(0, project_name)
+        del self.recent_projects[PREFETCH_RECENT_COUNT + 1:]
+
+    def get_likely_projects(self, current_project_name, project_names):
+        """
+        Returns the projects most likely to be opened next,
+            the neighbours in the project menu first, then the recently used ones.
+
+        :param current_project_name: Name of the displayed project (str).
+        :param project_names: Project names in menu order (list str).
+
+        :return: List of project names (list str).
+        """
+        likely_projects = []
+        if current_project_name in project_names:
+            i = project_names.index(current_project_name)
+            likely_projects += [project_names[(i + 1) % len(project_names)],
+                                project_names[i - 1]]
+        likely_projects += [project_name for project_name in self.recent_projects
+                            if project_name in project_names]
+
+        return [project_name for project_name in dict.fromkeys(likely_projects)
+                if project_name != current_project_name]
+
+    def prefetch(self, project_names):
+        """
+        Loads the projects that are not cached or loading on the worker thread.
+
+        :param project_names: Names of projects to prefetch (list str).
+        """
+        for project_name in project_names[:self.cache_size]:
+            with self.cache_lock:
+                if project_name in self.cache or project_name in self.pending:
+                    continue
+                self.pending.add(project_name)
+                version = self.versions.get(project_name, 0)
+            self.executor.submit(self.prefetch_project, project_name, version)
+
+    def prefetch_project(self, project_name, version):
+        """
+        Loads a single project into the cache.
+        Runs on the worker thread.
+
+        :param project_name: Name of a project (str).
+        :param version: Version of the project when prefetching started (int).
+        """
+        try:
+            self.store(project_name, self.load_project(project_name), version)
+        except (OSError, ValueError, KeyError):
+            pass
+        finally:
+            with self.cache_lock:
+                self.pending.discard(project_name)
+
+    def get_cache_info(self):
+        """
+        Returns the prefetch counters.
+
+        :return: Dictionary containing hits, misses and cached projects (dict int).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self.cache),
+        }
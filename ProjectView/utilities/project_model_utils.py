@@ -0,0 +1,526 @@
+"""
+Project model used by the app window.
+Holds the projects and their actions and never creates or touches widgets,
+    so they can be loaded, changed, validated and compared without a display.
+The app window observes the model and only displays it.
+"""
+from ProjectView.utilities.app_window_utils import get_project_widgets_info, is_name_accepted
+from ProjectView.utilities.storage_utils import CATEGORIES
+
+# Frame indexes of the user frames, in settings order
+FRAME_INDEXES = (1, 2, 3)
+
+
+class Action:
+    """
+    Class used for storing a single action of a project.
+    The buttons are set by the view while the action is displayed in
+        one of the visible rows and are None otherwise.
+    Uses __slots__, projects can hold many thousands of actions.
+    """
+    __slots__ = ("name", "target", "remove_button", "action_button")
+
+    def __init__(self, name, target):
+        """
+        :param name: Name of the action (str).
+        :param target: File, directory or website the action opens (str).
+        """
+        self.name = name
+        self.target = target
+        self.remove_button = None
+        self.action_button = None
+
+
+class Project:
+    """
+    Class used for storing the actions of a single project per frame index.
+    """
+
+    def __init__(self, name):
+        """
+        :param name: Name of the project (str).
+        """
+        self.name = name
+
+        # Stores frame index as key and list of actions in the order they were added as value
+        self.actions = {frame_index: [] for frame_index in FRAME_INDEXES}
+
+        # Stores frame index as key and the sort key of its display order as value,
+        # None while the frame shows its actions in the order they were added
+        self.display_keys = {frame_index: None for frame_index in FRAME_INDEXES}
+        # Stores frame index as key and list of actions sorted by its display key as value
+        self.display_actions = {frame_index: None for frame_index in FRAME_INDEXES}
+
+        # Stores frame index as key and dictionary with
+        # action name as key and action as value
+        self.action_index = {frame_index: {} for frame_index in FRAME_INDEXES}
+        # Stores the action names of all frames, names are unique per project
+        self.action_names = set()
+
+    @classmethod
+    def from_widgets_info(cls, name, widgets_info):
+        """
+        :param name: Name of the project (str).
+        :param widgets_info: Names and targets like get_project_widgets_info() returns (tuple list).
+
+        :return: Project()
+        """
+        project = cls(name)
+        for frame_index in FRAME_INDEXES:
+            names = widgets_info[(frame_index - 1) * 2]
+            targets = widgets_info[(frame_index - 1) * 2 + 1]
+            actions = [Action(action_name, target) for action_name, target in zip(names, targets)]
+            project.actions[frame_index] = actions
+            project.action_index[frame_index] = {action.name: action for action in actions}
+            project.action_names.update(names)
+
+        return project
+
+    @classmethod
+    def from_settings(cls, name, project_settings):
+        """
+        :param name: Name of the project (str).
+        :param project_settings: Project settings like get_fresh_project_settings() (dict list).
+
+        :return: Project()
+        """
+        return cls.from_widgets_info(name, [project_settings[f"{category}_{key}"]
+                                            for category in CATEGORIES
+                                            for key in ("names", "targets")])
+
+    def get_widgets_info(self):
+        """
+        :return: Names and targets like get_project_widgets_info() returns (list list).
+        """
+        widgets_info = []
+        for frame_index in FRAME_INDEXES:
+            widgets_info.append([action.name for action in self.actions[frame_index]])
+            widgets_info.append([action.target for action in self.actions[frame_index]])
+
+        return widgets_info
+
+    def get_settings(self):
+        """
+        Returns the project in the format it is stored in.
+
+        :return: Dictionary with settings names as keys and
+            a list of settings as values (dict list).
+        """
+        project_settings = {}
+        for frame_index, category in zip(FRAME_INDEXES, CATEGORIES):
+            actions = self.actions[frame_index]
+            project_settings[f"{category}_names"] = [action.name for action in actions]
+            project_settings[f"{category}_targets"] = [action.target for action in actions]
+
+        return project_settings
+
+    def get_action_count(self):
+        """
+        :return: Number of actions in all frames (int).
+        """
+        return sum(len(actions) for actions in self.actions.values())
+
+    def get_action(self, frame_index, name):
+        """
+        :param frame_index: Index of the frame the action is in (int).
+        :param name: Name of the action (str).
+
+        :return: Action or None.
+        """
+        return self.action_index[frame_index].get(name)
+
+    def find_action(self, name):
+        """
+        Looks an action up in every frame, names are unique per project.
+
+        :param name: Name of the action (str).
+
+        :return: Frame index and action (tuple) or None.
+        """
+        for frame_index in FRAME_INDEXES:
+            action = self.action_index[frame_index].get(name)
+            if action is not None:
+                return frame_index, action
+
+        return None
+
+    def get_action_position(self, frame_index, name):
+        """
+        :param frame_index: Index of the frame the action is in (int).
+        :param name: Name of the action (str).
+
+        :return: Position of the action in its frame (int) or None.
+        """
+        action = self.action_index[frame_index].get(name)
+        if action is None:
+            return None
+
+        return self.actions[frame_index].index(action)
+
+    def get_display_actions(self, frame_index):
+        """
+        :param frame_index: Index of the frame (int).
+
+        :return: Actions of the frame in the order they are displayed (list).
+        """
+        display_actions = self.display_actions[frame_index]
+
+        return display_actions if display_actions is not None else self.actions[frame_index]
+
+    def get_display_position(self, frame_index, name):
+        """
+        :param frame_index: Index of the frame the action is in (int).
+        :param name: Name of the action (str).
+
+        :return: Position of the action in its frame's display order (int) or None.
+        """
+        action = self.action_index[frame_index].get(name)
+        if action is None:
+            return None
+
+        return self.get_display_actions(frame_index).index(action)
+
+    def set_display_order(self, frame_index, key):
+        """
+        Sorts the displayed actions of a frame, highest key first.
+        Actions with the same key keep the order they were added in.
+
+        :param frame_index: Index of the frame (int).
+        :param key: Function returning the sort key of an action (func) or
+            None to display the actions in the order they were added.
+        """
+        self.display_keys[frame_index] = key
+        self.sort_display_actions(frame_index)
+
+    def sort_display_actions(self, frame_index):
+        """
+        :param frame_index: Index of the frame (int).
+        """
+        key = self.display_keys[frame_index]
+        self.display_actions[frame_index] = None if key is None else \
+            sorted(self.actions[frame_index], key=key, reverse=True)
+
+    def move_display_action(self, frame_index, name):
+        """
+        Moves an action whose sort key changed to its place in the display order.
+        The other actions keep their order, so it is found by bisection.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+
+        :return: Old and new display position (tuple int) or
+            None if the frame is displayed in the order the actions were added.
+        """
+        display_actions = self.display_actions[frame_index]
+        action = self.action_index[frame_index].get(name)
+        if display_actions is None or action is None:
+            return None
+
+        old_position = display_actions.index(action)
+        del display_actions[old_position]
+
+        # Place it after the actions with a higher or equal key
+        key = self.display_keys[frame_index]
+        action_key = key(action)
+        low, high = 0, len(display_actions)
+        while low < high:
+            middle = (low + high) // 2
+            if key(display_actions[middle]) >= action_key:
+                low = middle + 1
+            else:
+                high = middle
+        display_actions.insert(low, action)
+
+        return old_position, low
+
+    def is_action_name_accepted(self, name):
+        """
+        Action names are unique across all frames of a project.
+
+        :param name: User prompted new name (str).
+
+        :return: True if name is accepted else False
+        """
+        return is_name_accepted(new_name=name, name_list=self.action_names)
+
+    def add_action(self, frame_index, name, target, position=None):
+        """
+        Appends an action to a frame or inserts it at a position.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+        :param target: Target of the action (str).
+        :param position: Position in the frame, last if None (int).
+
+        :return: Position of the new action in its frame (int).
+        """
+        position = self.insert_action(frame_index, name, target, position)
+        self.sort_display_actions(frame_index)
+
+        return position
+
+    def insert_action(self, frame_index, name, target, position=None):
+        """
+        Adds an action without updating the display order of its frame.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+        :param target: Target of the action (str).
+        :param position: Position in the frame, last if None (int).
+
+        :return: Position of the new action in its frame (int).
+        """
+        action = Action(name, target)
+        actions = self.actions[frame_index]
+        if position is None or position >= len(actions):
+            position = len(actions)
+        actions.insert(position, action)
+        self.action_index[frame_index][name] = action
+        self.action_names.add(name)
+
+        return position
+
+    def add_actions(self, entries):
+        """
+        Appends many actions at once.
+
+        :param entries: Iterable of (frame_index, name, target) tuples (iter).
+
+        :return: Frame index as key and display position of its first new action
+            as value (dict int).
+        """
+        first_positions = {}
+        new_actions = {}
+        for frame_index, name, target in entries:
+            position = self.insert_action(frame_index, name, target)
+            first_positions.setdefault(frame_index, position)
+            new_actions.setdefault(frame_index, set()).add(self.action_index[frame_index][name])
+
+        # Sorted once per frame, new actions can be anywhere in the display order
+        for frame_index in first_positions:
+            if self.display_keys[frame_index] is not None:
+                self.sort_display_actions(frame_index)
+                first_positions[frame_index] = next(
+                    i for i, action in enumerate(self.display_actions[frame_index])
+                    if action in new_actions[frame_index])
+
+        return first_positions
+
+    def remove_action(self, frame_index, name):
+        """
+        Removes an action from a frame.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+
+        :return: Position the action had in its frame (int) or None if not found.
+        """
+        action = self.action_index[frame_index].pop(name, None)
+        if action is None:
+            return None
+
+        position = self.actions[frame_index].index(action)
+        del self.actions[frame_index][position]
+        self.action_names.discard(name)
+        if self.display_actions[frame_index] is not None:
+            self.display_actions[frame_index].remove(action)
+
+        return position
+
+    def get_first_changed_position(self, other_project, frame_index):
+        """
+        Compares the displayed actions of a frame with the same frame of another project.
+        Actions before the returned position are equal in both projects,
+            so their rows do not need to be redrawn on a switch.
+
+        :param other_project: Project to compare with (Project).
+        :param frame_index: Index of the frame (int).
+
+        :return: Position of the first action that differs (int).
+        """
+        position = 0
+        for action, other_action in zip(self.get_display_actions(frame_index),
+                                        other_project.get_display_actions(frame_index)):
+            if action.name != other_action.name or action.target != other_action.target:
+                break
+            position += 1
+
+        return position
+
+
+class ProjectCollection:
+    """
+    Class used for storing the project names and the displayed project.
+    Observers are called after every change with the event name and
+        keyword arguments describing the change:
+        'project_switched' with previous_project,
+        'action_added', 'action_removed' and 'actions_reordered' with
+            frame_index and the first changed display position,
+        'actions_added' with first_positions,
+        'project_names_changed' without arguments.
+    """
+
+    def __init__(self, load_project=get_project_widgets_info, get_order_key=None):
+        """
+        :param load_project: Function returning the widgets information of
+            a project, like get_project_widgets_info() (func).
+        :param get_order_key: Function returning the display order key of a frame,
+            see Project.set_display_order(), for a project name and frame index (func) or
+            None to display every frame in the order the actions were added.
+        """
+        self.load_project = load_project
+        self.get_order_key = get_order_key
+
+        # Stores project names in menu order and the displayed project
+        self.project_names = []
+        self.current_project = None
+
+        # Stores functions called after every change
+        self.observers = []
+
+    def add_observer(self, observer):
+        """
+        :param observer: Function called with the event name and
+            keyword arguments describing the change (func).
+        """
+        self.observers.append(observer)
+
+    def notify(self, event, **details):
+        """
+        Calls every observer with a change.
+
+        :param event: Name of the change (str).
+        :param details: Keyword arguments describing the change.
+        """
+        for observer in self.observers:
+            observer(event, **details)
+
+    def get_current_project_name(self):
+        """
+        :return: Name of the displayed project (str) or None.
+        """
+        return self.current_project.name if self.current_project is not None else None
+
+    def is_project_name_accepted(self, name):
+        """
+        :param name: User prompted new project name (str).
+
+        :return: True if name is accepted else False
+        """
+        return is_name_accepted(new_name=name, name_list=self.project_names)
+
+    def switch_project(self, project_name):
+        """
+        Loads a project and makes it the displayed project.
+
+        :param project_name: Name of a project (str).
+
+        :return: The loaded project (Project).
+        """
+        previous_project = self.current_project
+        self.current_project = Project.from_widgets_info(project_name,
+                                                         self.load_project(project_name))
+        if self.get_order_key is not None:
+            for frame_index in FRAME_INDEXES:
+                self.current_project.set_display_order(
+                    frame_index, self.get_order_key(project_name, frame_index))
+        self.notify("project_switched", previous_project=previous_project)
+
+        return self.current_project
+
+    def add_project_name(self, project_name):
+        """
+        :param project_name: Name of a new project (str).
+        """
+        self.project_names.append(project_name)
+        self.notify("project_names_changed")
+
+    def remove_project_name(self, project_name):
+        """
+        :param project_name: Name of a removed project (str).
+        """
+        self.project_names.remove(project_name)
+        self.notify("project_names_changed")
+
+    def rename_project_name(self, old_project_name, new_project_name):
+        """
+        Renames a project in place, the menu order is kept.
+
+        :param old_project_name: Old name of the project (str).
+        :param new_project_name: New name of the project (str).
+        """
+        self.project_names[self.project_names.index(old_project_name)] = new_project_name
+        if self.get_current_project_name() == old_project_name:
+            self.current_project.name = new_project_name
+        self.notify("project_names_changed")
+
+    def add_action(self, frame_index, name, target, position=None):
+        """
+        Adds an action to the displayed project.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+        :param target: Target of the action (str).
+        :param position: Position in the frame, last if None (int).
+
+        :return: Position of the new action in its frame (int).
+        """
+        position = self.current_project.add_action(frame_index, name, target, position)
+        self.notify("action_added", frame_index=frame_index,
+                    position=self.current_project.get_display_position(frame_index, name))
+
+        return position
+
+    def add_actions(self, entries):
+        """
+        Appends many actions to the displayed project,
+            observers are only called once.
+
+        :param entries: Iterable of (frame_index, name, target) tuples (iter).
+        """
+        first_positions = self.current_project.add_actions(entries)
+        if first_positions:
+            self.notify("actions_added", first_positions=first_positions)
+
+    def remove_action(self, frame_index, name):
+        """
+        Removes an action from the displayed project.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+
+        :return: True if the action was removed else False
+        """
+        position = self.current_project.get_display_position(frame_index, name)
+        if position is None:
+            return False
+
+        self.current_project.remove_action(frame_index, name)
+        self.notify("action_removed", frame_index=frame_index, position=position)
+
+        return True
+
+    def set_display_order(self, frame_index):
+        """
+        Sorts a frame of the displayed project again,
+            called after the order mode of the frame changed.
+
+        :param frame_index: Index of the frame (int).
+        """
+        self.current_project.set_display_order(
+            frame_index, self.get_order_key(self.current_project.name, frame_index)
+            if self.get_order_key is not None else None)
+        self.notify("actions_reordered", frame_index=frame_index, position=0)
+
+    def move_display_action(self, frame_index, name):
+        """
+        Moves an action of the displayed project to its place in the display order,
+            called after its launch statistics changed.
+        Only rows from its old or new position down are redrawn.
+
+        :param frame_index: Index of the frame (int).
+        :param name: Name of the action (str).
+        """
+        positions = self.current_project.move_display_action(frame_index, name)
+        if positions is not None and positions[0] != positions[1]:
+            self.notify("actions_reordered", frame_index=frame_index, position=min(positions))
@@ -0,0 +1,269 @@
+"""
+Utilities for searching actions across all projects.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ProjectView.utilities.app_window_utils import get_project_widgets_info
+
+# Maximum number of results returned by a search
+SEARCH_RESULT_LIMIT = 8
+# Share of the query's trigrams a result must contain
+SEARCH_MIN_SIMILARITY = 0.5
+
+
+def get_trigrams(text):
+    """
+    :param text: Lowercase text (str).
+
+    :return: Set of all 3 character substrings of the text (set str).
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def get_word_prefixes(text):
+    """
+    :param text: Lowercase text (str).
+
+    :return: Set of the first 1 and 2 characters of every word in the text (set str).
+    """
+    prefixes = set()
+    for word in text.replace("/", " ").replace("\\", " ").replace(".", " ").split():
+        prefixes.add(word[:1])
+        prefixes.add(word[:2])
+
+    return prefixes
+
+
+class ActionSearchIndex:
+    """
+    Class used for fuzzy searching action names and targets of all projects.
+    Names and targets are indexed by trigram, queries shorter than
+        3 characters use an index of word prefixes.
+    The index is updated per action, only a full build reads every project.
+    """
+
+    def __init__(self):
+        # Stores entry id as key and (project_name, frame_index, name, target) as value
+        self.entries = {}
+        # Stores (project_name, frame_index, name) as key and entry id as value
+        self.entry_ids = {}
+        # Stores project name as key and set of its entry ids as value
+        self.project_entry_ids = {}
+        self.next_entry_id = 0
+
+        # Stores trigram or word prefix as key and set of entry ids as value
+        self.trigram_index = {}
+        self.prefix_index = {}
+
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="ProjectView-index")
+
+    def get_entry_keys(self, entry):
+        """
+        :param entry: (project_name, frame_index, name, target) (tuple).
+
+        :return: Trigrams and word prefixes the entry is indexed under (tuple set).
+        """
+        name, target = entry[2].lower(), entry[3].lower()
+
+        return get_trigrams(name) | get_trigrams(target), get_word_prefixes(name)
+
+    def add_action(self, project_name, frame_index, name, target):
+        """
+        Adds a single action to the index.
+
+        :param project_name: Name of the project the action is in (str).
+        :param frame_index: Index of the frame the action is in (int).
+        :param name: Name of the action (str).
+        :param target: Target of the action (str).
+        """
+        with self.lock:
+            self.add_entry((project_name, frame_index, name, target))
+
+    def add_entry(self, entry):
+        """
+        Must be called while holding self.lock.
+
+        :param entry: (project_name, frame_index, name, target) (tuple).
+        """
+        self.remove_entry(entry[:3])
+
+        entry_id = self.next_entry_id
+        self.next_entry_id += 1
+        self.entries[entry_id] = entry
+        self.entry_ids[entry[:3]] = entry_id
+        self.project_entry_ids.setdefault(entry[0], set()).add(entry_id)
+
+        trigrams, prefixes = self.get_entry_keys(entry)
+        for trigram in trigrams:
+            self.trigram_index.setdefault(trigram, set()).add(entry_id)
+        for prefix in prefixes:
+            self.prefix_index.setdefault(prefix, set()).add(entry_id)
+
+    def remove_action(self, project_name, frame_index, name):
+        """
+        Removes a single action from the index.
+
+        :param project_name: Name of the project the action is in (str).
+        :param frame_index: Index of the frame the action is in (int).
+        :param name: Name of the action (str).
+        """
+        with self.lock:
+            self.remove_entry((project_name, frame_index, name))
+
+    def remove_entry(self, entry_key):
+        """
+        Must be called while holding self.lock.
+
+        :param entry_key: (project_name, frame_index, name) (tuple).
+        """
+        entry_id = self.entry_ids.pop(entry_key, None)
+        if entry_id is None:
+            return
+
+        project_entry_ids = self.project_entry_ids[entry_key[0]]
+        project_entry_ids.discard(entry_id)
+        if not project_entry_ids:
+            del self.project_entry_ids[entry_key[0]]
+
+        trigrams, prefixes = self.get_entry_keys(self.entries.pop(entry_id))
+        for keys, index in ((trigrams, self.trigram_index), (prefixes, self.prefix_index)):
+            for key in keys:
+                entry_ids = index[key]
+                entry_ids.discard(entry_id)
+                if not entry_ids:
+                    del index[key]
+
+    def get_project_entries(self, project_name):
+        """
+        Must be called while holding self.lock.
+
+        :param project_name: Name of a project (str).
+
+        :return: List of indexed entries of the project (list tuple).
+        """
+        return [self.entries[entry_id]
+                for entry_id in self.project_entry_ids.get(project_name, ())]
+
+    def set_project(self, project_name, widgets_info):
+        """
+        Makes the index match a project's actions,
+            only actions that were added, removed or changed are reindexed.
+        Called when a project is loaded or saved.
+
+        :param project_name: Name of a project (str).
+        :param widgets_info: Names and targets like get_project_widgets_info() returns (tuple list).
+        """
+        new_entries = set()
+        for frame_index in (1, 2, 3):
+            names = widgets_info[(frame_index - 1) * 2]
+            targets = widgets_info[(frame_index - 1) * 2 + 1]
+            new_entries.update((project_name, frame_index, name, target)
+                               for name, target in zip(names, targets))
+
+        with self.lock:
+            old_entries = set(self.get_project_entries(project_name))
+            for entry in old_entries - new_entries:
+                self.remove_entry(entry[:3])
+            for entry in new_entries - old_entries:
+                self.add_entry(entry)
+
+    def rename_project(self, old_project_name, new_project_name):
+        """
+        Moves all entries of a project to its new name.
+
+        :param old_project_name: Old name of the project (str).
+        :param new_project_name: New name of the project (str).
+        """
+        with self.lock:
+            for entry in self.get_project_entries(old_project_name):
+                self.remove_entry(entry[:3])
+                self.add_entry((new_project_name,) + entry[1:])
+
+    def remove_project(self, project_name):
+        """
+        Removes all entries of a project.
+
+        :param project_name: Name of a project (str).
+        """
+        with self.lock:
+            for entry in self.get_project_entries(project_name):
+                self.remove_entry(entry[:3])
+
+    def build(self, project_names):
+        """
+        Indexes every project that is not indexed yet.
+        Runs on the index worker, projects are locked one at a time.
+
+        :param project_names: Names of all projects (list str).
+        """
+        for project_name in project_names:
+            with self.lock:
+                if project_name in self.project_entry_ids:
+                    continue
+            try:
+                self.set_project(project_name, get_project_widgets_info(project_name))
+            except (OSError, ValueError, KeyError):
+                continue
+
+    def submit_build(self, project_names):
+        """
+        Sends a full build to the index worker.
+
+        :param project_names: Names of all projects (list str).
+
+        :return: Future of the build (obj).
+        """
+        return self.executor.submit(self.build, list(project_names))
+
+    def search(self, query, limit=SEARCH_RESULT_LIMIT):
+        """
+        Returns the actions best matching the query.
+        Actions whose name starts with or contains the query rank first.
+
+        :param query: Text typed by the user (str).
+        :param limit: Maximum number of results (int).
+
+        :return: List of (project_name, frame_index, name, target) tuples (list tuple).
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        with self.lock:
+            if len(query) < 3:
+                candidates = {entry_id: 1 for entry_id in self.prefix_index.get(query, ())}
+                required = 1
+            else:
+                # Count shared trigrams per entry
+                query_trigrams = get_trigrams(query)
+                candidates = {}
+                for trigram in query_trigrams:
+                    for entry_id in self.trigram_index.get(trigram, ()):
+                        candidates[entry_id] = candidates.get(entry_id, 0) + 1
+                required = max(1, int(len(query_trigrams) * SEARCH_MIN_SIMILARITY))
+
+            # Group entries by number of shared trigrams
+            buckets = {}
+            for entry_id, shared in candidates.items():
+                if shared >= required:
+                    buckets.setdefault(shared, []).append(entry_id)
+
+            # Names containing the query share all its trigrams, so they are
+            # in the first bucket and lower buckets are only ranked if needed
+            results = []
+            for shared in sorted(buckets, reverse=True):
+                scored = []
+                for entry_id in buckets[shared]:
+                    entry = self.entries[entry_id]
+                    name = entry[2].lower()
+                    bonus = 2 if name.startswith(query) else 1 if query in name else 0
+                    scored.append((-bonus, len(name), entry_id))
+                scored.sort()
+                results += [self.entries[result[2]] for result in scored[:limit - len(results)]]
+                if len(results) >= limit:
+                    break
+
+        return results
@@ -0,0 +1,611 @@
+"""
+Storage engines for project settings.
+Both engines take and return project settings in the format of
+    get_fresh_project_settings(), so callers do not depend on the backend.
+"""
+import json
+import os
+import threading
+
+from ProjectView.utilities.general_utils import write_file_atomically
+from ProjectView.utilities.journal_utils import JOURNAL_EXTENSION, JOURNAL_COMPACT_SIZE, \
+    COMPACT_EXECUTOR, apply_operation, read_journal, append_journal
+
+# Action categories in frame order, frame index 1 is "application"
+CATEGORIES = ["application", "directory", "website"]
+
+
+def count_project_actions(project_settings):
+    """
+    :param project_settings: Project settings (dict list).
+
+    :return: Number of actions in all categories (int).
+    """
+    return sum(len(project_settings[f"{category}_names"]) for category in CATEGORIES)
+
+
+class JsonProjectStorage:
+    """
+    Class used for storing every project as its own json file.
+    Single action edits are appended to a journal next to the project file,
+        the journal is compacted into the project file on the compact worker
+        once it is larger than JOURNAL_COMPACT_SIZE.
+    Files of a project are guarded by a lock shared with the compact worker.
+    """
+    name = "json"
+
+    def __init__(self, projects_folder):
+        """
+        :param projects_folder: Folder containing the project files (str).
+        """
+        self.projects_folder = projects_folder
+        self.lock = threading.Lock()
+
+        # Stores project name as key and a number that changes whenever
+        # the project file is replaced, renamed or removed as value
+        self.generations = {}
+
+    def get_project_path(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Path to the project file (str).
+        """
+        return f"{self.projects_folder}\\{project_name}.json"
+
+    def get_journal_path(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Path to the journal of the project (str).
+        """
+        return f"{self.projects_folder}\\{project_name}{JOURNAL_EXTENSION}"
+
+    def get_project_names(self):
+        """
+        :return: List of project names (list str).
+        """
+        return [file[:-len(".json")] for file in os.listdir(self.projects_folder)
+                if file.endswith(".json")]
+
+    def has_project(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: True if the project exists else False
+        """
+        return os.path.isfile(self.get_project_path(project_name))
+
+    def get_project_mtime(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Latest modification time of the project file and
+            its journal in nanoseconds (int).
+        """
+        mtime_ns = os.stat(self.get_project_path(project_name)).st_mtime_ns
+        try:
+            return max(mtime_ns, os.stat(self.get_journal_path(project_name)).st_mtime_ns)
+        except FileNotFoundError:
+            return mtime_ns
+
+    def get_project_index(self, known_projects):
+        """
+        Returns modification time and action count of every project
+            with a single listing of the projects folder.
+        Only projects that are new or changed compared to known_projects are parsed.
+
+        :param known_projects: Project name as key and dictionary with
+            'mtime_ns' and 'action_count' as value (dict).
+
+        :return: Same format as known_projects, for the projects on disk (dict).
+        """
+        project_mtimes = {}
+        journal_mtimes = {}
+        with os.scandir(self.projects_folder) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    project_mtimes[entry.name[:-len(".json")]] = entry.stat().st_mtime_ns
+                elif entry.name.endswith(JOURNAL_EXTENSION) and entry.is_file():
+                    journal_mtimes[entry.name[:-len(JOURNAL_EXTENSION)]] = \
+                        entry.stat().st_mtime_ns
+
+        project_index = {}
+        for project_name, mtime_ns in project_mtimes.items():
+            mtime_ns = max(mtime_ns, journal_mtimes.get(project_name, 0))
+
+            known = known_projects.get(project_name)
+            if known is not None and known["mtime_ns"] == mtime_ns:
+                project_index[project_name] = known
+                continue
+
+            # New or changed project
+            try:
+                action_count = count_project_actions(self.load_project(project_name))
+            except (OSError, ValueError, KeyError):
+                continue
+            project_index[project_name] = {"mtime_ns": mtime_ns,
+                                           "action_count": action_count}
+
+        return project_index
+
+    def load_project(self, project_name):
+        """
+        Reads the project file and replays its journal.
+
+        :param project_name: Name of a project (str).
+
+        :return: Project settings (dict list).
+        """
+        with self.lock:
+            with open(self.get_project_path(project_name), "r",
+                      encoding="utf-8") as project_file:
+                project_settings = json.load(project_file)
+            for operation in read_journal(self.get_journal_path(project_name)):
+                apply_operation(project_settings, operation)
+
+        return project_settings
+
+    def save_project(self, project_name, project_settings):
+        """
+        Writes the whole project, its journal is no longer needed.
+
+        :param project_name: Name of a project (str).
+        :param project_settings: Project settings (dict list).
+        """
+        data = json.dumps(project_settings, indent=4)
+        with self.lock:
+            write_file_atomically(self.get_project_path(project_name), data)
+            self.remove_journal(project_name)
+
+    def remove_journal(self, project_name):
+        """
+        Must be called while holding self.lock.
+
+        :param project_name: Name of a project (str).
+        """
+        self.generations[project_name] = self.generations.get(project_name, 0) + 1
+        try:
+            os.remove(self.get_journal_path(project_name))
+        except FileNotFoundError:
+            pass
+
+    def rename_project(self, old_project_name, new_project_name):
+        """
+        :param old_project_name: Old name of the project (str).
+        :param new_project_name: New name of the project (str).
+        """
+        with self.lock:
+            os.rename(self.get_project_path(old_project_name),
+                      self.get_project_path(new_project_name))
+            self.generations[old_project_name] = self.generations.get(old_project_name, 0) + 1
+            if os.path.isfile(self.get_journal_path(old_project_name)):
+                os.rename(self.get_journal_path(old_project_name),
+                          self.get_journal_path(new_project_name))
+
+    def remove_project(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+        """
+        with self.lock:
+            if self.has_project(project_name):
+                os.remove(self.get_project_path(project_name))
+            self.remove_journal(project_name)
+
+    def apply_operations(self, project_name, operations):
+        """
+        Appends operations to the journal of a project in a single write and
+            starts a compaction if the journal grew too large.
+
+        :param project_name: Name of a project (str).
+        :param operations: Operations, see apply_operation() (list dict).
+        """
+        with self.lock:
+            # A journal without its project file would never be compacted or removed
+            if not self.has_project(project_name):
+                raise FileNotFoundError(self.get_project_path(project_name))
+            journal_size = append_journal(self.get_journal_path(project_name), operations)
+
+        if journal_size > JOURNAL_COMPACT_SIZE:
+            COMPACT_EXECUTOR.submit(self.compact_project, project_name)
+
+    def compact_project(self, project_name):
+        """
+        Writes the project file with its journal applied and empties the journal.
+        The lock is released while the project is serialized,
+            operations appended in the meantime stay in the journal.
+        The modification time is kept, the content of the project did not change,
+            the files are replaced with it already set so the file watcher never sees a change.
+        Runs on the compact worker.
+
+        :param project_name: Name of a project (str).
+        """
+        journal_path = self.get_journal_path(project_name)
+        with self.lock:
+            generation = self.generations.get(project_name, 0)
+            try:
+                journal_size = os.path.getsize(journal_path)
+                with open(self.get_project_path(project_name), "r",
+                          encoding="utf-8") as project_file:
+                    project_settings = json.load(project_file)
+            except (OSError, ValueError):
+                return
+            for operation in read_journal(journal_path, size=journal_size):
+                apply_operation(project_settings, operation)
+
+        data = json.dumps(project_settings, indent=4)
+
+        with self.lock:
+            # Project was saved, renamed or removed in the meantime
+            if self.generations.get(project_name, 0) != generation:
+                return
+            try:
+                mtime_ns = self.get_project_mtime(project_name)
+                with open(journal_path, "rb") as journal_file:
+                    journal_file.seek(journal_size)
+                    remaining = journal_file.read()
+
+                write_file_atomically(self.get_project_path(project_name), data,
+                                      mtime_ns=mtime_ns)
+                if remaining:
+                    write_file_atomically(journal_path, remaining.decode("utf-8"),
+                                          mtime_ns=mtime_ns)
+                else:
+                    os.remove(journal_path)
+            except OSError:
+                # Journal is kept and replayed, compacted on a later append
+                return
+
+    def add_action(self, project_name, category, action_name, target, position=None):
+        """
+        Appends the new action to the journal of the project.
+
+        :param project_name: Name of a project (str).
+        :param category: 'application', 'directory' or 'website' (str).
+        :param action_name: Name of the action (str).
+        :param target: Target of the action (str).
+        :param position: Position in its category, last if None (int).
+        """
+        self.apply_operations(project_name, [{"op": "add",
+                                              "category": category,
+                                              "name": action_name,
+                                              "target": target,
+                                              "position": position}])
+
+    def remove_action(self, project_name, category, action_name):
+        """
+        Appends the removal of the action to the journal of the project.
+
+        :param project_name: Name of a project (str).
+        :param category: 'application', 'directory' or 'website' (str).
+        :param action_name: Name of the action (str).
+        """
+        self.apply_operations(project_name, [{"op": "remove",
+                                              "category": category,
+                                              "name": action_name}])
+
+
+class SqliteProjectStorage:
+    """
+    Class used for storing all projects in a single SQLite database.
+    Runs in WAL mode, actions are indexed by project and category and
+        single action edits only touch their own row.
+    Every write gives its project the next change number of the database,
+        it stands in for the modification time of a json project,
+        so changes made by another instance are noticed even if the action count is equal.
+    The connection is shared between threads and guarded by a lock.
+    """
+    name = "sqlite"
+
+    def __init__(self, database_path):
+        """
+        :param database_path: Path to the database file (str).
+        """
+        # Imported on first use, the json engine is the default
+        import sqlite3
+
+        self.database_path = database_path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(database_path, check_same_thread=False)
+
+        with self.lock, self.connection:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute("PRAGMA foreign_keys=ON")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS projects ("
+                "id INTEGER PRIMARY KEY, "
+                "name TEXT NOT NULL UNIQUE, "
+                "change_number INTEGER NOT NULL DEFAULT 0)"
+            )
+            # Databases created before change numbers were stored
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(projects)")]
+            if "change_number" not in columns:
+                self.connection.execute("ALTER TABLE projects "
+                                        "ADD COLUMN change_number INTEGER NOT NULL DEFAULT 0")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS actions ("
+                "project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE, "
+                "category TEXT NOT NULL, "
+                "position INTEGER NOT NULL, "
+                "name TEXT NOT NULL, "
+                "target TEXT NOT NULL, "
+                "PRIMARY KEY (project_id, category, name))"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS actions_by_position "
+                "ON actions (project_id, category, position)"
+            )
+
+    def get_project_id(self, project_name):
+        """
+        Must be called while holding self.lock.
+
+        :param project_name: Name of a project (str).
+
+        :return: Id of the project (int) or None.
+        """
+        row = self.connection.execute("SELECT id FROM projects WHERE name = ?",
+                                      (project_name,)).fetchone()
+
+        return row[0] if row else None
+
+    def get_project_names(self):
+        """
+        :return: List of project names (list str).
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT name FROM projects ORDER BY id").fetchall()
+
+        return [row[0] for row in rows]
+
+    def has_project(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: True if the project exists else False
+        """
+        with self.lock:
+            return self.get_project_id(project_name) is not None
+
+    def get_project_mtime(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Change number of the last write to the project (int).
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT change_number FROM projects WHERE name = ?",
+                                          (project_name,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(project_name)
+
+        return row[0]
+
+    def get_project_index(self, known_projects):
+        """
+        Returns the change number and action count of every project with a single query.
+
+        :param known_projects: Not needed, counts are always read from the database (dict).
+
+        :return: Project name as key and dictionary with
+            'mtime_ns' and 'action_count' as value (dict).
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT projects.name, projects.change_number, COUNT(actions.name) "
+                "FROM projects LEFT JOIN actions ON actions.project_id = projects.id "
+                "GROUP BY projects.id ORDER BY projects.id"
+            ).fetchall()
+
+        return {project_name: {"mtime_ns": change_number, "action_count": action_count}
+                for project_name, change_number, action_count in rows}
+
+    def load_project(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Project settings (dict list).
+        """
+        with self.lock:
+            project_id = self.get_project_id(project_name)
+            if project_id is None:
+                raise FileNotFoundError(project_name)
+            rows = self.connection.execute(
+                "SELECT category, name, target FROM actions "
+                "WHERE project_id = ? ORDER BY category, position",
+                (project_id,)
+            ).fetchall()
+
+        project_settings = {}
+        for category in CATEGORIES:
+            project_settings[f"{category}_names"] = []
+            project_settings[f"{category}_targets"] = []
+        for category, action_name, target in rows:
+            project_settings[f"{category}_names"].append(action_name)
+            project_settings[f"{category}_targets"].append(target)
+
+        return project_settings
+
+    def save_project(self, project_name, project_settings):
+        """
+        Replaces all actions of a project in a single transaction.
+
+        :param project_name: Name of a project (str).
+        :param project_settings: Project settings (dict list).
+        """
+        with self.lock, self.connection:
+            self.connection.execute("INSERT OR IGNORE INTO projects (name) VALUES (?)",
+                                    (project_name,))
+            project_id = self.get_project_id(project_name)
+            self.mark_changed(project_id)
+            self.connection.execute("DELETE FROM actions WHERE project_id = ?", (project_id,))
+            self.connection.executemany(
+                "INSERT INTO actions (project_id, category, position, name, target) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(project_id, category, position, action_name, target)
+                 for category in CATEGORIES
+                 for position, (action_name, target) in enumerate(
+                    zip(project_settings[f"{category}_names"],
+                        project_settings[f"{category}_targets"]))]
+            )
+
+    def rename_project(self, old_project_name, new_project_name):
+        """
+        :param old_project_name: Old name of the project (str).
+        :param new_project_name: New name of the project (str).
+        """
+        with self.lock, self.connection:
+            cursor = self.connection.execute("UPDATE projects SET name = ? WHERE name = ?",
+                                             (new_project_name, old_project_name))
+        if cursor.rowcount == 0:
+            raise FileNotFoundError(old_project_name)
+
+    def remove_project(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM projects WHERE name = ?", (project_name,))
+
+    def mark_changed(self, project_id):
+        """
+        Gives a project the next change number of the database.
+        Must be called while holding self.lock inside a transaction.
+
+        :param project_id: Id of the project (int).
+        """
+        self.connection.execute(
+            "UPDATE projects SET change_number = "
+            "(SELECT MAX(change_number) FROM projects) + 1 WHERE id = ?",
+            (project_id,)
+        )
+
+    def insert_action_row(self, project_id, category, action_name, target, position=None):
+        """
+        Inserts a single action row after the last action of its category or
+            at a position, the rows after it are moved down.
+        Must be called while holding self.lock inside a transaction.
+
+        :param project_id: Id of the project (int).
+        :param category: 'application', 'directory' or 'website' (str).
+        :param action_name: Name of the action (str).
+        :param target: Target of the action (str).
+        :param position: Position in its category, last if None (int).
+        """
+        if position is not None:
+            # Stored positions have gaps after removals, find the row now at position
+            row = self.connection.execute(
+                "SELECT position FROM actions WHERE project_id = ? AND category = ? "
+                "ORDER BY position LIMIT 1 OFFSET ?",
+                (project_id, category, position)
+            ).fetchone()
+            if row is not None:
+                self.connection.execute(
+                    "UPDATE actions SET position = position + 1 "
+                    "WHERE project_id = ? AND category = ? AND position >= ?",
+                    (project_id, category, row[0])
+                )
+                self.connection.execute(
+                    "INSERT INTO actions (project_id, category, position, name, target) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (project_id, category, row[0], action_name, target)
+                )
+                return
+
+        self.connection.execute(
+            "INSERT INTO actions (project_id, category, position, name, target) "
+            "SELECT ?, ?, COALESCE(MAX(position), -1) + 1, ?, ? FROM actions "
+            "WHERE project_id = ? AND category = ?",
+            (project_id, category, action_name, target, project_id, category)
+        )
+
+    def delete_action_row(self, project_id, category, action_name):
+        """
+        Deletes a single action row.
+        Must be called while holding self.lock inside a transaction.
+
+        :param project_id: Id of the project (int).
+        :param category: 'application', 'directory' or 'website' (str).
+        :param action_name: Name of the action (str).
+        """
+        self.connection.execute(
+            "DELETE FROM actions WHERE project_id = ? AND category = ? AND name = ?",
+            (project_id, category, action_name)
+        )
+
+    def apply_operations(self, project_name, operations):
+        """
+        Applies operations in a single transaction, only their rows are touched.
+
+        :param project_name: Name of a project (str).
+        :param operations: Operations, see apply_operation() (list dict).
+        """
+        with self.lock, self.connection:
+            project_id = self.get_project_id(project_name)
+            if project_id is None:
+                raise FileNotFoundError(project_name)
+            self.mark_changed(project_id)
+            for operation in operations:
+                if operation["op"] == "add":
+                    self.insert_action_row(project_id, operation["category"], operation["name"],
+                                           operation["target"], operation.get("position"))
+                else:
+                    self.delete_action_row(project_id, operation["category"], operation["name"])
+
+    def add_action(self, project_name, category, action_name, target, position=None):
+        """
+        Inserts a single action row.
+
+        :param project_name: Name of a project (str).
+        :param category: 'application', 'directory' or 'website' (str).
+        :param action_name: Name of the action (str).
+        :param target: Target of the action (str).
+        :param position: Position in its category, last if None (int).
+        """
+        with self.lock, self.connection:
+            project_id = self.get_project_id(project_name)
+            if project_id is None:
+                raise FileNotFoundError(project_name)
+            self.mark_changed(project_id)
+            self.insert_action_row(project_id, category, action_name, target, position)
+
+    def remove_action(self, project_name, category, action_name):
+        """
+        Deletes a single action row.
+
+        :param project_name: Name of a project (str).
+        :param category: 'application', 'directory' or 'website' (str).
+        :param action_name: Name of the action (str).
+        """
+        with self.lock, self.connection:
+            project_id = self.get_project_id(project_name)
+            if project_id is None:
+                raise FileNotFoundError(project_name)
+            self.mark_changed(project_id)
+            self.delete_action_row(project_id, category, action_name)
+
+
+def migrate_json_projects(json_storage, sqlite_storage):
+    """
+    Copies every project from the one-json-file-per-project layout
+        into the SQLite database.
+    Projects already in the database are left untouched.
+
+    :param json_storage: Source storage (JsonProjectStorage).
+    :param sqlite_storage: Destination storage (SqliteProjectStorage).
+
+    :return: Number of migrated projects (int).
+    """
+    migrated = 0
+    for project_name in json_storage.get_project_names():
+        if sqlite_storage.has_project(project_name):
+            continue
+        try:
+            project_settings = json_storage.load_project(project_name)
+        except (OSError, ValueError):
+            continue
+        sqlite_storage.save_project(project_name, project_settings)
+        migrated += 1
+
+    return migrated
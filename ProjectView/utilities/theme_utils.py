@@ -0,0 +1,95 @@
+"""
+Utilities for applying color settings to live widgets.
+"""
+import customtkinter as ctk
+
+# Variables
+from ProjectView.app_variables import settings as app_settings
+
+
+def configure_widget_colors(widget, fg_color=None):
+    """
+    Applies the current color settings to a single widget.
+    Buttons use the muted button color unless fg_color is passed in.
+
+    :param widget: CTkButton, CTkOptionMenu or CTkLabel (obj).
+    :param fg_color: Button color overriding the muted button color (str).
+    """
+    if isinstance(widget, ctk.CTkOptionMenu):
+        widget.configure(text_color=app_settings.TEXT_COLOR,
+                         dropdown_text_color=app_settings.TEXT_COLOR,
+                         fg_color=app_settings.BUTTON_COLOR_MUTED,
+                         button_color=app_settings.BUTTON_COLOR_MUTED,
+                         button_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+                         dropdown_fg_color=app_settings.BUTTON_COLOR_MUTED,
+                         dropdown_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED)
+    elif isinstance(widget, ctk.CTkButton):
+        widget.configure(text_color=app_settings.TEXT_COLOR,
+                         fg_color=fg_color or app_settings.BUTTON_COLOR_MUTED,
+                         hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED)
+    elif isinstance(widget, ctk.CTkLabel):
+        widget.configure(text_color=app_settings.TEXT_COLOR)
+
+
+def configure_action_pair_colors(remove_button, action_button):
+    """
+    Applies the current color settings to a user widget pair.
+
+    :param remove_button: '-' button of the action (obj).
+    :param action_button: Button opening the action's target (obj).
+    """
+    configure_widget_colors(remove_button)
+    configure_widget_colors(action_button, fg_color=app_settings.BUTTON_COLOR)
+
+
+def apply_color_settings(app):
+    """
+    Walks all live widgets of the app, its extra settings window and
+        its quick launch window and applies the current color settings to them.
+    Geometry is only recalculated once, after all widgets are configured.
+
+    :param app: Application window (obj).
+    """
+    # Window and frames
+    app.configure(fg_color=app_settings.WINDOW_COLOR)
+    for frame in app.frames:
+        frame.configure(fg_color=app_settings.FRAME_COLOR)
+
+    # Settings and basic widgets
+    for widget in app.settings_widgets + app.basic_widgets:
+        configure_widget_colors(widget)
+
+    # Visible user widget rows and scrollbars
+    for action_rows in app.action_rows.values():
+        for action_row in action_rows:
+            configure_action_pair_colors(remove_button=action_row[0],
+                                         action_button=action_row[1])
+    for scrollbar in app.scrollbars.values():
+        scrollbar.configure(button_color=app_settings.BUTTON_COLOR_MUTED,
+                            button_hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED)
+
+    # Hidden user widgets waiting for reuse
+    for pool in app.widget_pools.values():
+        for remove_button, action_button in pool.idle_pairs:
+            configure_action_pair_colors(remove_button=remove_button,
+                                         action_button=action_button)
+
+    # Extra settings window
+    if app.toplevel_window is not None and app.toplevel_window.winfo_exists():
+        app.toplevel_window.configure(fg_color=app_settings.WINDOW_COLOR)
+        for widget in app.toplevel_window.general_settings_widgets + \
+                app.toplevel_window.frame_settings_widgets:
+            configure_widget_colors(widget)
+
+    # Quick launch window
+    if app.quick_launch_window is not None and app.quick_launch_window.winfo_exists():
+        app.quick_launch_window.configure(fg_color=app_settings.WINDOW_COLOR)
+        app.quick_launch_window.search_entry.configure(text_color=app_settings.TEXT_COLOR,
+                                                       fg_color=app_settings.FRAME_COLOR,
+                                                       border_color=app_settings.BUTTON_COLOR_MUTED)
+        for widget in app.quick_launch_window.result_buttons:
+            configure_widget_colors(widget)
+        app.quick_launch_window.highlight_selected_result()
+
+    # Single geometry and redraw pass
+    app.update_idletasks()
@@ -0,0 +1,260 @@
+"""
+Utilities for the launch statistics of actions and the order of the user frames.
+Statistics are kept in memory and written to a compact json file in batches,
+    a launch never waits for the disk.
+"""
+import json
+import math
+import time
+
+from ProjectView.utilities.general_utils import APP_SETTINGS_FOLDER, get_user_setting, \
+    set_user_settings, write_file_atomically, LazyExecutor
+from ProjectView.utilities.storage_utils import CATEGORIES
+
+LAUNCH_STATS_FILE = f"{APP_SETTINGS_FOLDER}\\launch_stats.json"
+# Milliseconds between writes of changed statistics
+LAUNCH_STATS_SAVE_INTERVAL = 30000
+# Seconds after which a launch counts half in the frecency order
+FRECENCY_HALF_LIFE = 7 * 24 * 60 * 60
+# Seconds without a launch after which an action is reported as unused
+UNUSED_ACTION_AGE = 90 * 24 * 60 * 60
+
+# Order modes of a user frame, 'added' shows actions in the order they were added
+ORDER_MODES = ("added", "frecency", "recent")
+# Appended to the frame name label per order mode
+ORDER_MODE_LABELS = {"added": "", "frecency": " (frequent)", "recent": " (recent)"}
+
+# Writes the statistics file, one write at a time
+LAUNCH_STATS_EXECUTOR = LazyExecutor(max_workers=1,
+                                     thread_name_prefix="ProjectView-stats")
+
+
+def get_frecency_key(action_stats):
+    """
+    Sort key of the frecency order, launches count less the older they are.
+    log2(count) + last_used / half life orders actions like
+        count * 0.5 ** (age / half life) does, but does not change as time passes,
+        so actions that are not launched never have to be sorted again.
+
+    :param action_stats: [launch count, last used timestamp] (list) or None.
+
+    :return: Key, higher is shown first (float).
+    """
+    if action_stats is None:
+        return -math.inf
+
+    return math.log2(action_stats[0]) + action_stats[1] / FRECENCY_HALF_LIFE
+
+
+def get_recent_key(action_stats):
+    """
+    Sort key of the most recently used order.
+
+    :param action_stats: [launch count, last used timestamp] (list) or None.
+
+    :return: Key, higher is shown first (float).
+    """
+    if action_stats is None:
+        return -math.inf
+
+    return action_stats[1]
+
+
+# Stores order mode as key and sort key of its actions as value
+ORDER_KEYS = {"frecency": get_frecency_key, "recent": get_recent_key}
+
+
+def get_order_mode(frame_index):
+    """
+    :param frame_index: Index of a user frame (int).
+
+    :return: Order mode from the '<category>_order' setting (str), 'added' if invalid.
+    """
+    order_mode = get_user_setting(f"{CATEGORIES[frame_index - 1]}_order", "added")
+
+    return order_mode if order_mode in ORDER_MODES else "added"
+
+
+def set_order_mode(frame_index, order_mode):
+    """
+    :param frame_index: Index of a user frame (int).
+    :param order_mode: One of ORDER_MODES (str).
+    """
+    set_user_settings(settings=[f"{CATEGORIES[frame_index - 1]}_order"],
+                      values=[order_mode])
+
+
+def get_next_order_mode(order_mode):
+    """
+    :param order_mode: Current order mode (str).
+
+    :return: Order mode after it in ORDER_MODES (str).
+    """
+    return ORDER_MODES[(ORDER_MODES.index(order_mode) + 1) % len(ORDER_MODES)]
+
+
+class LaunchStats:
+    """
+    Class used for storing how often and when the actions of every project were launched.
+    Stores project name as key and a dictionary with action name as key and
+        [launch count, last used timestamp] as value, the file is read on first use.
+    Changes are only written by write() and flush(),
+        the app calls write() every LAUNCH_STATS_SAVE_INTERVAL.
+    """
+
+    def __init__(self, stats_file=LAUNCH_STATS_FILE):
+        """
+        :param stats_file: Path to the statistics file (str).
+        """
+        self.stats_file = stats_file
+        self.projects = None
+
+        # True while there are changes that are not written
+        self.is_dirty = False
+        self.write_future = None
+
+    def get_project_stats(self, project_name):
+        """
+        :param project_name: Name of a project (str).
+
+        :return: Action name as key and [launch count, last used timestamp] as value,
+            changed in place by later launches (dict).
+        """
+        if self.projects is None:
+            try:
+                with open(self.stats_file, "r", encoding="utf-8") as stats_file:
+                    self.projects = json.load(stats_file)["projects"]
+            except (OSError, ValueError, KeyError, TypeError):
+                self.projects = {}
+
+        return self.projects.setdefault(project_name, {})
+
+    def record_launch(self, project_name, action_name, timestamp=None):
+        """
+        :param project_name: Name of a project (str).
+        :param action_name: Name of the launched action (str).
+        :param timestamp: Time of the launch in seconds, now if None (int).
+        """
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        project_stats = self.get_project_stats(project_name)
+        count = project_stats[action_name][0] if action_name in project_stats else 0
+        project_stats[action_name] = [count + 1, timestamp]
+        self.is_dirty = True
+
+    def forget_action(self, project_name, action_name):
+        """
+        :param project_name: Name of a project (str).
+        :param action_name: Name of a removed action (str).
+        """
+        if self.get_project_stats(project_name).pop(action_name, None) is not None:
+            self.is_dirty = True
+
+    def rename_project(self, old_project_name, new_project_name):
+        """
+        Moves the statistics, order keys of the project keep working.
+
+        :param old_project_name: Old name of the project (str).
+        :param new_project_name: New name of the project (str).
+        """
+        self.projects[new_project_name] = self.get_project_stats(old_project_name)
+        del self.projects[old_project_name]
+        self.is_dirty = True
+
+    def remove_project(self, project_name):
+        """
+        :param project_name: Name of a removed project (str).
+        """
+        self.get_project_stats(project_name)
+        del self.projects[project_name]
+        self.is_dirty = True
+
+    def get_order_key(self, project_name, order_mode):
+        """
+        :param project_name: Name of a project (str).
+        :param order_mode: One of ORDER_MODES (str).
+
+        :return: Function returning the sort key of an action, higher first (func) or
+            None to keep the order the actions were added in.
+        """
+        if order_mode not in ORDER_KEYS:
+            return None
+
+        project_stats = self.get_project_stats(project_name)
+        key = ORDER_KEYS[order_mode]
+
+        return lambda action: key(project_stats.get(action.name))
+
+    def get_launch_report(self, project):
+        """
+        Lists the actions of a project to find the ones that can be removed,
+            never launched actions first, then the least frecent ones.
+
+        :param project: Project (Project).
+
+        :return: List of (frame_index, action name, launch count,
+            last used timestamp or None) tuples (list tuple).
+        """
+        project_stats = self.get_project_stats(project.name)
+        report = [(frame_index, action.name) + tuple(project_stats.get(action.name, (0, None)))
+                  for frame_index, actions in project.actions.items()
+                  for action in actions]
+        report.sort(key=lambda entry: get_frecency_key(project_stats.get(entry[1])))
+
+        return report
+
+    def get_unused_actions(self, project, max_age=UNUSED_ACTION_AGE, timestamp=None):
+        """
+        :param project: Project (Project).
+        :param max_age: Seconds without a launch after which an action is unused (int).
+        :param timestamp: Current time in seconds, now if None (int).
+
+        :return: List of (frame_index, action name) tuples of actions
+            not launched within max_age (list tuple).
+        """
+        timestamp = int(time.time()) if timestamp is None else timestamp
+
+        return [(frame_index, name) for frame_index, name, _, last_used
+                in self.get_launch_report(project)
+                if last_used is None or timestamp - last_used > max_age]
+
+    def write(self):
+        """
+        Writes the statistics on the statistics worker if they changed.
+        Skipped while the previous write is running, the next call writes the changes.
+
+        :return: Future of the write (obj) or None if nothing is written.
+        """
+        if self.write_future is not None:
+            if not self.write_future.done():
+                return None
+            if self.write_future.exception() is not None:
+                # Previous write failed, write everything again
+                self.is_dirty = True
+
+        if not self.is_dirty:
+            return None
+
+        # Serialized here, the worker must not read a dictionary the app changes
+        data = json.dumps({"projects": {project_name: project_stats
+                                        for project_name, project_stats in self.projects.items()
+                                        if project_stats}},
+                          separators=(",", ":"))
+        self.is_dirty = False
+        self.write_future = LAUNCH_STATS_EXECUTOR.submit(write_file_atomically,
+                                                         self.stats_file, data)
+
+        return self.write_future
+
+    def flush(self):
+        """
+        Writes changed statistics and waits until they are written.
+        Called when the app is closed.
+        """
+        # Imported with the first write, the command line never writes
+        from concurrent.futures import wait
+
+        if self.write_future is not None:
+            wait([self.write_future])
+        future = self.write()
+        if future is not None:
+            wait([future])
@@ -0,0 +1,71 @@
+"""
+Utilities for noticing projects changed outside the app,
+    by another instance, a sync tool or a script.
+"""
+from ProjectView.utilities.app_window_utils import get_project_storage
+from ProjectView.utilities.manifest_utils import PROJECT_MANIFEST, replace_project_index
+
+# Milliseconds between checks of the projects folder
+PROJECT_WATCH_INTERVAL = 1000
+
+
+class ProjectWatcher:
+    """
+    Class used for finding added, removed, renamed and changed projects.
+    The storage engine is compared with the projects manifest,
+        which the app updates after each of its own writes,
+        so only changes made outside the app are reported.
+    Uses a single listing of the projects folder per check,
+        only new or changed project files are parsed.
+    The SQLite engine reports a change number instead of a modification time,
+        see SqliteProjectStorage.
+    """
+
+    def __init__(self, project_storage=None):
+        """
+        :param project_storage: Storage engine to watch,
+            the one of get_project_storage() if None (obj).
+        """
+        self.project_storage = project_storage
+
+    def check(self):
+        """
+        Compares the stored projects with the manifest and
+            updates the manifest to match them.
+
+        :return: Dictionary with lists of project names for 'added', 'removed' and
+            'changed' and a list of (old_name, new_name) tuples for 'renamed' (dict) or
+            None if nothing changed.
+        """
+        project_storage = self.project_storage or get_project_storage()
+        known_projects = PROJECT_MANIFEST["projects"]
+        try:
+            projects = project_storage.get_project_index(known_projects=known_projects)
+        except OSError:
+            # Projects folder is not reachable right now, try again on next check
+            return None
+        if projects == known_projects:
+            return None
+
+        added = [name for name in projects if name not in known_projects]
+        removed = [name for name in known_projects if name not in projects]
+        changed = [name for name in projects
+                   if name in known_projects and projects[name] != known_projects[name]]
+
+        # Renaming keeps the modification time or change number,
+        # a removed and an added project with equal entries were renamed.
+        # Projects never written since change numbers were stored report 0 and are never matched
+        renamed = []
+        for old_name in list(removed):
+            if not known_projects[old_name]["mtime_ns"]:
+                continue
+            new_name = next((name for name in added
+                             if projects[name] == known_projects[old_name]), None)
+            if new_name is not None:
+                renamed.append((old_name, new_name))
+                removed.remove(old_name)
+                added.remove(new_name)
+
+        replace_project_index(projects)
+
+        return {"added": added, "removed": removed, "renamed": renamed, "changed": changed}
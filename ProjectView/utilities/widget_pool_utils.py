@@ -0,0 +1,103 @@
+"""
+Utilities for recycling user widgets between project switches.
+"""
+import customtkinter as ctk
+
+# Utilities
+from ProjectView.utilities.font_utils import get_font
+# Variables
+from ProjectView.app_variables import settings as app_settings
+
+
+class ActionButtonPool:
+    """
+    Class used for keeping user widgets alive across project switches.
+    Every action is displayed as a pair of buttons, a '-' button and an action button.
+    Released pairs are hidden and kept, acquired pairs are reconfigured by the caller.
+    New buttons are only created when no idle pair is left.
+    """
+
+    def __init__(self, frame, enabled=True):
+        """
+        :param frame: Frame the buttons are placed on (obj).
+        :param enabled: Recycles released buttons if True,
+            destroys them if False (bool).
+        """
+        self.frame = frame
+        self.enabled = enabled
+
+        # Stores hidden button pairs ready for reuse
+        self.idle_pairs = []
+
+        # Stores counters
+        self.created_count = 0
+        self.reused_count = 0
+
+    def create_pair(self):
+        """
+        Creates a '-' button and an action button without text or command.
+
+        :return: Tuple containing the remove button and the action button (obj).
+        """
+        remove_button = ctk.CTkButton(
+            self.frame,
+            text="-",
+            width=30,
+            height=25,
+            fg_color=app_settings.BUTTON_COLOR_MUTED,
+            hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+            font=get_font(size=12, weight="bold"),
+            text_color=app_settings.TEXT_COLOR,
+        )
+        action_button = ctk.CTkButton(
+            self.frame,
+            text="",
+            width=175,
+            height=25,
+            fg_color=app_settings.BUTTON_COLOR,
+            hover_color=app_settings.BUTTON_COLOR_HIGHLIGHTED,
+            font=get_font(size=14),
+            text_color=app_settings.TEXT_COLOR,
+        )
+        self.created_count += 1
+
+        return remove_button, action_button
+
+    def acquire(self):
+        """
+        Returns an idle button pair or a newly created one if the pool is empty.
+        The buttons are not placed, caller configures and grids them.
+
+        :return: Tuple containing the remove button and the action button (obj).
+        """
+        if self.enabled and self.idle_pairs:
+            self.reused_count += 1
+            return self.idle_pairs.pop()
+
+        return self.create_pair()
+
+    def release(self, remove_button, action_button):
+        """
+        Hides a button pair and stores it for reuse.
+        If the pool is disabled, the buttons are destroyed instead.
+
+        :param remove_button: '-' button of the action (obj).
+        :param action_button: Button opening the action's target (obj).
+        """
+        if not self.enabled:
+            remove_button.destroy()
+            action_button.destroy()
+            return
+
+        remove_button.grid_remove()
+        action_button.grid_remove()
+        self.idle_pairs.append((remove_button, action_button))
+
+    def clear(self):
+        """
+        Destroys all idle button pairs.
+        """
+        for remove_button, action_button in self.idle_pairs:
+            remove_button.destroy()
+            action_button.destroy()
+        self.idle_pairs = []
@@ -0,0 +1,97 @@
+"""
+Measures memory per action and name lookup time for a 10k action project,
+    comparing the project model with the previous layout of
+    two [name, target, widget] lists per action and a flat list of names.
+Run from the repository root:
+    python benchmarks/action_memory.py
+"""
+import time
+import tracemalloc
+
+from bench_utils import prepare_package_import, get_fake_project_info
+
+prepare_package_import()
+
+from ProjectView.utilities.project_model_utils import Project  # noqa: E402
+
+ACTION_COUNT = 10000
+LOOKUPS = 1000
+
+
+def build_legacy_layout(widgets_info):
+    """
+    Builds the widget lists the app window used before the project model.
+
+    :param widgets_info: Names and targets like get_project_widgets_info() returns (list list).
+
+    :return: Widget lists per frame and the flat list of action names (tuple list).
+    """
+    widget_lists = []
+    names = []
+    for frame_index in range(3):
+        widget_list = []
+        for name, target in zip(widgets_info[frame_index * 2], widgets_info[frame_index * 2 + 1]):
+            # Stored once for the '-' button and once for the action button
+            widget_list.append([name, target, None])
+            widget_list.append([name, target, None])
+            names.append(name)
+        widget_lists.append(widget_list)
+
+    return widget_lists, names
+
+
+def measure_memory(function):
+    """
+    :param function: Function building a data structure (func).
+
+    :return: The built structure and the bytes allocated for it (tuple).
+    """
+    tracemalloc.start()
+    result = function()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, allocated
+
+
+def measure_lookups(function, names):
+    """
+    :param function: Function called with a name (func).
+    :param names: Names to look up (list str).
+
+    :return: Mean duration of a call in microseconds (float).
+    """
+    start = time.perf_counter()
+    for name in names:
+        function(name)
+
+    return (time.perf_counter() - start) / len(names) * 1000000
+
+
+def main():
+    widgets_info = get_fake_project_info(ACTION_COUNT, "a")
+    # Names and targets are shared by both layouts, only the containers are measured
+    (widget_lists, legacy_names), legacy_bytes = measure_memory(
+        lambda: build_legacy_layout(widgets_info))
+    project, project_bytes = measure_memory(
+        lambda: Project.from_widgets_info("Project A", widgets_info))
+
+    # Look up the last actions of the applications frame, the worst case for a scan
+    lookup_names = widgets_info[0][-LOOKUPS:]
+    legacy_lookup = measure_lookups(
+        lambda name: next(info for info in widget_lists[0][1::2] if info[0] == name),
+        lookup_names)
+    project_lookup = measure_lookups(lambda name: project.get_action(1, name), lookup_names)
+    legacy_unique = measure_lookups(lambda name: name in legacy_names, lookup_names)
+    project_unique = measure_lookups(lambda name: name in project.action_names, lookup_names)
+
+    print(f"{ACTION_COUNT} actions")
+    print(f"  {'':<24}{'previous':>12}{'model':>12}")
+    print(f"  {'bytes per action':<24}{legacy_bytes / ACTION_COUNT:>12.1f}"
+          f"{project_bytes / ACTION_COUNT:>12.1f}")
+    print(f"  {'name lookup (us)':<24}{legacy_lookup:>12.2f}{project_lookup:>12.2f}")
+    print(f"  {'uniqueness check (us)':<24}{legacy_unique:>12.2f}{project_unique:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Measures a burst of action edits in a json project,
+    comparing storing every edit with the autosaver writing the burst once.
+Timers of the window are run by hand, so the delay itself is not measured.
+Run from the repository root:
+    python benchmarks/autosave_burst.py
+"""
+import os
+import tempfile
+import time
+
+from bench_utils import prepare_package_import, get_fake_project_info, print_results
+
+prepare_package_import()
+
+from ProjectView.utilities.autosave_utils import Autosaver  # noqa: E402
+from ProjectView.utilities.journal_utils import COMPACT_EXECUTOR  # noqa: E402
+from ProjectView.utilities.project_model_utils import Project  # noqa: E402
+from ProjectView.utilities.storage_utils import JsonProjectStorage  # noqa: E402
+
+ACTION_COUNT = 1000
+EDITS = 20
+
+
+class ManualWindow:
+    """
+    Stands in for the app window, scheduled functions run when run_timers() is called.
+    """
+
+    def __init__(self):
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, ms, function):
+        self.next_id += 1
+        self.timers[self.next_id] = function
+        return self.next_id
+
+    def after_cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def run_timers(self):
+        timers, self.timers = self.timers, {}
+        for function in timers.values():
+            function()
+
+
+def get_operation(i):
+    """
+    :param i: Number of the edit (int).
+
+    :return: Operation adding a new action (dict).
+    """
+    return {"op": "add", "category": "application", "name": f"edit {i}",
+            "target": f"edit {i}", "position": None}
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        project_storage = JsonProjectStorage(projects_folder=os.path.join(folder, "projects"))
+        project_settings = Project.from_widgets_info(
+            "Project", get_fake_project_info(ACTION_COUNT, "a")).get_settings()
+
+        # Every edit stored right away
+        project_storage.save_project("Project", project_settings)
+        start = time.perf_counter()
+        for i in range(EDITS):
+            project_storage.apply_operations("Project", [get_operation(i)])
+        per_edit = (time.perf_counter() - start) * 1000
+        COMPACT_EXECUTOR.submit(lambda: None).result()
+
+        # Edits queued, the burst is written once after the delay
+        project_storage.save_project("Project", project_settings)
+        window = ManualWindow()
+        autosaver = Autosaver(window=window,
+                              store_operations=project_storage.apply_operations,
+                              on_stored=lambda project_name, operations: None,
+                              on_failed=lambda project_name, operations: None,
+                              delay=0)
+        start = time.perf_counter()
+        for i in range(EDITS):
+            autosaver.add_operation("Project", get_operation(i))
+        queued = (time.perf_counter() - start) * 1000
+        window.run_timers()
+        autosaver.flush()
+
+        print_results(f"{EDITS} edits of a project with {ACTION_COUNT} actions",
+                      [(f"store every edit, {EDITS} writes", per_edit),
+                       (f"autosave, edits only, {autosaver.write_count} write", queued)])
+
+        if autosaver.write_count != 1:
+            print(f"Expected one write, got {autosaver.write_count}")
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Shared helpers for the ProjectView benchmarks.
+"""
+import os
+import sys
+
+REPOSITORY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def prepare_package_import():
+    """
+    Makes the ProjectView package importable from the benchmarks folder.
+    Points sys.argv[0] at ProjectView.pyw so the settings and projects
+        folders resolve like they do for the real app.
+    Must be called before any ProjectView module is imported.
+    """
+    sys.argv[0] = os.path.join(REPOSITORY_DIR, "ProjectView.pyw")
+    if REPOSITORY_DIR not in sys.path:
+        sys.path.insert(0, REPOSITORY_DIR)
+
+
+def get_fake_project_info(action_count, prefix):
+    """
+    Returns project widgets information like get_project_widgets_info() does,
+        with action_count actions spread over the three user frames.
+
+    :param action_count: Total number of actions in the project (int).
+    :param prefix: Prefix used for names and targets, keeps projects apart (str).
+
+    :return: Names and targets of the fake project widgets (list str).
+    """
+    info = []
+    for frame_index in range(3):
+        count = action_count // 3 + (1 if frame_index < action_count % 3 else 0)
+        info.append([f"{prefix} {frame_index} {i}" for i in range(count)])
+        info.append([f"{prefix}/{frame_index}/{i}" for i in range(count)])
+
+    return info
+
+
+def print_results(title, results):
+    """
+    Prints benchmark results as an aligned table.
+
+    :param title: Title printed above the table (str).
+    :param results: List of (label, milliseconds) tuples (list).
+    """
+    print(title)
+    width = max(len(label) for label, _ in results)
+    for label, milliseconds in results:
+        print(f"  {label:<{width}}  {milliseconds:9.2f} ms")
@@ -0,0 +1,126 @@
+"""
+Measures the cold start of the command line launch path,
+    from starting the interpreter until the target is opened and the process exits.
+Every run starts a fresh interpreter, an extra run with -X importtime
+    fails the benchmark if tkinter or customtkinter is imported.
+Opens the given action. Without one a temporary project is created with an action
+    whose target does not exist, so the project is read and the action found,
+    only opening the target is skipped.
+Close the app first, --open is handed to an open window.
+Run from the repository root:
+    python benchmarks/cli_launch.py ["Project/Action"]
+"""
+import subprocess
+import sys
+import time
+from statistics import median
+
+from bench_utils import REPOSITORY_DIR, prepare_package_import, print_results
+
+prepare_package_import()
+
+from ProjectView.utilities.app_window_utils import get_project_storage  # noqa: E402
+from ProjectView.utilities.app_window_utils import get_fresh_project_settings  # noqa: E402
+
+RUNS = 10
+# Project and action created if no action is given
+BENCHMARK_PROJECT = "Benchmark"
+BENCHMARK_ACTION = "Missing target"
+# Target of the benchmark action, opening it fails after every other step
+BENCHMARK_TARGET = "ProjectView benchmark missing target.exe"
+# Modules the command line must not import
+GUI_MODULES = ["tkinter", "customtkinter"]
+
+
+def run_cli(action_path):
+    """
+    Runs ProjectView.pyw --open once in a fresh interpreter.
+
+    :param action_path: Project and action name, e.g. 'Project/Action' (str).
+
+    :return: Wall time in milliseconds (float).
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "ProjectView.pyw", "--open", action_path],
+                   cwd=REPOSITORY_DIR, capture_output=True)
+
+    return (time.perf_counter() - start) * 1000
+
+
+def get_loaded_gui_modules(action_path):
+    """
+    Runs ProjectView.pyw --open once with -X importtime.
+
+    :param action_path: Project and action name, e.g. 'Project/Action' (str).
+
+    :return: GUI modules that were imported (list str).
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "ProjectView.pyw",
+                              "--open", action_path],
+                             cwd=REPOSITORY_DIR, capture_output=True, text=True)
+
+    # Import times are written to stderr as 'import time: self | cumulative | name'
+    imported = {line.rsplit("|", 1)[-1].strip() for line in process.stderr.splitlines()
+                if line.startswith("import time:")}
+
+    return [module for module in GUI_MODULES if module in imported]
+
+
+def measure(action_path):
+    """
+    Prints the cold start of opening an action and
+        exits with 1 if a GUI module is imported.
+
+    :param action_path: Project and action name, e.g. 'Project/Action' (str).
+    """
+    wall_times = [run_cli(action_path) for _ in range(RUNS)]
+    # Interpreter startup alone, the part the app cannot change
+    interpreter_times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], capture_output=True)
+        interpreter_times.append((time.perf_counter() - start) * 1000)
+
+    print_results(f"Command line launch of '{action_path}', median of {RUNS} runs",
+                  [("cold start to exit", median(wall_times)),
+                   ("interpreter startup only", median(interpreter_times))])
+
+    loaded = get_loaded_gui_modules(action_path)
+
+    if loaded:
+        print(f"Imported by the command line, must not be: {', '.join(sorted(loaded))}")
+        sys.exit(1)
+
+
+def create_benchmark_project():
+    """
+    Stores the benchmark project with a single action.
+
+    :return: Action path of the action, e.g. 'Project/Action' (str).
+    """
+    project_storage = get_project_storage()
+    if project_storage.has_project(BENCHMARK_PROJECT):
+        print(f"Project '{BENCHMARK_PROJECT}' already exists, pass an action instead")
+        sys.exit(1)
+
+    project_settings = get_fresh_project_settings()
+    project_settings["application_names"].append(BENCHMARK_ACTION)
+    project_settings["application_targets"].append(BENCHMARK_TARGET)
+    project_storage.save_project(BENCHMARK_PROJECT, project_settings)
+
+    return f"{BENCHMARK_PROJECT}/{BENCHMARK_ACTION}"
+
+
+def main():
+    if len(sys.argv) > 1:
+        measure(sys.argv[1])
+        return
+
+    action_path = create_benchmark_project()
+    try:
+        measure(action_path)
+    finally:
+        get_project_storage().remove_project(BENCHMARK_PROJECT)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Measures storing a single action change in a json project,
+    comparing the journal append with rewriting the whole project file.
+Run from the repository root:
+    python benchmarks/journal_append.py
+"""
+import os
+import tempfile
+import time
+from statistics import median
+
+from bench_utils import prepare_package_import, get_fake_project_info, print_results
+
+prepare_package_import()
+
+from ProjectView.utilities.journal_utils import COMPACT_EXECUTOR  # noqa: E402
+from ProjectView.utilities.project_model_utils import Project  # noqa: E402
+from ProjectView.utilities.storage_utils import JsonProjectStorage  # noqa: E402
+
+ACTION_COUNTS = [10, 1000, 100000]
+EDITS = 50
+
+
+def rewrite_action(project_storage, project_name, action_name):
+    """
+    Stores a new action the way the json engine did before the journal.
+
+    :param project_storage: Storage the project is in (JsonProjectStorage).
+    :param project_name: Name of a project (str).
+    :param action_name: Name of the new action (str).
+    """
+    project_settings = project_storage.load_project(project_name)
+    project_settings["application_names"].append(action_name)
+    project_settings["application_targets"].append(action_name)
+    project_storage.save_project(project_name, project_settings)
+
+
+def measure_edits(function):
+    """
+    :param function: Function storing one edit, called with the edit number (func).
+
+    :return: Median duration of an edit in milliseconds (float).
+    """
+    timings = []
+    for i in range(EDITS):
+        start = time.perf_counter()
+        function(i)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return median(timings)
+
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory() as folder:
+        project_storage = JsonProjectStorage(projects_folder=os.path.join(folder, "projects"))
+        for action_count in ACTION_COUNTS:
+            project_settings = Project.from_widgets_info(
+                "Project", get_fake_project_info(action_count, "a")).get_settings()
+
+            project_storage.save_project("Project", project_settings)
+            results.append((f"{action_count} actions, rewrite",
+                            measure_edits(lambda i: rewrite_action(
+                                project_storage, "Project", f"rewrite {i}"))))
+
+            project_storage.save_project("Project", project_settings)
+            results.append((f"{action_count} actions, journal append",
+                            measure_edits(lambda i: project_storage.add_action(
+                                "Project", "application", f"append {i}", f"append {i}"))))
+
+            # Let a started compaction finish before the project is replaced
+            COMPACT_EXECUTOR.submit(lambda: None).result()
+
+    print_results(f"Store one new action, median of {EDITS} edits", results)
+
+
+if __name__ == '__main__':
+    main()
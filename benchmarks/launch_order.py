@@ -0,0 +1,67 @@
+"""
+Measures reordering a frame after a launch in the frecency order,
+    comparing moving only the launched action with sorting the whole frame.
+Run from the repository root:
+    python benchmarks/launch_order.py
+"""
+import random
+import time
+from statistics import median
+
+from bench_utils import prepare_package_import, get_fake_project_info, print_results
+
+prepare_package_import()
+
+from ProjectView.utilities.project_model_utils import Project  # noqa: E402
+from ProjectView.utilities.usage_utils import LaunchStats  # noqa: E402
+
+ACTION_COUNTS = [100, 10000, 100000]
+LAUNCHES = 50
+
+
+def measure_launches(project, launch_stats, names, reorder):
+    """
+    :param project: Project with frame 1 in frecency order (Project).
+    :param launch_stats: Statistics the order key reads (LaunchStats).
+    :param names: Names of the launched actions, in launch order (list str).
+    :param reorder: Function reordering frame 1 after a launch,
+        called with the name of the launched action (func).
+
+    :return: Median duration of a reorder in milliseconds (float).
+    """
+    timings = []
+    for i, name in enumerate(names):
+        launch_stats.record_launch(project.name, name, timestamp=1_000_000 + i)
+        start = time.perf_counter()
+        reorder(name)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return median(timings)
+
+
+def main():
+    results = []
+    for action_count in ACTION_COUNTS:
+        widgets_info = get_fake_project_info(action_count, "a")
+        names = random.Random(action_count).choices(widgets_info[0], k=LAUNCHES)
+
+        for label in ("sort frame", "move launched action"):
+            # Fresh statistics, every run starts from the same order
+            launch_stats = LaunchStats(stats_file="")
+            launch_stats.projects = {}
+            project = Project.from_widgets_info("Project", widgets_info)
+            project.set_display_order(1, launch_stats.get_order_key("Project", "frecency"))
+
+            reorder = {"sort frame": lambda name: project.sort_display_actions(1),
+                       "move launched action": lambda name: project.move_display_action(1, name)
+                       }[label]
+
+            results.append((f"{action_count} actions, {label}",
+                            measure_launches(project, launch_stats, names, reorder)))
+
+    print_results(f"Reorder a frequent frame after a launch, median of {LAUNCHES} launches",
+                  results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Measures the project model without a display:
+    load, save, switch diff and action name validation.
+Run from the repository root:
+    python benchmarks/project_model.py
+"""
+import json
+import time
+from statistics import median
+
+from bench_utils import prepare_package_import, get_fake_project_info, print_results
+
+prepare_package_import()
+
+from ProjectView.utilities.project_model_utils import Project  # noqa: E402
+
+ACTION_COUNTS = [10, 1000, 100000]
+REPEATS = 7
+
+
+def measure(function):
+    """
+    :param function: Function to measure, called without arguments (func).
+
+    :return: Median duration of a call in milliseconds (float).
+    """
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return median(timings)
+
+
+def main():
+    results = []
+    for action_count in ACTION_COUNTS:
+        project = Project.from_widgets_info("Project A", get_fake_project_info(action_count, "a"))
+        project_data = json.dumps(project.get_settings(), indent=4)
+        # Same actions, only the last one differs, the worst case for a switch diff
+        other_project = Project.from_widgets_info("Project B",
+                                                  get_fake_project_info(action_count, "a"))
+        other_project.actions[3][-1].target = "changed"
+
+        results += [
+            (f"{action_count} actions, load",
+             measure(lambda: Project.from_settings("Project A", json.loads(project_data)))),
+            (f"{action_count} actions, save",
+             measure(lambda: json.dumps(project.get_settings(), indent=4))),
+            (f"{action_count} actions, switch diff",
+             measure(lambda: [project.get_first_changed_position(other_project, frame_index)
+                              for frame_index in (1, 2, 3)])),
+            (f"{action_count} actions, name validation",
+             measure(lambda: project.is_action_name_accepted("New action"))),
+        ]
+
+    print_results(f"Project model, median of {REPEATS} runs", results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Measures build and search times of the quick launch index for 10k actions.
+Does not need a display, run from the repository root:
+    python benchmarks/quick_launch_search.py
+"""
+import time
+from statistics import median
+
+from bench_utils import prepare_package_import, print_results
+
+prepare_package_import()
+
+from ProjectView.utilities.quick_launch_utils import ActionSearchIndex  # noqa: E402
+
+PROJECT_COUNT = 100
+ACTIONS_PER_PROJECT = 100
+QUERIES = ["c", "re", "report", "rprt", "github", "projects/tool 42", "zzzz"]
+REPEATS = 20
+
+
+def get_fake_widgets_info(project_number):
+    """
+    Returns widgets information of a fake project with ACTIONS_PER_PROJECT actions.
+
+    :param project_number: Number of the project (int).
+
+    :return: Names and targets like get_project_widgets_info() returns (list list).
+    """
+    words = ["report", "tool", "github", "docs", "build", "chart", "budget", "mail"]
+    names = [f"{words[i % len(words)]} {project_number} {i}" for i in range(ACTIONS_PER_PROJECT)]
+    third = ACTIONS_PER_PROJECT // 3
+
+    return [names[:third], [f"C:/projects/{name}.exe" for name in names[:third]],
+            names[third:2 * third], [f"C:/projects/{name}" for name in names[third:2 * third]],
+            names[2 * third:], [f"https://example.com/{name}" for name in names[2 * third:]]]
+
+
+def main():
+    index = ActionSearchIndex()
+    start = time.perf_counter()
+    for project_number in range(PROJECT_COUNT):
+        index.set_project(f"Project {project_number}", get_fake_widgets_info(project_number))
+    results = [(f"build {len(index.entries)} actions", (time.perf_counter() - start) * 1000)]
+
+    for query in QUERIES:
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            index.search(query)
+            timings.append((time.perf_counter() - start) * 1000)
+        results.append((f"search '{query}'", median(timings)))
+
+    start = time.perf_counter()
+    index.remove_action("Project 0", 1, "report 0 0")
+    index.add_action("Project 0", 1, "report 0 0", "C:/projects/report 0 0.exe")
+    results.append(("remove and add one action", (time.perf_counter() - start) * 1000))
+
+    print_results("Quick launch index", results)
+
+
+if __name__ == '__main__':
+    main()
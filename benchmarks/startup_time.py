@@ -0,0 +1,110 @@
+"""
+Measures the startup of the real app: time to first paint and
+    the import time of every module imported before it.
+Every run starts a fresh interpreter with -X importtime, the window is
+    closed as soon as it is drawn for the first time.
+Close the app first, a running instance would take over the runs.
+Needs customtkinter and a display, run from the repository root:
+    python benchmarks/startup_time.py
+"""
+import json
+import subprocess
+import sys
+from statistics import median
+
+from bench_utils import REPOSITORY_DIR, print_results
+
+RUNS = 5
+# Number of slowest modules printed
+TOP_MODULES = 15
+# Modules the app would otherwise import itself before the first paint,
+# ones customtkinter imports anyway, like tkinter.filedialog, are not listed
+LAZY_MODULES = [
+    "webbrowser",
+    "sqlite3",
+    "ProjectView.extra_settings_window",
+    "ProjectView.utilities.extra_settings_window_utils",
+    "ProjectView.quick_launch_window",
+]
+
+# Runs in the child interpreter. Replaces the mainloop of the app window
+# with a single update, so the script ends once the first frame is drawn.
+CHILD_SCRIPT = f"""
+import time
+start = time.perf_counter()
+import json
+import os
+import sys
+sys.argv[0] = os.path.join({REPOSITORY_DIR!r}, "ProjectView.pyw")
+sys.path.insert(0, {REPOSITORY_DIR!r})
+
+import customtkinter
+
+def first_paint(app, *args, **kwargs):
+    app.update()
+    first_paint_ms = (time.perf_counter() - start) * 1000
+    print(json.dumps({{"first_paint_ms": first_paint_ms,
+                      "loaded": [module for module in {LAZY_MODULES!r}
+                                 if module in sys.modules]}}))
+    app.destroy()
+    sys.exit(0)
+
+customtkinter.CTk.mainloop = first_paint
+from ProjectView.main import main
+main([])
+"""
+
+
+def run_startup():
+    """
+    Starts the app once in a fresh interpreter.
+
+    :return: Time to first paint in milliseconds, lazy modules that were loaded and
+        cumulative import time per module in milliseconds (tuple).
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT],
+                             cwd=REPOSITORY_DIR, capture_output=True, text=True)
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr[-2000:])
+
+    # Import times are written to stderr as 'import time: self | cumulative | name'
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        import_times[name.strip()] = int(cumulative) / 1000
+
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+
+    return result["first_paint_ms"], result["loaded"], import_times
+
+
+def main():
+    first_paints = []
+    import_times = {}
+    loaded = set()
+    for _ in range(RUNS):
+        first_paint_ms, run_loaded, run_import_times = run_startup()
+        first_paints.append(first_paint_ms)
+        loaded.update(run_loaded)
+        for name, milliseconds in run_import_times.items():
+            import_times.setdefault(name, []).append(milliseconds)
+
+    median_import_times = {name: median(times) for name, times in import_times.items()}
+    slowest = sorted(median_import_times.items(), key=lambda item: item[1], reverse=True)
+
+    print_results(f"Startup, median of {RUNS} runs",
+                  [("time to first paint", median(first_paints))])
+    print_results("Slowest imports (cumulative)", slowest[:TOP_MODULES])
+    print_results("ProjectView imports (cumulative)",
+                  [(name, milliseconds) for name, milliseconds in slowest
+                   if name.startswith("ProjectView")])
+
+    if loaded:
+        print(f"Imported before first paint, should be lazy: {', '.join(sorted(loaded))}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Measures how long AppWindow.change_project takes with and without widget pooling.
+Unpooled switches drop the visible rows first, so every row is rebuilt.
+Also reports the layout batches and row placements per switch,
+    a batch is one update_idletasks() call, not a single geometry pass of Tk.
+Needs customtkinter and a display, run from the repository root:
+    python benchmarks/switch_latency.py
+"""
+import time
+from statistics import median
+
+from bench_utils import prepare_package_import, get_fake_project_info, print_results
+
+prepare_package_import()
+
+from ProjectView import app_window  # noqa: E402
+
+ACTION_COUNTS = [20, 150, 2000]
+SWITCHES = 10
+
+
+def build_app():
+    """
+    Creates a hidden AppWindow with its default widgets.
+
+    :return: AppWindow()
+    """
+    app = app_window.AppWindow()
+    app.withdraw()
+    app.projects.project_names = ["Project A", "Project B"]
+    app.create_frames()
+    app.create_settings_widgets()
+    app.create_basic_widgets()
+
+    return app
+
+
+def drop_action_rows(app):
+    """
+    Returns all visible rows to their pools, destroying them if pooling is off.
+
+    :param app: AppWindow to drop the rows of (obj).
+    """
+    for frame_index, action_rows in app.action_rows.items():
+        while action_rows:
+            action_row = action_rows.pop()
+            app.detach_action_row(action_row)
+            app.widget_pools[frame_index].release(remove_button=action_row[0],
+                                                  action_button=action_row[1])
+
+
+def measure_switches(app, action_count, pooled):
+    """
+    Switches back and forth between two fake projects and
+        returns the median switch time and the most layout batches and
+        row placements counted for a single switch.
+
+    :param app: AppWindow to switch projects on (obj).
+    :param action_count: Number of actions in each project (int).
+    :param pooled: Recycles widgets if True (bool).
+
+    :return: Median switch time in milliseconds, layout batches and placements (tuple).
+    """
+    projects = {
+        "Project A": get_fake_project_info(action_count, "a"),
+        "Project B": get_fake_project_info(action_count, "b"),
+    }
+    app.project_prefetcher.load_project = lambda project_name: projects[project_name]
+    app.project_prefetcher.cache.clear()
+
+    for pool in app.widget_pools.values():
+        pool.clear()
+        pool.enabled = pooled
+
+    # Warm up, fills the pools when pooled
+    app.change_project("Project A")
+    app.update_idletasks()
+
+    timings = []
+    batches = 0
+    placements = 0
+    for i in range(SWITCHES):
+        start = time.perf_counter()
+        if not pooled:
+            drop_action_rows(app)
+        app.change_project("Project B" if i % 2 == 0 else "Project A")
+        app.update_idletasks()
+        timings.append((time.perf_counter() - start) * 1000)
+
+        switch_counts = app.layout_counter.last_batches["project_switched"]
+        batches = max(batches, switch_counts["batches"])
+        placements = max(placements, switch_counts["placements"])
+
+    return median(timings), batches, placements
+
+
+def main():
+    app = build_app()
+    results = []
+    layout_results = []
+    for action_count in ACTION_COUNTS:
+        for pooled in (False, True):
+            label = f"{action_count} actions, {'pooled' if pooled else 'unpooled'}"
+            switch_time, batches, placements = measure_switches(app, action_count, pooled)
+            results.append((label, switch_time))
+            layout_results.append(f"  {label:<28}{batches:>4} batches"
+                                  f"{placements:>6} placements")
+    app.destroy()
+
+    print_results("Median project switch time", results)
+    print("Layout work per switch")
+    print("\n".join(layout_results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Tests for the change journal of json projects.
+Run from the repository root:
+    python -m unittest discover tests
+"""
+import os
+import tempfile
+import unittest
+
+from ProjectView.utilities.journal_utils import append_journal, read_journal
+from ProjectView.utilities.storage_utils import JsonProjectStorage
+
+
+def get_operation(category, name):
+    """
+    :param category: 'application', 'directory' or 'website' (str).
+    :param name: Name and target of the new action (str).
+
+    :return: Operation adding an action (dict).
+    """
+    return {"op": "add", "category": category, "name": name, "target": name, "position": None}
+
+
+class AppendJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.folder.name, "Project.journal")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_append_after_torn_line(self):
+        # Crash while appending leaves half a line
+        append_journal(self.journal_path, [get_operation("application", "first")])
+        with open(self.journal_path, "ab") as journal_file:
+            journal_file.write(b'{"op": "add", "categ')
+
+        append_journal(self.journal_path, [get_operation("website", "second")])
+
+        self.assertEqual([operation["name"] for operation in read_journal(self.journal_path)],
+                         ["first", "second"])
+
+    def test_reload_after_torn_line(self):
+        storage = JsonProjectStorage(projects_folder=self.folder.name)
+        storage.save_project("Project", {f"{category}_{key}": []
+                                         for category in ("application", "directory", "website")
+                                         for key in ("names", "targets")})
+        storage.apply_operations("Project", [get_operation("application", "first")])
+        with open(storage.get_journal_path("Project"), "ab") as journal_file:
+            journal_file.write(b'{"op": "add"')
+
+        storage.apply_operations("Project", [get_operation("website", "second")])
+
+        project_settings = storage.load_project("Project")
+        self.assertEqual(project_settings["application_names"], ["first"])
+        self.assertEqual(project_settings["website_names"], ["second"])
+
+    def test_append_to_missing_project(self):
+        storage = JsonProjectStorage(projects_folder=self.folder.name)
+
+        with self.assertRaises(FileNotFoundError):
+            storage.apply_operations("Missing", [get_operation("application", "first")])
+        self.assertFalse(os.path.exists(storage.get_journal_path("Missing")))
+
+
+if __name__ == '__main__':
+    unittest.main()